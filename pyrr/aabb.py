@@ -15,14 +15,17 @@ It is up to the user to either:
 
     * recalculate the AABB.
     * use an AAMBB instead.
+    * transform the AABB, which creates an AABB that encloses the
+      rotated AABB.
 
-TODO: add transform( matrix )
+Stacks of AABBs with shape (N,2,3) are supported by transform.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import numpy
 
-from pyrr.utils import all_parameters_as_numpy_arrays, parameters_as_numpy_arrays
+from pyrr.utils import all_parameters_as_numpy_arrays, batchable, parameters_as_numpy_arrays
+from pyrr.utils import reduce_segment_ids, segment_ids_from_offsets
 
 
 class index:
@@ -58,6 +61,45 @@ def create_from_points( points ):
             ]
         )
 
+def create_from_segments( points, offsets ):
+    """Creates an AABB for each object in a set of points.
+
+    The points of every object are concatenated into one array.
+    The offsets are the index of the first point of each object,
+    as used by numpy.minimum.reduceat.
+
+    :param numpy.array points: The points of every object with shape (M,3).
+    :param numpy.array offsets: The index of the first point of each
+        object with shape (K,).
+    :raise ValueError: raised if an object has no points.
+    :rtype: numpy.array
+    :return: The AABBs with shape (K,2,3).
+    """
+    points = numpy.asarray( points )
+    offsets, _ = segment_ids_from_offsets( offsets, len( points ) )
+    return numpy.stack(
+        [
+            numpy.minimum.reduceat( points, offsets, axis = 0 ),
+            numpy.maximum.reduceat( points, offsets, axis = 0 )
+            ],
+        axis = 1
+        )
+
+def create_from_segment_ids( points, segment_ids, count = None ):
+    """Creates an AABB for each object in a set of points.
+
+    The points may be in any order.
+    Objects with no points have NaN AABBs.
+
+    :param numpy.array points: The points of every object with shape (M,3).
+    :param numpy.array segment_ids: The object of each point with shape (M,).
+    :param int count: The number of objects. Defaults to the largest
+        id plus 1.
+    :rtype: numpy.array
+    :return: The AABBs with shape (K,2,3).
+    """
+    return reduce_segment_ids( create_from_segments, points, segment_ids, count )
+
 @all_parameters_as_numpy_arrays
 def create_from_aabbs( aabbs ):
     """Creates an AABB from a list of existing AABBs.
@@ -100,6 +142,38 @@ def add_aabbs( aabb, aabbs ):
 
     return add_points( aabb, points )
 
+@batchable( (2, 2), 'pass (N,2,3) AABBs and / or (N,4,4) matrices' )
+def transform( aabb, matrix ):
+    """Transforms AABBs by matrices.
+
+    The result encloses the transformed AABB, which is larger than
+    the AABB of the transformed contents when the matrix rotates.
+    Rather than transforming the 8 corners, the half size is
+    transformed by the absolute values of the matrix.
+
+    Supports stacks of AABBs with shape (N,2,3) and / or matrices
+    with shape (N,4,4), which are broadcast against each other.
+
+    :param numpy.array aabb: The AABB, or stack of AABBs.
+    :param numpy.array matrix: The matrix44, or stack of matrices, to
+        transform by. The matrix must be affine.
+    :rtype: numpy.array
+    :return: The transformed AABB, or stack of AABBs.
+
+    .. seealso:: Arvo, "Transforming Axis-Aligned Bounding Boxes",
+        Graphics Gems.
+    """
+    aabb = numpy.asarray( aabb )
+    matrix = numpy.asarray( matrix )
+    rotation = matrix[ ..., 0:3, 0:3 ]
+    centre = (aabb[ ..., 0, : ] + aabb[ ..., 1, : ]) * 0.5
+    extent = (aabb[ ..., 1, : ] - aabb[ ..., 0, : ]) * 0.5
+
+    # matrices are applied to row vectors
+    centre = numpy.matmul( centre[ ..., numpy.newaxis, : ], rotation )[ ..., 0, : ] + matrix[ ..., 3, 0:3 ]
+    extent = numpy.matmul( extent[ ..., numpy.newaxis, : ], numpy.absolute( rotation ) )[ ..., 0, : ]
+    return numpy.stack( [ centre - extent, centre + extent ], axis = -2 )
+
 @all_parameters_as_numpy_arrays
 def centre_point( aabb ):
     """Returns the centre point of the AABB.
@@ -116,47 +190,25 @@ def maximum( aabb ):
     """
     return aabb[ 1 ]
 
-@all_parameters_as_numpy_arrays
+@batchable( (2, 1), 'pass (N,3) points and / or (N,2,3) AABBs' )
 def clamp_points( aabb, points ):
-    """Takes a list of points and modifies them to
-    fit within the AABB.
-    """
-    # we need to compare the points against our AABB.
-    # minimum( point, AABB maximum )
-    # maximum( point, AABB minimum )
-
-    # clamp the point by getting the maximum of the
-    # point and the AABB's minimum
-    # then the minimum of the point and the AABB's
-    # maximum
-    if points.ndim == 1:
-        # only a single point
-        # just take the existing AABB for comparisson
-        aabb_min = aabb[ 0 ]
-        aabb_max = aabb[ 1 ]
-    else:
-        # there are multiple points
-        # so we'll repeat our AABB values for easy
-        # comparison
-
-        # use a stride trick to repeat the AABB arrays
-        # without actually allocating any data
-        # http://stackoverflow.com/questions/5564098/repeat-numpy-array-without-replicating-data
-        aabb_min = np.lib.stride_tricks.as_strided(
-            aabb[ 0 ],
-            (points.shape[ 0 ], aabb[ 0 ].size),
-            (0, aabb[ 0 ].itemsize)
-            )
-        aabb_max = np.lib.stride_tricks.as_strided(
-            aabb[ 1 ],
-            (points.shape[ 0 ], aabb[ 1 ].size),
-            (0, aabb[ 1 ].itemsize)
-            )
+    """Clamps points to lie within the AABB.
 
-    return numpy.array(
-        [
-            numpy.maximum( points, aabb_min ),
-            numpy.minimum( points, aabb_max )
-            ]
-        )
+    Points inside the AABB are unchanged, points outside are moved
+    to the closest point on the surface of the AABB.
+
+    Points with shape (N,3) and AABBs with shape (M,2,3) are broadcast
+    against each other. To clamp every point to every AABB, add an
+    axis to the points::
+
+        >>> aabb.clamp_points( aabbs, points[ :, numpy.newaxis ] )
+
+    :param numpy.array aabb: The AABB, or an array of AABBs.
+    :param numpy.array points: A point, or an array of points.
+    :rtype: numpy.array
+    :return: The clamped points.
+    """
+    aabb = numpy.asarray( aabb )
+    points = numpy.asarray( points )
+    return numpy.minimum( numpy.maximum( points, aabb[ ..., 0, : ] ), aabb[ ..., 1, : ] )
 
@@ -17,7 +17,6 @@ the vector length of any points set within it, the user
 should be careful to avoid adding the AAMBB to itself
 or the AAMBB will continue to grow.
 
-TODO: add transform( matrix )
 TODO: add point_within_aabb
 TODO: use point_within_aabb for unit tests
 """
@@ -26,7 +25,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import numpy
 
 from pyrr import aabb, vector
-from pyrr.utils import all_parameters_as_numpy_arrays, parameters_as_numpy_arrays
+from pyrr.utils import all_parameters_as_numpy_arrays, batchable, parameters_as_numpy_arrays
+from pyrr.utils import reduce_segment_ids, segment_ids_from_offsets
 
 
 class index:
@@ -75,6 +75,44 @@ def create_from_points( points ):
             ]
         )
 
+def create_from_segments( points, offsets ):
+    """Creates an AAMBB for each object in a set of points.
+
+    The points of every object are concatenated into one array.
+    The offsets are the index of the first point of each object,
+    as used by numpy.maximum.reduceat.
+
+    :param numpy.array points: The points of every object with shape (M,3).
+    :param numpy.array offsets: The index of the first point of each
+        object with shape (K,).
+    :raise ValueError: raised if an object has no points.
+    :rtype: numpy.array
+    :return: The AAMBBs with shape (K,2,3).
+    """
+    points = numpy.asarray( points )
+    offsets, _ = segment_ids_from_offsets( offsets, len( points ) )
+
+    # the maximum extent of each object as a vector
+    vec = numpy.maximum.reduceat( numpy.absolute( points ), offsets, axis = 0 )
+    length = numpy.sqrt( numpy.sum( vec * vec, axis = -1 ) )
+    extent = numpy.repeat( length[ :, numpy.newaxis ], 3, axis = -1 )
+    return numpy.stack( [ -extent, extent ], axis = 1 )
+
+def create_from_segment_ids( points, segment_ids, count = None ):
+    """Creates an AAMBB for each object in a set of points.
+
+    The points may be in any order.
+    Objects with no points have NaN AAMBBs.
+
+    :param numpy.array points: The points of every object with shape (M,3).
+    :param numpy.array segment_ids: The object of each point with shape (M,).
+    :param int count: The number of objects. Defaults to the largest
+        id plus 1.
+    :rtype: numpy.array
+    :return: The AAMBBs with shape (K,2,3).
+    """
+    return reduce_segment_ids( create_from_segments, points, segment_ids, count )
+
 @all_parameters_as_numpy_arrays
 def create_from_aabbs( bbs ):
     """Creates an AAMBB from a list of existing AABBs.
@@ -136,6 +174,36 @@ def add_aabbs( bb, bbs ):
     # use the add_points
     return add_points( bb, points )
 
+@batchable( (2, 2), 'pass (N,2,3) AAMBBs and / or (N,4,4) matrices' )
+def transform( bb, matrix ):
+    """Transforms AAMBBs by matrices.
+
+    The result still allows the contents to rotate freely.
+    Rotation does not change the size of an AAMBB, so the AAMBB is
+    moved by the matrix and scaled by the largest amount the matrix
+    scales any direction.
+
+    Supports stacks of AAMBBs with shape (N,2,3) and / or matrices
+    with shape (N,4,4), which are broadcast against each other.
+
+    :param numpy.array bb: The AAMBB, or stack of AAMBBs.
+    :param numpy.array matrix: The matrix44, or stack of matrices, to
+        transform by. The matrix must be affine.
+    :rtype: numpy.array
+    :return: The transformed AAMBB, or stack of AAMBBs.
+    """
+    bb = numpy.asarray( bb )
+    matrix = numpy.asarray( matrix )
+    rotation = matrix[ ..., 0:3, 0:3 ]
+    centre = (bb[ ..., 0, : ] + bb[ ..., 1, : ]) * 0.5
+    length = numpy.amax( (bb[ ..., 1, : ] - bb[ ..., 0, : ]) * 0.5, axis = -1 )
+
+    # the largest distance any unit vector is scaled by
+    scale = numpy.linalg.norm( rotation, ord = 2, axis = (-2, -1) )
+    centre = numpy.matmul( centre[ ..., numpy.newaxis, : ], rotation )[ ..., 0, : ] + matrix[ ..., 3, 0:3 ]
+    extent = (length * scale)[ ..., numpy.newaxis ]
+    return numpy.stack( [ centre - extent, centre + extent ], axis = -2 )
+
 def centre_point( bb ):
     """Returns the centre point of the AABB.
     This should always be [0.0, 0.0, 0.0]
@@ -152,10 +220,12 @@ def maximum( bb ):
     """
     return aabb.maximum( bb )
 
+@batchable( (2, 1), 'pass (N,3) points and / or (N,2,3) AAMBBs' )
 def clamp_points( bb, points ):
-    """Takes a list of points and modifies them to
-    fit within the AABB.
+    """Clamps points to lie within the AAMBB.
+
+    .. seealso:: aabb.clamp_points
     """
     # use the same function as present in AABB
-    aabb.clamp_points( bb, points )
+    return aabb.clamp_points( bb, points )
 
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""Provides keyframe animation tracks which sample many channels at once.
+
+A track stores the keyframes of many channels, such as the rotation of
+every bone of a skeleton, in a single set of packed arrays.
+Each channel may have a different number of keyframes, but the
+values of every channel in a track are of the same size and are
+interpolated in the same way.
+
+All channels are sampled with a single set of array operations::
+
+    rotations = animation.Track(
+        [ bone1_times, bone2_times ],
+        [ bone1_quaternions, bone2_quaternions ],
+        animation.interpolation.slerp
+        )
+    values = rotations.sample( 1.5 )
+
+Tracks remember the keyframe each channel was last sampled at.
+When time moves forward in small steps, as it does during playback,
+the keyframes are found without searching.
+
+Times before the first or after the last keyframe of a channel
+return the value of the first or last keyframe.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import numpy
+
+from pyrr import quaternion, vector
+
+
+class interpolation:
+    #: Use the value of the previous keyframe.
+    step = 'step'
+
+    #: Linearly interpolate between keyframes.
+    #: Used for translation and scale tracks.
+    linear = 'linear'
+
+    #: Spherically interpolate between quaternion keyframes.
+    #: Used for rotation tracks.
+    slerp = 'slerp'
+
+
+class Track( object ):
+    """A set of animation channels stored in packed arrays.
+
+    :param list times: A list with the keyframe times of each channel.
+        The times of a channel must be in ascending order.
+    :param list values: A list with the keyframe values of each channel.
+        Each item must be an array of shape (K,D), where K is the number
+        of keyframes of the channel.
+    :param str method: A value from the interpolation class.
+    :raise ValueError: raised if a channel has no keyframes, or its
+        times and values are of differing lengths.
+    """
+
+    def __init__( self, times, values, method = interpolation.linear ):
+        if method not in ( interpolation.step, interpolation.linear, interpolation.slerp ):
+            raise ValueError( "Unknown interpolation '%s'" % method )
+        if len( times ) != len( values ):
+            raise ValueError( "Times and values must have the same number of channels" )
+
+        times = [ numpy.asarray( channel_times, dtype = 'float' ) for channel_times in times ]
+        values = [ numpy.asarray( channel_values, dtype = 'float' ) for channel_values in values ]
+        counts = numpy.array( [ len( channel_times ) for channel_times in times ], dtype = 'intp' )
+        if numpy.any( counts == 0 ):
+            raise ValueError( "Channels must have at least one keyframe" )
+        if any( len( t ) != len( v ) for t, v in zip( times, values ) ):
+            raise ValueError( "Channels must have the same number of times and values" )
+
+        self.method = method
+        self.times = numpy.concatenate( times )
+        self.values = numpy.concatenate( values )
+
+        #: The index of the first keyframe of each channel.
+        self.first = numpy.concatenate( [ [ 0 ], numpy.cumsum( counts )[ :-1 ] ] ).astype( 'intp' )
+
+        #: The index of the last keyframe of each channel.
+        self.last = self.first + counts - 1
+
+        # searching all channels at once requires a single sorted array
+        # offset the times of each channel so they do not overlap
+        self.start = self.times.min()
+        self.stride = (self.times.max() - self.start) * 2.0 + 1.0
+        channels = numpy.repeat( numpy.arange( len( counts ) ), counts )
+        self.keys = (channels * self.stride) + (self.times - self.start)
+
+        #: The keyframe each channel was last sampled at.
+        self.cursors = self.first.copy()
+
+    def __len__( self ):
+        return len( self.first )
+
+    def sample( self, time, out = None ):
+        """Samples every channel of the track, updating the cursors.
+
+        .. seealso:: animation.sample
+        """
+        return sample( self, time, out = out, cursors = self.cursors )
+
+    def seek( self, time ):
+        """Moves the cursors of every channel to the specified time.
+        """
+        self.cursors[:] = find_keyframes( self, time )
+
+
+def _clamp_time( track, time ):
+    time = numpy.broadcast_to( numpy.asarray( time, dtype = 'float' ), track.first.shape )
+    return numpy.clip( time, track.times[ track.first ], track.times[ track.last ] )
+
+def _segment_end( track, keyframes ):
+    # channels with a single keyframe use it as both ends
+    return numpy.minimum( keyframes + 1, track.last )
+
+def find_keyframes( track, time, cursors = None ):
+    """Finds the keyframe each channel is at for the specified time.
+
+    The keyframe is the last keyframe with a time less than or equal
+    to the specified time, but never the last keyframe of a channel
+    with more than one keyframe. This is the start of the pair
+    of keyframes that are interpolated.
+
+    If cursors are provided, each channel first checks the keyframe
+    at its cursor and the keyframe after it.
+    Only channels which have moved further are searched for.
+
+    :param Track track: The track to search.
+    :param time: The time to search for, or an array of times with
+        one time for each channel.
+    :param numpy.array cursors: An optional array of keyframe indices,
+        as returned by a previous call to this function.
+    :rtype: numpy.array
+    :return: The index of the keyframe of each channel.
+    """
+    time = _clamp_time( track, time )
+
+    if cursors is not None:
+        keyframes = numpy.array( cursors, dtype = 'intp' )
+
+        def contains( keyframes ):
+            end = _segment_end( track, keyframes )
+            return (track.times[ keyframes ] <= time) & (time <= track.times[ end ])
+
+        # try the current keyframe, and then the next
+        found = contains( keyframes )
+        advance = ~found & (keyframes + 1 < track.last)
+        keyframes[ advance ] += 1
+        found[ advance ] = contains( keyframes )[ advance ]
+
+        search = ~found
+        if not numpy.any( search ):
+            return keyframes
+    else:
+        keyframes = numpy.empty( len( track.first ), dtype = 'intp' )
+        search = slice( None )
+
+    channels = numpy.arange( len( track.first ) )[ search ]
+    queries = (channels * track.stride) + (time[ search ] - track.start)
+    found = numpy.searchsorted( track.keys, queries, side = 'right' ) - 1
+    keyframes[ search ] = numpy.clip(
+        found,
+        track.first[ search ],
+        numpy.maximum( track.last[ search ] - 1, track.first[ search ] )
+        )
+    return keyframes
+
+def sample( track, time, out = None, cursors = None ):
+    """Samples every channel of a track at the specified time.
+
+    :param Track track: The track to sample.
+    :param time: The time to sample at, or an array of times with
+        one time for each channel.
+    :param numpy.array out: An optional array to store the values in.
+    :param numpy.array cursors: An optional array of keyframe indices
+        which is updated with the keyframe of each channel.
+    :rtype: numpy.array
+    :return: An array of values with one value for each channel.
+    """
+    keyframes = find_keyframes( track, time, cursors )
+    if cursors is not None:
+        cursors[:] = keyframes
+
+    time = _clamp_time( track, time )
+    end = _segment_end( track, keyframes )
+
+    start_time = track.times[ keyframes ]
+    duration = track.times[ end ] - start_time
+    delta = (time - start_time) / numpy.where( duration > 0.0, duration, 1.0 )
+
+    v1 = track.values[ keyframes ]
+    v2 = track.values[ end ]
+
+    if track.method == interpolation.step:
+        result = numpy.where( (delta >= 1.0)[ :, numpy.newaxis ], v2, v1 )
+    elif track.method == interpolation.slerp:
+        result = quaternion.slerp( v1, v2, delta )
+    else:
+        result = vector.interpolate( v1, v2, delta[ :, numpy.newaxis ] )
+
+    if out is None:
+        return result
+    out[:] = result
+    return out
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Provides selectable compute backends for Pyrr's batched kernels.
+
+By default all kernels are implemented using NumPy.
+Kernels may also provide implementations using optional libraries
+which can fuse the many temporary arrays NumPy allocates into a
+single pass over the data.
+
+The following backends are supported:
+
+    * 'numpy': The default. Always available.
+    * 'numexpr': Evaluates expressions using numexpr.
+    * 'numba': Compiles loops using numba.njit.
+
+The backend is selected at runtime::
+
+    >>> pyrr.backend.available_backends()
+    ['numpy', 'numexpr']
+    >>> pyrr.backend.set_backend( 'numexpr' )
+
+The initial backend can also be selected using the PYRR_BACKEND
+environment variable.
+
+A kernel that has no implementation for the selected backend
+will use its NumPy implementation.
+Callers of a kernel do not need to know which backend is in use.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+import importlib
+import os
+from functools import wraps
+
+
+#: The backends which may be selected, in order of preference.
+backends = (
+    'numpy',
+    'numexpr',
+    'numba',
+    )
+
+_backend = 'numpy'
+
+# the modules of the optional backends
+# these are imported when first needed as some, ie numba,
+# are slow to import
+_modules = {}
+
+
+def _import( name ):
+    """Imports and caches the module of an optional backend.
+    """
+    if name not in _modules:
+        _modules[ name ] = importlib.import_module( name )
+    return _modules[ name ]
+
+def is_available( name ):
+    """Checks if a backend can be used.
+
+    :param str name: The name of the backend.
+    :rtype: boolean
+    :return: True if the backend is known and its library is installed.
+    """
+    if name not in backends:
+        return False
+    if name == 'numpy':
+        return True
+    try:
+        _import( name )
+    except ImportError:
+        return False
+    return True
+
+def available_backends():
+    """Returns the backends which can be used.
+
+    :rtype: list
+    :return: A list of backend names.
+    """
+    return [ name for name in backends if is_available( name ) ]
+
+def get_backend():
+    """Returns the name of the current backend.
+
+    :rtype: str
+    """
+    return _backend
+
+def set_backend( name ):
+    """Selects the backend used by all kernels.
+
+    :param str name: The name of the backend.
+    :raise ValueError: raised if the backend is unknown.
+    :raise ImportError: raised if the backend's library is not installed.
+    """
+    global _backend
+    if name not in backends:
+        raise ValueError( "Unknown backend '%s', expected one of %s" % (name, backends) )
+    if name != 'numpy':
+        _import( name )
+    _backend = name
+
+def numexpr():
+    """Returns the numexpr module.
+
+    For use by numexpr kernel implementations.
+    """
+    return _import( 'numexpr' )
+
+def jit( fn ):
+    """Compiles a function using numba.njit.
+
+    Compilation is deferred until the function is first called.
+    For use by numba kernel implementations.
+    """
+    compiled = []
+
+    @wraps( fn )
+    def wrapper( *args ):
+        if not compiled:
+            compiled.append( _import( 'numba' ).njit( fn ) )
+        return compiled[ 0 ]( *args )
+    return wrapper
+
+
+class kernel( object ):
+    """Decorates a NumPy function as a kernel that may be
+    provided by other backends.
+
+    Each implementation must take the same arguments and
+    return the same result as the NumPy implementation.
+    ::
+
+        @backend.kernel
+        def add( a, b ):
+            return a + b
+
+        @add.register( 'numexpr' )
+        def add( a, b ):
+            return backend.numexpr().evaluate( 'a + b' )
+
+    Calling the kernel will call the implementation of the current backend.
+    """
+
+    def __init__( self, fn ):
+        self.implementations = { 'numpy': fn }
+        wraps( fn )( self )
+
+    def register( self, name ):
+        """Registers the implementation of this kernel for a backend.
+        """
+        if name not in backends:
+            raise ValueError( "Unknown backend '%s', expected one of %s" % (name, backends) )
+
+        def decorator( fn ):
+            self.implementations[ name ] = fn
+            return self
+        return decorator
+
+    def implementation( self, name = None ):
+        """Returns the implementation used for a backend.
+
+        Defaults to the current backend.
+        Returns the NumPy implementation if the backend does not
+        implement this kernel.
+        """
+        name = name or _backend
+        return self.implementations.get( name, self.implementations[ 'numpy' ] )
+
+    def __call__( self, *args ):
+        return self.implementation()( *args )
+
+
+if os.environ.get( 'PYRR_BACKEND' ):
+    set_backend( os.environ[ 'PYRR_BACKEND' ] )
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Provides an optional cache for functions which are called repeatedly
+with the same arguments.
+
+Projection matrices and view plane sizes are often recreated every
+frame from the same few values. When caching is enabled, the result
+of each set of arguments is kept in a bounded least recently used cache
+and returned by later calls.
+
+Caching is disabled by default and is enabled globally::
+
+    >>> pyrr.cache.enable( maxsize = 64 )
+    >>> mat = pyrr.matrix44.create_perspective_projection_matrix( 90.0, 1.0, 1.0, 100.0 )
+    >>> pyrr.cache.statistics()
+    {'pyrr.matrix44.create_perspective_projection_matrix': CacheInfo(hits=0, misses=1, maxsize=64, currsize=1)}
+
+While enabled, cached functions return read-only arrays, as the same
+array is returned to every caller. Use numpy.array to create a copy
+which can be modified.
+
+Arguments must be hashable. Calls with unhashable arguments,
+such as numpy arrays, are not cached.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+from functools import lru_cache, wraps
+
+import numpy
+
+
+#: The default number of results kept by each cached function.
+default_maxsize = 128
+
+_enabled = False
+_maxsize = default_maxsize
+
+# the wrappers of each cached function, by name
+_functions = {}
+
+
+def _freeze( result ):
+    if isinstance( result, numpy.ndarray ):
+        result.flags.writeable = False
+    return result
+
+def cacheable( fn ):
+    """Decorates a function so that its results may be cached.
+
+    When caching is disabled the function is called directly.
+
+    The decorated function has cache_info and cache_clear
+    methods, as functions decorated by functools.lru_cache do.
+    """
+    name = '%s.%s' % (fn.__module__, fn.__name__)
+
+    def create():
+        return lru_cache( maxsize = _maxsize )( lambda *args: _freeze( fn( *args ) ) )
+    cached = [ create() ]
+
+    @wraps( fn )
+    def wrapper( *args, **kwargs ):
+        if not _enabled or kwargs:
+            return fn( *args, **kwargs )
+        try:
+            return cached[ 0 ]( *args )
+        except TypeError:
+            # unhashable arguments
+            return fn( *args )
+
+    def reset():
+        cached[ 0 ] = create()
+
+    wrapper.cache_info = lambda: cached[ 0 ].cache_info()
+    wrapper.cache_clear = lambda: cached[ 0 ].cache_clear()
+    wrapper._reset = reset
+    _functions[ name ] = wrapper
+    return wrapper
+
+def is_enabled():
+    """Returns True if caching is enabled.
+
+    :rtype: boolean
+    """
+    return _enabled
+
+def enable( maxsize = None ):
+    """Enables caching for every cacheable function.
+
+    Changing the size of the caches discards any cached results.
+
+    :param int maxsize: The number of results kept by each function.
+        Defaults to cache.default_maxsize.
+    :raise ValueError: raised if maxsize is less than 1.
+    """
+    global _enabled, _maxsize
+    if maxsize is None:
+        maxsize = default_maxsize
+    if maxsize < 1:
+        raise ValueError( "Cache size must be at least 1" )
+
+    if maxsize != _maxsize:
+        _maxsize = maxsize
+        for wrapper in _functions.values():
+            wrapper._reset()
+    _enabled = True
+
+def disable():
+    """Disables caching and discards any cached results.
+    """
+    global _enabled
+    _enabled = False
+    clear()
+
+def clear():
+    """Discards the cached results and statistics of every function.
+    """
+    for wrapper in _functions.values():
+        wrapper.cache_clear()
+
+def statistics():
+    """Returns the hit and miss statistics of every cacheable function.
+
+    :rtype: dict
+    :return: A dictionary of function names to the functools
+        CacheInfo tuple of each function.
+    """
+    return dict(
+        (name, wrapper.cache_info())
+        for name, wrapper in _functions.items()
+        )
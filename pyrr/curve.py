@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""Provides cubic spline curves with constant speed sampling.
+
+A curve is made of cubic segments. Each segment is stored as the
+coefficients of a cubic polynomial with shape (4,D), where D is the
+size of the points. A curve with S segments is an array of shape (S,4,D).
+
+Curves are evaluated at a parameter u, where the integer part of u
+selects the segment and the fractional part is the position within
+the segment. u ranges from 0.0 to S.
+
+The following kinds of curve are supported:
+
+    * Bezier: Each segment is defined by 4 points. Segments share end
+      points, so S segments require 3S + 1 points.
+    * Catmull-Rom: The curve passes through every point.
+      K points create K - 1 segments.
+    * Hermite: The curve passes through every point with the specified
+      tangents. K points and K tangents create K - 1 segments.
+
+The parameter u does not move along a curve at a constant speed.
+An arc length table maps distances along the curve to parameters,
+which allows points to be sampled at regular distances::
+
+    rail = curve.Curve( points, curve.kind.catmull_rom )
+    positions = rail.sample_at_distance( speed * times )
+
+The Curve class rebuilds its coefficients whenever its points or kind
+change, and builds arc length tables when first needed, discarding
+them with the coefficients they were built from.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import numpy
+
+
+class kind:
+    #: Segments of 4 control points sharing end points.
+    bezier = 'bezier'
+
+    #: A curve which passes through every point.
+    catmull_rom = 'catmull_rom'
+
+    #: A curve which passes through every point with specified tangents.
+    hermite = 'hermite'
+
+
+# the basis matrices which convert the geometry of a segment
+# into polynomial coefficients
+_basis = {
+    kind.bezier: numpy.array(
+        [
+            [-1.0, 3.0,-3.0, 1.0 ],
+            [ 3.0,-6.0, 3.0, 0.0 ],
+            [-3.0, 3.0, 0.0, 0.0 ],
+            [ 1.0, 0.0, 0.0, 0.0 ],
+            ]
+        ),
+    kind.catmull_rom: numpy.array(
+        [
+            [-1.0, 3.0,-3.0, 1.0 ],
+            [ 2.0,-5.0, 4.0,-1.0 ],
+            [-1.0, 0.0, 1.0, 0.0 ],
+            [ 0.0, 2.0, 0.0, 0.0 ],
+            ]
+        ) * 0.5,
+    # the geometry of a hermite segment is p0, p1, m0, m1
+    kind.hermite: numpy.array(
+        [
+            [ 2.0,-2.0, 1.0, 1.0 ],
+            [-3.0, 3.0,-2.0,-1.0 ],
+            [ 0.0, 0.0, 1.0, 0.0 ],
+            [ 1.0, 0.0, 0.0, 0.0 ],
+            ]
+        ),
+    }
+
+
+def create_coefficients( points, curve_kind, tangents = None ):
+    """Creates the polynomial coefficients of a curve.
+
+    :param numpy.array points: The control points with shape (K,D).
+    :param str curve_kind: A value from the kind class.
+    :param numpy.array tangents: The tangents at each point with shape (K,D).
+        Only used by Hermite curves.
+    :raise ValueError: raised if there are not enough points for a segment.
+    :rtype: numpy.array
+    :return: The coefficients of the curve with shape (S,4,D).
+    """
+    points = numpy.asarray( points, dtype = 'float' )
+    if curve_kind not in _basis:
+        raise ValueError( "Unknown curve kind '%s'" % curve_kind )
+
+    if curve_kind == kind.bezier:
+        if len( points ) < 4 or (len( points ) - 1) % 3:
+            raise ValueError( "Bezier curves require 3S + 1 points" )
+        # gather the 4 points of each segment
+        index = numpy.arange( 0, len( points ) - 1, 3 )[ :, numpy.newaxis ] + numpy.arange( 4 )
+        geometry = points[ index ]
+    elif curve_kind == kind.catmull_rom:
+        if len( points ) < 2:
+            raise ValueError( "Catmull-Rom curves require at least 2 points" )
+        # repeat the end points so the curve reaches them
+        padded = numpy.concatenate( [ points[ :1 ], points, points[ -1: ] ] )
+        index = numpy.arange( len( points ) - 1 )[ :, numpy.newaxis ] + numpy.arange( 4 )
+        geometry = padded[ index ]
+    else:
+        if tangents is None:
+            raise ValueError( "Hermite curves require tangents" )
+        tangents = numpy.asarray( tangents, dtype = 'float' )
+        if len( points ) < 2 or tangents.shape != points.shape:
+            raise ValueError( "Hermite curves require at least 2 points and a tangent for each point" )
+        geometry = numpy.stack(
+            [ points[ :-1 ], points[ 1: ], tangents[ :-1 ], tangents[ 1: ] ],
+            axis = 1
+            )
+
+    # (4,4) . (S,4,D) -> (S,4,D)
+    return numpy.matmul( _basis[ curve_kind ], geometry )
+
+def _segments( coefficients, u ):
+    u = numpy.asarray( u, dtype = 'float' )
+    segment = numpy.clip( numpy.floor( u ).astype( 'intp' ), 0, len( coefficients ) - 1 )
+    t = numpy.clip( u - segment, 0.0, 1.0 )
+    return segment, t
+
+def evaluate( coefficients, u ):
+    """Evaluates a curve at the specified parameters.
+
+    :param numpy.array coefficients: The coefficients of the curve.
+    :param u: A parameter, or an array of parameters, from 0.0 to S.
+        Values outside this range are clamped.
+    :rtype: numpy.array
+    :return: The points on the curve with shape u.shape + (D,).
+    """
+    segment, t = _segments( coefficients, u )
+    c = coefficients[ segment ]
+    t = t[ ..., numpy.newaxis ]
+    # evaluate using horner's method
+    return ((c[ ..., 0, : ] * t + c[ ..., 1, : ]) * t + c[ ..., 2, : ]) * t + c[ ..., 3, : ]
+
+def derivative( coefficients, u ):
+    """Evaluates the derivative of a curve at the specified parameters.
+
+    The derivative is the tangent of the curve, scaled by the speed
+    the curve moves at with respect to u.
+
+    :param numpy.array coefficients: The coefficients of the curve.
+    :param u: A parameter, or an array of parameters, from 0.0 to S.
+    :rtype: numpy.array
+    :return: The derivatives with shape u.shape + (D,).
+    """
+    segment, t = _segments( coefficients, u )
+    c = coefficients[ segment ]
+    t = t[ ..., numpy.newaxis ]
+    return (3.0 * c[ ..., 0, : ] * t + 2.0 * c[ ..., 1, : ]) * t + c[ ..., 2, : ]
+
+def create_arc_length_table( coefficients, resolution = 16 ):
+    """Creates a table mapping parameters to distances along a curve.
+
+    Each segment is approximated by the specified number of lines.
+    Higher resolutions are more accurate but take longer to create.
+
+    :param numpy.array coefficients: The coefficients of the curve.
+    :param int resolution: The number of lines per segment.
+    :rtype: tuple
+    :return: A tuple of two arrays: the parameters and the distance
+        along the curve at each parameter.
+    """
+    parameters = numpy.linspace( 0.0, len( coefficients ), len( coefficients ) * resolution + 1 )
+    points = evaluate( coefficients, parameters )
+    lengths = numpy.sqrt( numpy.sum( numpy.diff( points, axis = 0 ) ** 2, axis = -1 ) )
+    distances = numpy.concatenate( [ [ 0.0 ], numpy.cumsum( lengths ) ] )
+    return parameters, distances
+
+def parameter_at_distance( table, distance ):
+    """Finds the parameters at distances along a curve.
+
+    :param tuple table: An arc length table.
+    :param distance: A distance, or an array of distances.
+        Values outside the length of the curve are clamped.
+    :rtype: numpy.array
+    :return: The parameters at the specified distances.
+    """
+    parameters, distances = table
+    return numpy.interp( distance, distances, parameters )
+
+
+class Curve( object ):
+    """A spline curve which caches its coefficients and arc length tables.
+
+    The points of the curve are read-only.
+    Assign new points, or a new kind, to the curve to change them,
+    which will cause the cached values to be rebuilt.
+
+    :param numpy.array points: The control points with shape (K,D).
+    :param str curve_kind: A value from the kind class.
+    :param numpy.array tangents: The tangents of a Hermite curve.
+    :param int resolution: The resolution of the arc length table.
+    """
+
+    def __init__( self, points, curve_kind = kind.catmull_rom, tangents = None, resolution = 16 ):
+        self._kind = curve_kind
+        self.resolution = resolution
+        self._tangents = None
+        self.set_points( points, tangents )
+
+    @property
+    def kind( self ):
+        return self._kind
+
+    @kind.setter
+    def kind( self, curve_kind ):
+        previous = self._kind
+        self._kind = curve_kind
+        try:
+            self.set_points( self._points, self._tangents )
+        except ValueError:
+            # the points do not suit the new kind
+            self._kind = previous
+            raise
+
+    @property
+    def points( self ):
+        return self._points
+
+    @points.setter
+    def points( self, points ):
+        self.set_points( points, self._tangents )
+
+    @property
+    def tangents( self ):
+        return self._tangents
+
+    def set_points( self, points, tangents = None ):
+        """Replaces the points, and tangents, of the curve.
+        """
+        points = numpy.array( points, dtype = 'float' )
+        points.flags.writeable = False
+        if tangents is not None:
+            tangents = numpy.array( tangents, dtype = 'float' )
+            tangents.flags.writeable = False
+
+        coefficients = create_coefficients( points, self.kind, tangents )
+
+        self._points = points
+        self._tangents = tangents
+        self._coefficients = coefficients
+        self._tables = {}
+
+    @property
+    def coefficients( self ):
+        return self._coefficients
+
+    @property
+    def segments( self ):
+        return len( self._coefficients )
+
+    def arc_length_table( self, resolution = None ):
+        """Returns the arc length table of the curve, creating it if required.
+        """
+        resolution = resolution or self.resolution
+        if resolution not in self._tables:
+            self._tables[ resolution ] = create_arc_length_table( self._coefficients, resolution )
+        return self._tables[ resolution ]
+
+    @property
+    def length( self ):
+        return self.arc_length_table()[ 1 ][ -1 ]
+
+    def evaluate( self, u ):
+        return evaluate( self._coefficients, u )
+
+    def derivative( self, u ):
+        return derivative( self._coefficients, u )
+
+    def sample_at_distance( self, distance ):
+        """Returns the points at distances along the curve.
+        """
+        return evaluate( self._coefficients, parameter_at_distance( self.arc_length_table(), distance ) )
+
+    def sample_uniform( self, count ):
+        """Returns points spaced evenly along the curve, including both ends.
+        """
+        return self.sample_at_distance( numpy.linspace( 0.0, self.length, count ) )
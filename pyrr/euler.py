@@ -4,9 +4,39 @@
 Eulers represent 3 rotations: Pitch, Roll and Yaw.
 
 Eulers are represented using a numpy.array of shape (3,).
+Stacks of eulers with shape (N,3) are supported by every function.
+
+Pitch is a rotation about the X axis, Roll about the Z axis and
+Yaw about the Y axis.
+
+The rotation order specifies the axis of each angle and the
+sequence the rotations are applied in.
+An order is a string of 3 axes, with one for each value of the euler.
+There are 12 orders: 6 Tait-Bryan orders, which use each axis once,
+and 6 proper Euler orders, which use the first axis twice.
+
+Lower case orders are extrinsic, each rotation is about the fixed world
+axes. Upper case orders are intrinsic, each rotation is about the axes
+produced by the previous rotations. The intrinsic order 'XYZ' is the
+same rotation as the extrinsic order 'zyx' with the values reversed.
+
+The default order is 'xzy', which applies the pitch, then the roll,
+then the yaw, matching the layout of the euler index.
+
+When the second rotation aligns the first and third axes, the
+rotation is in gimbal lock and only the sum, or difference, of the
+first and third angles can be recovered.
+Conversions to eulers store the whole rotation in one angle and set
+the angle of the last rotation about the world axes to 0.0. This is
+the third value of extrinsic orders and the first value of intrinsic
+orders.
 """
+from __future__ import absolute_import, division, print_function, unicode_literals
+
 import numpy
 
+from pyrr.utils import batchable
+
 
 class index:
     #: The index of the pitch value within the euler
@@ -19,35 +49,196 @@ class index:
     yaw = 2
 
 
+class order:
+    #: The default order, which matches the layout of the euler index.
+    default = 'xzy'
+
+    #: The Tait-Bryan orders.
+    tait_bryan = ( 'xyz', 'xzy', 'yxz', 'yzx', 'zxy', 'zyx' )
+
+    #: The proper Euler orders.
+    proper = ( 'xyx', 'xzx', 'yxy', 'yzy', 'zxz', 'zyz' )
+
+
+#: Angles of the second rotation within this distance of the
+#: gimbal lock angle are treated as being in gimbal lock.
+gimbal_lock_tolerance = 1e-7
+
+
+def axes( rotation_order ):
+    """Converts a rotation order into the extrinsic axis indices.
+
+    :param str rotation_order: The rotation order, ie. 'xyz' or 'ZXZ'.
+    :raise ValueError: raised if the order is not one of the 12 orders.
+    :rtype: tuple
+    :return: A tuple of the 3 axis indices in the order they are
+        applied to the fixed world axes, and a boolean which is
+        True if the order is intrinsic.
+    """
+    lower = rotation_order.lower()
+    if lower not in order.tait_bryan + order.proper:
+        raise ValueError( "Unknown rotation order '%s'" % rotation_order )
+    if rotation_order not in ( lower, lower.upper() ):
+        raise ValueError( "Rotation order '%s' mixes intrinsic and extrinsic axes" % rotation_order )
+
+    intrinsic = rotation_order != lower
+    if intrinsic:
+        lower = lower[ ::-1 ]
+    return tuple( 'xyz'.index( axis ) for axis in lower ), intrinsic
+
 def create( pitch, roll, yaw ):
     """Creates an array storing the specified euler angles.
 
     Input values are in radians.
+    Arrays of values will create a stack of eulers with shape (N,3).
 
     :param float pitch: The pitch in radians.
     :param float roll: The roll in radians.
     :param float yaw: The yaw in radians.
     :rtype: numpy.array
     """
-    return numpy.array( [ pitch, roll, yaw ] )
+    return numpy.stack( numpy.broadcast_arrays( pitch, roll, yaw ), axis = -1 ).astype( 'float' )
+
+@batchable( (1,), 'pass (N,4) quaternions' )
+def create_from_quaternion( quat, rotation_order = order.default ):
+    """Creates eulers with the same rotation as a quaternion.
+
+    Accepts a single quaternion or a stack with shape (N,4).
+    Gimbal lock is detected per quaternion without branching.
+
+    :param numpy.array quat: The quaternion, or stack of quaternions.
+    :param str rotation_order: The rotation order of the eulers.
+    :rtype: numpy.array
+    :return: The eulers with values in the range -pi to pi.
+
+    .. seealso:: Bernardes and Viollet, "Quaternion to Euler angles
+        conversion: A direct, general and computationally efficient method".
+    """
+    quat = numpy.asarray( quat, dtype = 'float' )
+    ( i, j, k ), intrinsic = axes( rotation_order )
+
+    tait_bryan = i != k
+    if not tait_bryan:
+        k = 3 - i - j
+    # the parity of the axes, 1 for xyz, yzx and zxy, otherwise -1
+    sign = (i - j) * (j - k) * (k - i) // 2
+
+    w = quat[ ..., 3 ]
+    if tait_bryan:
+        # rotate the quaternion into the equivalent proper euler order
+        a = w - quat[ ..., j ]
+        b = quat[ ..., i ] + quat[ ..., k ] * sign
+        c = quat[ ..., j ] + w
+        d = quat[ ..., k ] * sign - quat[ ..., i ]
+    else:
+        a = w
+        b = quat[ ..., i ]
+        c = quat[ ..., j ]
+        d = quat[ ..., k ] * sign
+
+    second = 2.0 * numpy.arctan2( numpy.hypot( c, d ), numpy.hypot( a, b ) )
+    half_sum = numpy.arctan2( b, a )
+    half_diff = numpy.arctan2( d, c )
+
+    # in gimbal lock only the sum, or difference, of the first and
+    # third angles is known, give the whole rotation to the first
+    locked_zero = numpy.abs( second ) <= gimbal_lock_tolerance
+    locked_pi = numpy.abs( second - numpy.pi ) <= gimbal_lock_tolerance
+    locked = locked_zero | locked_pi
+
+    first = numpy.where(
+        locked_zero,
+        2.0 * half_sum,
+        numpy.where( locked_pi, -2.0 * half_diff, half_sum - half_diff )
+        )
+    third = numpy.where( locked, 0.0, half_sum + half_diff )
+
+    if tait_bryan:
+        third = third * sign
+        second = second - numpy.pi * 0.5
+
+    eulers = numpy.stack( [ first, second, third ], axis = -1 )
+    # wrap to the range -pi to pi
+    eulers = numpy.arctan2( numpy.sin( eulers ), numpy.cos( eulers ) )
+
+    if intrinsic:
+        eulers = eulers[ ..., ::-1 ]
+    return eulers
+
+@batchable( (2,), 'pass (N,3,3) matrices' )
+def create_from_matrix( mat, rotation_order = order.default ):
+    """Creates eulers with the same rotation as a matrix.
+
+    Accepts a matrix33 or matrix44, or stacks of either with
+    shape (N,3,3) or (N,4,4). Only the upper 3x3 matrix is used,
+    which must be a pure rotation.
+    Gimbal lock is detected per matrix without branching.
+
+    :param numpy.array mat: The matrix, or stack of matrices.
+    :param str rotation_order: The rotation order of the eulers.
+    :rtype: numpy.array
+    :return: The eulers with values in the range -pi to pi.
+
+    .. seealso:: Shoemake, "Euler Angle Conversion", Graphics Gems IV.
+    """
+    mat = numpy.asarray( mat, dtype = 'float' )
+    ( i, j, k ), intrinsic = axes( rotation_order )
+
+    tait_bryan = i != k
+    k = 3 - i - j
+    odd = j != (i + 1) % 3
+
+    # matrices are applied to row vectors, the algorithm
+    # expects the transpose
+    def m( row, column ):
+        return mat[ ..., column, row ]
+
+    if tait_bryan:
+        cy = numpy.hypot( m( i, i ), m( j, i ) )
+        locked = cy <= gimbal_lock_tolerance
+        first = numpy.where(
+            locked,
+            numpy.arctan2( -m( j, k ), m( j, j ) ),
+            numpy.arctan2( m( k, j ), m( k, k ) )
+            )
+        second = numpy.arctan2( -m( k, i ), cy )
+        third = numpy.where( locked, 0.0, numpy.arctan2( m( j, i ), m( i, i ) ) )
+    else:
+        sy = numpy.hypot( m( i, j ), m( i, k ) )
+        locked = sy <= gimbal_lock_tolerance
+        first = numpy.where(
+            locked,
+            numpy.arctan2( -m( j, k ), m( j, j ) ),
+            numpy.arctan2( m( i, j ), m( i, k ) )
+            )
+        second = numpy.arctan2( sy, m( i, i ) )
+        third = numpy.where( locked, 0.0, numpy.arctan2( m( j, i ), -m( k, i ) ) )
+
+    eulers = numpy.stack( [ first, second, third ], axis = -1 )
+    if odd:
+        eulers = -eulers
+
+    if intrinsic:
+        eulers = eulers[ ..., ::-1 ]
+    return eulers
 
 def pitch( eulers ):
     """Extracts the pitch value from the euler.
 
     :rtype: float.
     """
-    return eulers[ 0 ]
+    return eulers[ ..., index.pitch ]
 
 def roll( eulers ):
     """Extracts the roll value from the euler.
 
     :rtype: float.
     """
-    return eulers[ 1 ]
+    return eulers[ ..., index.roll ]
 
 def yaw( eulers ):
     """Extracts the yaw value from the euler.
 
     :rtype: float.
     """
-    return eulers[ 2 ]
+    return eulers[ ..., index.yaw ]
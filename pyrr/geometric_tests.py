@@ -6,8 +6,10 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import numpy
 
-from pyrr import ray, rectangle, vector, plane
-from pyrr.utils import all_parameters_as_numpy_arrays, parameters_as_numpy_arrays
+from pyrr import backend, obb, ray, rectangle, vector, plane
+# aabb is the name of the parameter of many tests
+from pyrr import aabb as aabb_module
+from pyrr.utils import all_parameters_as_numpy_arrays, batchable, parameters_as_numpy_arrays
 
 """
 TODO: line_intersect_plane
@@ -17,6 +19,13 @@ TODO: line_intersect_line
 TODO: line_segment_intersect_line_segment
 """
 
+#: Lines or segments with a squared length, or pairs of lines or
+#: segments with a squared sine of the angle between them, less than
+#: this value are treated as degenerate.
+#: Also added to the rotation between OBBs to avoid false separations
+#: when their edges are parallel.
+epsilon = 1e-12
+
 @all_parameters_as_numpy_arrays
 def point_intersect_line( point, line ):
     """Calculates the intersection point of a point and aline.
@@ -60,24 +69,76 @@ def point_intersect_line_segment( point, line ):
         return None
     return point
 
+@batchable( (1, 2), 'use point_inside_rectangle with (N,2) points and / or (N,2,2) rectangles' )
 @all_parameters_as_numpy_arrays
 def point_intersect_rectangle( point, rect ):
     """Calculates the intersection point of a point and a 2D rectangle.
 
     For 3D points, the Z axis will be ignored.
 
+    Supports multiple points with shape (N,2) and / or multiple
+    rectangles with shape (N,2,2), which are broadcast against each other.
+    When multiple points or rectangles are passed, an array of points is
+    returned with NaN values where no intersection occurs.
+
     :return: Returns True if the point is touching
     or within the rectangle.
     """
-    left, right, bottom, top = rectangle.bounds( rect )
-    if \
-        point[ 0 ] < left or \
-        point[ 0 ] > right or \
-        point[ 1 ] < bottom or \
-        point[ 1 ] > top:
+    inside = point_inside_rectangle( point, rect )
+
+    if point.ndim > 1 or rect.ndim > 2:
+        points = numpy.array( numpy.broadcast_to( point, inside.shape + point.shape[ -1: ] ), dtype = 'float' )
+        points[ ~inside ] = numpy.nan
+        return points
+
+    if not inside:
         return None
     return point
 
+@batchable( (1, 2), 'pass (N,2) points and / or (N,2,2) rectangles' )
+def point_inside_rectangle( point, rect ):
+    """Checks if points are touching or within 2D rectangles.
+
+    For 3D points, the Z axis will be ignored.
+    Rectangles with a negative width or height are supported.
+
+    Points with shape (N,2) and rectangles with shape (M,2,2) are
+    broadcast against each other. To test every point against every
+    rectangle, add an axis to the points::
+
+        >>> geometric_tests.point_inside_rectangle( points[ :, numpy.newaxis ], rects )
+
+    :param numpy.array point: A point, or an array of points.
+    :param numpy.array rect: A rectangle, or an array of rectangles.
+    :rtype: boolean, numpy.array
+    :return: True where the point is inside the rectangle.
+    """
+    point = numpy.asarray( point )
+    xmin, xmax, ymin, ymax = rectangle.bounds( numpy.asarray( rect ) )
+    x = point[ ..., 0 ]
+    y = point[ ..., 1 ]
+    return (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+
+@batchable( (2, 2), 'pass (N,2,2) rectangles' )
+def rectangle_intersect_rectangle( rect1, rect2 ):
+    """Checks if 2D rectangles overlap or touch.
+
+    Rectangles with a negative width or height are supported.
+    Stacks of rectangles are broadcast against each other.
+    To test every rectangle against every other rectangle, add an axis
+    to the first stack::
+
+        >>> geometric_tests.rectangle_intersect_rectangle( rects[ :, numpy.newaxis ], rects )
+
+    :param numpy.array rect1: A rectangle, or an array of rectangles.
+    :param numpy.array rect2: A rectangle, or an array of rectangles.
+    :rtype: boolean, numpy.array
+    :return: True where the rectangles overlap.
+    """
+    xmin1, xmax1, ymin1, ymax1 = rectangle.bounds( numpy.asarray( rect1 ) )
+    xmin2, xmax2, ymin2, ymax2 = rectangle.bounds( numpy.asarray( rect2 ) )
+    return (xmin1 <= xmax2) & (xmin2 <= xmax1) & (ymin1 <= ymax2) & (ymin2 <= ymax1)
+
 @parameters_as_numpy_arrays( 'ray', 'plane' )
 def ray_intersect_plane( ray, plane, front_only = False ):
     """Calculates the intersection point of a ray and a plane.
@@ -205,6 +266,90 @@ def point_closest_point_on_line_segment( point, segment ):
     # perform the same calculation as closest_point_on_line
     return segment[ 0 ] + (rl * dot)
 
+def _closest_approach( line1, line2, segments ):
+    line1 = numpy.asarray( line1, dtype = 'float' )
+    line2 = numpy.asarray( line2, dtype = 'float' )
+    d1 = line1[ ..., 1, : ] - line1[ ..., 0, : ]
+    d2 = line2[ ..., 1, : ] - line2[ ..., 0, : ]
+    r = line1[ ..., 0, : ] - line2[ ..., 0, : ]
+
+    a = numpy.sum( d1 * d1, axis = -1 )
+    b = numpy.sum( d1 * d2, axis = -1 )
+    c = numpy.sum( d1 * r, axis = -1 )
+    e = numpy.sum( d2 * d2, axis = -1 )
+    f = numpy.sum( d2 * r, axis = -1 )
+    denom = a * e - b * b
+
+    # avoid dividing by zero, the results of degenerate
+    # and parallel lines are replaced below
+    point1 = a <= epsilon
+    point2 = e <= epsilon
+    parallel = denom <= epsilon * a * e
+    safe_a = numpy.where( point1, 1.0, a )
+    safe_e = numpy.where( point2, 1.0, e )
+    safe_denom = numpy.where( parallel, 1.0, denom )
+
+    # parallel lines have many closest points, use the start of the
+    # first line, or the closest point to the start of the second line
+    # if the first line is a point
+    s = numpy.where( parallel, numpy.where( point2, -c / safe_a, 0.0 ), (b * f - c * e) / safe_denom )
+    if segments:
+        s = numpy.clip( s, 0.0, 1.0 )
+    s = numpy.where( point1, 0.0, s )
+    t = (b * s + f) / safe_e
+
+    if segments:
+        # if the second parameter is outside the segment, clamp it
+        # and find the closest point on the first segment again
+        t = numpy.clip( t, 0.0, 1.0 )
+        s = numpy.where( point1, 0.0, numpy.clip( (b * t - c) / safe_a, 0.0, 1.0 ) )
+    t = numpy.where( point2, 0.0, t )
+
+    p1 = line1[ ..., 0, : ] + d1 * s[ ..., numpy.newaxis ]
+    p2 = line2[ ..., 0, : ] + d2 * t[ ..., numpy.newaxis ]
+    delta = p1 - p2
+    return s, t, p1, p2, numpy.sum( delta * delta, axis = -1 )
+
+@batchable( (2, 2), 'pass (N,2,3) lines' )
+def line_closest_approach_line( line1, line2 ):
+    """Calculates the closest points between two infinite lines.
+
+    Supports stacks of lines with shape (N,2,3), which are broadcast
+    against each other. Use numpy.newaxis to test every pair of lines.
+
+    The parameters are the distance along each line as a multiple
+    of the length from the start to the end of the line.
+    Parallel lines use the start of the first line.
+
+    :param numpy.array line1: The first line, or stack of lines.
+    :param numpy.array line2: The second line, or stack of lines.
+    :rtype: tuple
+    :return: A tuple of the parameter on each line, the closest point
+        on each line, and the squared distance between the points.
+    """
+    return _closest_approach( line1, line2, False )
+
+@batchable( (2, 2), 'pass (N,2,3) line segments' )
+def line_segment_closest_approach_line_segment( segment1, segment2 ):
+    """Calculates the closest points between two line segments.
+
+    Supports stacks of line segments with shape (N,2,3), which are
+    broadcast against each other. Use numpy.newaxis to test every
+    pair of line segments.
+
+    The parameters range from 0.0 at the start of each segment to 1.0
+    at the end. Segments of zero length are treated as points.
+
+    :param numpy.array segment1: The first segment, or stack of segments.
+    :param numpy.array segment2: The second segment, or stack of segments.
+    :rtype: tuple
+    :return: A tuple of the parameter on each segment, the closest
+        point on each segment, and the squared distance between the points.
+
+    .. seealso:: Ericson, "Real-Time Collision Detection", section 5.1.9.
+    """
+    return _closest_approach( segment1, segment2, True )
+
 @all_parameters_as_numpy_arrays
 def vector_parallel_vector( v1, v2 ):
     """Checks if two vectors are parallel.
@@ -259,10 +404,18 @@ def ray_coincident_ray( ray1, ray2 ):
         return True
     return False
 
+@batchable( (2, 2), 'pass (N,2,3) rays or use parallel.ray_intersect_aabb' )
 @all_parameters_as_numpy_arrays
 def ray_intersect_aabb( ray, aabb ):
     """Calculates the intersection point of a ray and an AABB
 
+    Supports multiple rays with shape (N,2,3) and / or multiple
+    AABBs with shape (N,2,3), which are broadcast against each other.
+    When multiple rays or AABBs are passed, an array of points is
+    returned with NaN values where no intersection occurs.
+
+    Rays which start inside an AABB intersect it where they exit.
+
     :param numpy.array ray1: The ray to check.
     :param numpy.array aabb: The Axis-Aligned Bounding Box to check against.
     :rtype: numpy.array
@@ -272,25 +425,22 @@ def ray_intersect_aabb( ray, aabb ):
     """
     http://gamedev.stackexchange.com/questions/18436/most-efficient-aabb-vs-ray-collision-algorithms
     """
-    # this is basically "numpy.divide( 1.0, ray[ 1 ] )"
-    # except we're trying to avoid a divide by zero warning
-    # so where the ray direction value is 0.0, just use infinity
-    # which is what we want anyway
-    direction = ray[ 1 ]
-    dir_fraction = numpy.empty( 3, dtype = ray.dtype )
-    dir_fraction[ direction == 0.0 ] = numpy.inf
-    dir_fraction[ direction != 0.0 ] = numpy.divide( 1.0, direction[ direction != 0.0 ] )
-
-    t1 = (aabb[0,0] - ray[0,0]) * dir_fraction[ 0 ]
-    t2 = (aabb[1,0] - ray[0,0]) * dir_fraction[ 0 ]
-    t3 = (aabb[0,1] - ray[0,1]) * dir_fraction[ 1 ]
-    t4 = (aabb[1,1] - ray[0,1]) * dir_fraction[ 1 ]
-    t5 = (aabb[0,2] - ray[0,2]) * dir_fraction[ 2 ]
-    t6 = (aabb[1,2] - ray[0,2]) * dir_fraction[ 2 ]
+    tmin, tmax = _ray_aabb_slabs(
+        ray[ ..., 0, : ],
+        ray[ ..., 1, : ],
+        aabb[ ..., 0, : ],
+        aabb[ ..., 1, : ]
+        )
 
-
-    tmin = max(min(t1, t2), min(t3, t4), min(t5, t6))
-    tmax = min(max(t1, t2), max(t3, t4), max(t5, t6))
+    if ray.ndim > 2 or aabb.ndim > 2:
+        # if tmax < 0, the whole AABB is behind the ray start
+        # if tmin > tmax, ray doesn't intersect AABB
+        miss = (tmax < 0.0) | (tmin > tmax)
+        # misses are replaced below and may have infinite distances
+        t = numpy.where( miss, 0.0, numpy.where( tmin < 0.0, tmax, tmin ) )
+        points = ray[ ..., 0, : ] + (ray[ ..., 1, : ] * t[ ..., numpy.newaxis ])
+        points[ miss ] = numpy.nan
+        return points
 
     # if tmax < 0, ray (line) is intersecting AABB
     # but the whole AABB is behind the ray start
@@ -302,12 +452,249 @@ def ray_intersect_aabb( ray, aabb ):
         return None
 
     # t is the distance from the ray point
-    # to intersection
-
-    t = abs(tmin)
+    # to intersection, a negative tmin means
+    # the ray starts inside the AABB and
+    # intersects it where it exits
+    t = tmax if tmin < 0.0 else tmin
     point = ray[ 0 ] + (ray[ 1 ] * t)
     return point
 
+@backend.kernel
+def _ray_aabb_slabs( origin, direction, aabb_min, aabb_max ):
+    """Calculates the distances along rays at which they enter
+    and exit AABBs.
+
+    All parameters are arrays of vectors which are broadcast
+    against each other.
+
+    :rtype: tuple
+    :return: The entry (tmin) and exit (tmax) distance of each ray.
+    """
+    with numpy.errstate( divide = 'ignore', invalid = 'ignore' ):
+        t1 = (aabb_min - origin) / direction
+        t2 = (aabb_max - origin) / direction
+
+    # a ray that is parallel to a slab is either always within it,
+    # or never, depending only on the origin. This must be handled
+    # explicitly as an origin on the boundary of the slab divides
+    # 0 by 0, which is NaN
+    parallel = direction == 0.0
+    inside = (origin >= aabb_min) & (origin <= aabb_max)
+    near = numpy.where( parallel, numpy.where( inside, -numpy.inf, numpy.inf ), numpy.minimum( t1, t2 ) )
+    far = numpy.where( parallel, numpy.where( inside, numpy.inf, -numpy.inf ), numpy.maximum( t1, t2 ) )
+    tmin = numpy.amax( near, axis = -1 )
+    tmax = numpy.amin( far, axis = -1 )
+    return tmin, tmax
+
+@_ray_aabb_slabs.register( 'numexpr' )
+def _ray_aabb_slabs( origin, direction, aabb_min, aabb_max ):
+    evaluate = backend.numexpr().evaluate
+    variables = {
+        'origin': origin,
+        'direction': direction,
+        'aabb_min': aabb_min,
+        'aabb_max': aabb_max,
+        'inf': numpy.inf,
+        }
+    variables[ 't1' ] = evaluate( '(aabb_min - origin) / direction', local_dict = variables )
+    variables[ 't2' ] = evaluate( '(aabb_max - origin) / direction', local_dict = variables )
+    variables[ 'inside' ] = evaluate( '(origin >= aabb_min) & (origin <= aabb_max)', local_dict = variables )
+
+    # rays parallel to a slab are handled as in the numpy kernel
+    near = evaluate(
+        'where(direction == 0.0, where(inside, -inf, inf), where(t1 < t2, t1, t2))',
+        local_dict = variables
+        )
+    far = evaluate(
+        'where(direction == 0.0, where(inside, inf, -inf), where(t1 > t2, t1, t2))',
+        local_dict = variables
+        )
+    tmin = numpy.amax( near, axis = -1 )
+    tmax = numpy.amin( far, axis = -1 )
+    return tmin, tmax
+
+@_ray_aabb_slabs.register( 'numba' )
+def _ray_aabb_slabs( origin, direction, aabb_min, aabb_max ):
+    arrays = numpy.broadcast_arrays( origin, direction, aabb_min, aabb_max )
+    shape = arrays[ 0 ].shape[ :-1 ]
+    origin, direction, aabb_min, aabb_max = [
+        numpy.ascontiguousarray( array, dtype = 'float' ).reshape( (-1, 3) )
+        for array in arrays
+        ]
+
+    tmin = numpy.empty( len( origin ) )
+    tmax = numpy.empty( len( origin ) )
+    _ray_aabb_slabs_loop( origin, direction, aabb_min, aabb_max, tmin, tmax )
+    if not shape:
+        # a single ray returns scalars, as with numpy
+        return tmin[ 0 ], tmax[ 0 ]
+    return tmin.reshape( shape ), tmax.reshape( shape )
+
+@backend.jit
+def _ray_aabb_slabs_loop( origin, direction, aabb_min, aabb_max, tmin, tmax ):
+    for i in range( origin.shape[ 0 ] ):
+        near = -numpy.inf
+        far = numpy.inf
+        for axis in range( 3 ):
+            if direction[ i, axis ] == 0.0:
+                # parallel to the slab, only the origin matters
+                if origin[ i, axis ] < aabb_min[ i, axis ] or origin[ i, axis ] > aabb_max[ i, axis ]:
+                    near = numpy.inf
+                    far = -numpy.inf
+                continue
+
+            dir_fraction = 1.0 / direction[ i, axis ]
+            t1 = (aabb_min[ i, axis ] - origin[ i, axis ]) * dir_fraction
+            t2 = (aabb_max[ i, axis ] - origin[ i, axis ]) * dir_fraction
+            near = max( near, min( t1, t2 ) )
+            far = min( far, max( t1, t2 ) )
+        tmin[ i ] = near
+        tmax[ i ] = far
+
+@batchable( (2, 2), 'pass (N,5,3) OBBs' )
+def obb_intersect_obb( obb1, obb2 ):
+    """Checks if OBBs overlap.
+
+    Supports stacks of OBBs with shape (N,5,3), which are broadcast
+    against each other. Use numpy.newaxis to test every pair of OBBs.
+    OBBs which are touching are considered to overlap.
+
+    :param numpy.array obb1: The first OBB, or stack of OBBs.
+    :param numpy.array obb2: The second OBB, or stack of OBBs.
+    :rtype: boolean, numpy.array
+    :return: True if the OBBs overlap.
+        Multiple OBBs will return an array of booleans.
+
+    .. seealso:: Ericson, "Real-Time Collision Detection", section 4.4.1.
+    """
+    obb1 = numpy.asarray( obb1 )
+    obb2 = numpy.asarray( obb2 )
+    a = obb.extents( obb1 )
+    b = obb.extents( obb2 )
+
+    # the rotation and translation of the second OBB
+    # in the space of the first
+    rotation = numpy.matmul( obb.axes( obb1 ), obb.axes( obb2 ).swapaxes( -1, -2 ) )
+    translation = numpy.matmul(
+        obb.axes( obb1 ),
+        (obb.centre( obb2 ) - obb.centre( obb1 ))[ ..., numpy.newaxis ]
+        )[ ..., 0 ]
+    # the epsilon avoids false separations when edges are parallel
+    # and their cross product is close to zero
+    absolute = numpy.absolute( rotation ) + epsilon
+
+    separated = [
+        # the axes of the first OBB
+        numpy.absolute( translation ) > a + numpy.sum( absolute * b[ ..., numpy.newaxis, : ], axis = -1 ),
+        # the axes of the second OBB
+        numpy.absolute( numpy.sum( translation[ ..., numpy.newaxis ] * rotation, axis = -2 ) ) >
+            numpy.sum( absolute * a[ ..., numpy.newaxis ], axis = -2 ) + b,
+        ]
+
+    # the cross products of each pair of axes
+    i, j = numpy.divmod( numpy.arange( 9 ), 3 )
+    i1, i2 = (i + 1) % 3, (i + 2) % 3
+    j1, j2 = (j + 1) % 3, (j + 2) % 3
+    ra = a[ ..., i1 ] * absolute[ ..., i2, j ] + a[ ..., i2 ] * absolute[ ..., i1, j ]
+    rb = b[ ..., j1 ] * absolute[ ..., i, j2 ] + b[ ..., j2 ] * absolute[ ..., i, j1 ]
+    t = numpy.absolute( translation[ ..., i2 ] * rotation[ ..., i1, j ] - translation[ ..., i1 ] * rotation[ ..., i2, j ] )
+    separated.append( t > ra + rb )
+
+    return ~numpy.any( numpy.concatenate( separated, axis = -1 ), axis = -1 )
+
+@batchable( (2, 2), 'pass (N,2,3) rays and / or (N,5,3) OBBs' )
+def ray_intersect_obb( ray, box ):
+    """Calculates the intersection point of a ray and an OBB.
+
+    Supports multiple rays with shape (N,2,3) and / or multiple
+    OBBs with shape (N,5,3), which are broadcast against each other.
+    When multiple rays or OBBs are passed, an array of points is
+    returned with NaN values where no intersection occurs.
+
+    Rays which start inside an OBB intersect it where they exit,
+    as with ray_intersect_aabb.
+
+    :param numpy.array ray: The ray to check.
+    :param numpy.array box: The OBB to check against.
+    :rtype: numpy.array
+    :return: Returns a vector if an intersection occurs.
+        Returns None if no intersection occurs.
+    """
+    ray = numpy.asarray( ray )
+    box = numpy.asarray( box )
+
+    # test the ray against an AABB in the space of the OBB
+    axes = obb.axes( box ).swapaxes( -1, -2 )
+    origin = numpy.matmul( (ray[ ..., 0, : ] - obb.centre( box ))[ ..., numpy.newaxis, : ], axes )[ ..., 0, : ]
+    direction = numpy.matmul( ray[ ..., numpy.newaxis, 1, : ], axes )[ ..., 0, : ]
+    extents = obb.extents( box )
+    tmin, tmax = _ray_aabb_slabs( origin, direction, -extents, extents )
+
+    miss = (tmax < 0.0) | (tmin > tmax)
+    # rays which start inside the OBB intersect where they exit,
+    # misses are replaced below and may have infinite distances
+    t = numpy.where( miss, 0.0, numpy.where( tmin < 0.0, tmax, tmin ) )
+    if ray.ndim > 2 or box.ndim > 2:
+        points = ray[ ..., 0, : ] + (ray[ ..., 1, : ] * t[ ..., numpy.newaxis ])
+        points[ miss ] = numpy.nan
+        return points
+
+    if miss:
+        return None
+    return ray[ 0 ] + (ray[ 1 ] * t)
+
+@batchable( (2, 1), 'pass (N,5,3) OBBs and / or (N,4) planes' )
+def obb_intersect_plane( box, plane ):
+    """Checks if OBBs intersect planes.
+
+    Supports stacks of OBBs with shape (N,5,3) and / or planes with
+    shape (N,4), which are broadcast against each other.
+
+    :param numpy.array box: The OBB, or stack of OBBs.
+    :param numpy.array plane: The plane, or stack of planes.
+    :rtype: boolean, numpy.array
+    :return: True if the OBB crosses, or touches, the plane.
+        Multiple OBBs or planes will return an array of booleans.
+    """
+    box = numpy.asarray( box )
+    plane = numpy.asarray( plane )
+    radius, height = _obb_plane_distances( box, plane )
+    return numpy.absolute( height ) <= radius
+
+@batchable( (2, 2), 'pass (N,5,3) OBBs' )
+def obb_inside_planes( box, planes ):
+    """Checks if OBBs are at least partially inside a convex volume.
+
+    The volume is defined by a set of planes with normals that
+    point into the volume, such as the planes of a view frustum.
+    An OBB is outside of the volume if it is entirely behind
+    any of the planes.
+
+    This is a conservative test, used for culling, in the same
+    way as sphere_inside_planes.
+
+    :param numpy.array box: An OBB, or an array of OBBs with shape (N,5,3).
+    :param numpy.array planes: The planes of the volume with shape (M,4).
+    :rtype: boolean, numpy.array
+    :return: True if the OBB is not outside any of the planes.
+        Multiple OBBs will return an array of booleans.
+    """
+    box = numpy.asarray( box )
+    planes = numpy.asarray( planes )
+    radius, height = _obb_plane_distances( box[ ..., numpy.newaxis, :, : ], planes )
+    return numpy.all( height >= -radius, axis = -1 )
+
+def _obb_plane_distances( box, plane ):
+    # the distance the OBB extends along the plane normal,
+    # and the height of the centre above the plane
+    normal = plane[ ..., 0:3 ]
+    radius = numpy.sum(
+        obb.extents( box ) * numpy.absolute( numpy.sum( obb.axes( box ) * normal[ ..., numpy.newaxis, : ], axis = -1 ) ),
+        axis = -1
+        )
+    height = numpy.sum( obb.centre( box ) * normal, axis = -1 ) + plane[ ..., 3 ]
+    return radius, height
+
 @all_parameters_as_numpy_arrays
 def point_height_above_plane( point, plane ):
     """Calculates how high a point is above a plane.
@@ -352,7 +739,197 @@ def point_closest_point_on_plane( point, plane ):
     qn = numpy.dot( point, n )
     return point + ( n * (d - qn) )
 
-@all_parameters_as_numpy_arrays
+@batchable( (1, 2), 'pass (N,4) spheres or use parallel.sphere_inside_planes' )
+def sphere_inside_planes( sphere, planes ):
+    """Checks if spheres are at least partially inside a convex volume.
+
+    The volume is defined by a set of planes with normals that
+    point into the volume, such as the planes of a view frustum.
+    A sphere is outside of the volume if it is entirely behind
+    any of the planes.
+
+    This is a conservative test, used for culling. Spheres near the
+    corners of the volume may be reported as inside when they are not.
+
+    :param numpy.array sphere: A sphere, or an array of spheres with shape (N,4).
+    :param numpy.array planes: The planes of the volume with shape (M,4).
+    :rtype: boolean, numpy.array
+    :return: True if the sphere is not outside any of the planes.
+        Multiple spheres will return an array of booleans.
+    """
+    sphere = numpy.asarray( sphere )
+    planes = numpy.asarray( planes )
+
+    # the height of each sphere centre above each plane
+    # this is the same as point_height_above_plane
+    heights = numpy.dot( sphere[ ..., 0:3 ], planes[ :, 0:3 ].T ) + planes[ :, 3 ]
+    return numpy.all( heights >= -sphere[ ..., 3:4 ], axis = -1 )
+
+@batchable( (1, 2), 'pass (N,3) points and / or (N,2,3) AABBs' )
+def point_inside_aabb( point, aabb ):
+    """Checks if points are touching or within AABBs.
+
+    Points with shape (N,3) and AABBs with shape (M,2,3) are broadcast
+    against each other. To test every point against every AABB, add
+    an axis to the points::
+
+        >>> geometric_tests.point_inside_aabb( points[ :, numpy.newaxis ], aabbs )
+
+    :param numpy.array point: A point, or an array of points.
+    :param numpy.array aabb: An AABB, or an array of AABBs.
+    :rtype: boolean, numpy.array
+    :return: True where the point is inside the AABB.
+    """
+    point = numpy.asarray( point )
+    aabb = numpy.asarray( aabb )
+    return numpy.all( (point >= aabb[ ..., 0, : ]) & (point <= aabb[ ..., 1, : ]), axis = -1 )
+
+@batchable( (1, 2), 'pass (N,3) points and / or (N,2,3) AABBs' )
+def point_closest_point_on_aabb( point, aabb ):
+    """Calculates the point within AABBs that is closest to points.
+
+    Points inside the AABB are returned unchanged.
+    Broadcasts in the same way as point_inside_aabb.
+
+    .. seealso:: aabb.clamp_points
+
+    :param numpy.array point: A point, or an array of points.
+    :param numpy.array aabb: An AABB, or an array of AABBs.
+    :rtype: numpy.array
+    :return: The closest points.
+    """
+    return aabb_module.clamp_points( aabb, point )
+
+@batchable( (1, 2), 'pass (N,3) points and / or (N,2,3) AABBs' )
+def point_distance_to_aabb( point, aabb ):
+    """Calculates the signed distance from points to the surface of AABBs.
+
+    Broadcasts in the same way as point_inside_aabb.
+
+    :param numpy.array point: A point, or an array of points.
+    :param numpy.array aabb: An AABB, or an array of AABBs.
+    :rtype: float, numpy.array
+    :return: The distance to the surface of the AABB. The value will
+        be negative if the point is inside the AABB.
+    """
+    point = numpy.asarray( point )
+    aabb = numpy.asarray( aabb )
+    centre = (aabb[ ..., 0, : ] + aabb[ ..., 1, : ]) * 0.5
+    extents = (aabb[ ..., 1, : ] - aabb[ ..., 0, : ]) * 0.5
+    # the distance outside of each pair of faces
+    outside = numpy.absolute( point - centre ) - extents
+    distance = numpy.sqrt( numpy.sum( numpy.square( numpy.maximum( outside, 0.0 ) ), axis = -1 ) )
+    # inside, the distance to the closest face
+    return distance + numpy.minimum( numpy.amax( outside, axis = -1 ), 0.0 )
+
+@batchable( (1, 1), 'pass (N,3) points and / or (N,4) spheres' )
+def point_inside_sphere( point, sphere ):
+    """Checks if points are touching or within spheres.
+
+    Points with shape (N,3) and spheres with shape (M,4) are broadcast
+    against each other. To test every point against every sphere, add
+    an axis to the points::
+
+        >>> geometric_tests.point_inside_sphere( points[ :, numpy.newaxis ], spheres )
+
+    :param numpy.array point: A point, or an array of points.
+    :param numpy.array sphere: A sphere, or an array of spheres.
+    :rtype: boolean, numpy.array
+    :return: True where the point is inside the sphere.
+    """
+    point = numpy.asarray( point )
+    sphere = numpy.asarray( sphere )
+    delta = point - sphere[ ..., 0:3 ]
+    return numpy.sum( delta * delta, axis = -1 ) <= sphere[ ..., 3 ] * sphere[ ..., 3 ]
+
+@batchable( (1, 1), 'pass (N,3) points and / or (N,4) spheres' )
+def point_closest_point_on_sphere( point, sphere ):
+    """Calculates the point within spheres that is closest to points.
+
+    Points inside the sphere are returned unchanged.
+    Broadcasts in the same way as point_inside_sphere.
+
+    :param numpy.array point: A point, or an array of points.
+    :param numpy.array sphere: A sphere, or an array of spheres.
+    :rtype: numpy.array
+    :return: The closest points.
+    """
+    point = numpy.asarray( point )
+    sphere = numpy.asarray( sphere )
+    delta = point - sphere[ ..., 0:3 ]
+    length = numpy.sqrt( numpy.sum( delta * delta, axis = -1 ) )
+    # scale the points outside the sphere back to the surface
+    with numpy.errstate( divide = 'ignore', invalid = 'ignore' ):
+        scale = numpy.where( length > sphere[ ..., 3 ], sphere[ ..., 3 ] / length, 1.0 )
+    return sphere[ ..., 0:3 ] + delta * scale[ ..., numpy.newaxis ]
+
+@batchable( (1, 1), 'pass (N,3) points and / or (N,4) spheres' )
+def point_distance_to_sphere( point, sphere ):
+    """Calculates the signed distance from points to the surface of spheres.
+
+    Broadcasts in the same way as point_inside_sphere.
+
+    :param numpy.array point: A point, or an array of points.
+    :param numpy.array sphere: A sphere, or an array of spheres.
+    :rtype: float, numpy.array
+    :return: The distance to the surface of the sphere. The value will
+        be negative if the point is inside the sphere.
+    """
+    point = numpy.asarray( point )
+    sphere = numpy.asarray( sphere )
+    delta = point - sphere[ ..., 0:3 ]
+    return numpy.sqrt( numpy.sum( delta * delta, axis = -1 ) ) - sphere[ ..., 3 ]
+
+def _point_plane_heights( point, planes ):
+    # the height of each point above each plane of the volumes
+    return numpy.sum( point[ ..., numpy.newaxis, : ] * planes[ ..., 0:3 ], axis = -1 ) + planes[ ..., 3 ]
+
+@batchable( (1, 2), 'pass (N,3) points' )
+def point_inside_planes( point, planes ):
+    """Checks if points are touching or within convex volumes.
+
+    The volume is defined by a set of planes with normals that
+    point into the volume, such as the planes of a view frustum.
+
+    Points with shape (N,3) are tested against planes with shape (M,4).
+    Stacks of volumes with shape (K,M,4) are broadcast against the
+    points. To test every point against every volume, add an axis
+    to the points::
+
+        >>> geometric_tests.point_inside_planes( points[ :, numpy.newaxis ], volumes )
+
+    :param numpy.array point: A point, or an array of points.
+    :param numpy.array planes: The planes of the volume with shape (M,4).
+    :rtype: boolean, numpy.array
+    :return: True if the point is not behind any of the planes.
+    """
+    point = numpy.asarray( point )
+    planes = numpy.asarray( planes )
+    return numpy.all( _point_plane_heights( point, planes ) >= 0.0, axis = -1 )
+
+@batchable( (1, 2), 'pass (N,3) points' )
+def point_distance_to_planes( point, planes ):
+    """Calculates the signed distance from points to the surface of
+    convex volumes.
+
+    Broadcasts in the same way as point_inside_planes.
+
+    The distance is exact for points inside the volume. For points
+    outside, it is the largest distance behind any plane, which is
+    exact when the closest point is on a face of the volume and
+    otherwise less than the true distance.
+
+    :param numpy.array point: A point, or an array of points.
+    :param numpy.array planes: The planes of the volume with shape (M,4).
+    :rtype: float, numpy.array
+    :return: The distance to the surface of the volume. The value will
+        be negative if the point is inside the volume.
+    """
+    point = numpy.asarray( point )
+    planes = numpy.asarray( planes )
+    return -numpy.amin( _point_plane_heights( point, planes ), axis = -1 )
+
+@batchable( (1, 1), 'pass (N,4) spheres' )
 def sphere_does_intersect_sphere( s1, s2 ):
     """Checks if two spheres overlap.
 
@@ -363,29 +940,32 @@ def sphere_does_intersect_sphere( s1, s2 ):
     This is faster than circle_penetrate_amount_circle
     as it avoids a square root calculation.
 
+    Stacks of spheres with shape (N,4) are broadcast against each other.
+
     :param numpy.array s1: The first circle.
     :param numpy.array s2: The second circle.
-    :rtype: boolean
+    :rtype: boolean, numpy.array
     :return: Returns True if the circles overlap.
         Otherwise, returns False.
     """
-    delta = s2[ :3 ] - s1[ :3 ]
-    distance_squared = vector.length_squared( delta )
-
-    radii_squared = math.pow( s1[ 3 ] + s2[ 3 ], 2.0 )
+    s1 = numpy.asarray( s1 )
+    s2 = numpy.asarray( s2 )
+    delta = s2[ ..., 0:3 ] - s1[ ..., 0:3 ]
+    distance_squared = numpy.sum( delta * delta, axis = -1 )
 
-    if distance_squared > radii_squared:
-        return False
-    return True
+    radii = s1[ ..., 3 ] + s2[ ..., 3 ]
+    return distance_squared <= radii * radii
 
-@all_parameters_as_numpy_arrays
+@batchable( (1, 1), 'pass (N,4) spheres' )
 def sphere_penetration_sphere( s1, s2 ):
     """Calculates the distance two spheres have penetrated
     into one another.
 
+    Stacks of spheres with shape (N,4) are broadcast against each other.
+
     :param numpy.array s1: The first circle.
     :param numpy.array s2: The second circle.
-    :rtype: float
+    :rtype: float, numpy.array
     :return: The total overlap of the two spheres.
         This is essentially:
         r1 + r2 - distance 
@@ -393,12 +973,205 @@ def sphere_penetration_sphere( s1, s2 ):
         and distance is the length of the vector p2 - p1.
         Will return 0.0 if the circles do not overlap.
     """
-    delta = s2[ :3 ] - s1[ :3 ]
-    distance = vector.length( delta )
+    s1 = numpy.asarray( s1 )
+    s2 = numpy.asarray( s2 )
+    delta = s2[ ..., 0:3 ] - s1[ ..., 0:3 ]
+    distance = numpy.sqrt( numpy.sum( delta * delta, axis = -1 ) )
+
+    combined_radii = s1[ ..., 3 ] + s2[ ..., 3 ]
+    return numpy.maximum( combined_radii - distance, 0.0 )
+
+def _penetration( depth, normal ):
+    # volumes which only touch, or are apart, have no depth or normal
+    hit = depth > 0.0
+    return numpy.where( hit, depth, 0.0 ), numpy.where( hit[ ..., numpy.newaxis ], normal, 0.0 )
+
+def _axis_normal( distances, direction ):
+    # the unit axis with the smallest distance, facing along the direction
+    axis = numpy.argmin( distances, axis = -1 )
+    selected = numpy.arange( 3 ) == axis[ ..., numpy.newaxis ]
+    return numpy.where( selected, numpy.where( direction < 0.0, -1.0, 1.0 ), 0.0 )
+
+@batchable( (2, 2), 'pass (N,2,3) AABBs' )
+def aabb_intersect_aabb( aabb1, aabb2 ):
+    """Checks if AABBs overlap or touch.
+
+    Stacks of AABBs with shape (N,2,3) are broadcast against each other,
+    so pairs of AABBs from a broadphase can be tested as two stacks.
+    To test every AABB against every other AABB, add an axis to the
+    first stack::
+
+        >>> geometric_tests.aabb_intersect_aabb( aabbs[ :, numpy.newaxis ], aabbs )
+
+    :param numpy.array aabb1: An AABB, or an array of AABBs.
+    :param numpy.array aabb2: An AABB, or an array of AABBs.
+    :rtype: boolean, numpy.array
+    :return: True where the AABBs overlap.
+    """
+    aabb1 = numpy.asarray( aabb1 )
+    aabb2 = numpy.asarray( aabb2 )
+    return numpy.all( (aabb1[ ..., 0, : ] <= aabb2[ ..., 1, : ]) & (aabb2[ ..., 0, : ] <= aabb1[ ..., 1, : ]), axis = -1 )
+
+@batchable( (2, 2), 'pass (N,2,3) AABBs' )
+def aabb_penetration_aabb( aabb1, aabb2 ):
+    """Calculates how far AABBs have penetrated into one another.
+
+    The normal is the world axis along which the AABBs overlap the least.
+    Moving the first AABB along the normal by the depth separates them.
+
+    Broadcasts in the same way as aabb_intersect_aabb.
+
+    :param numpy.array aabb1: An AABB, or an array of AABBs.
+    :param numpy.array aabb2: An AABB, or an array of AABBs.
+    :rtype: tuple
+    :return: The depth and the unit normal of the penetration.
+        AABBs which do not overlap have a depth of 0.0 and a zero normal.
+    """
+    aabb1 = numpy.asarray( aabb1 )
+    aabb2 = numpy.asarray( aabb2 )
+    delta = (aabb1[ ..., 0, : ] + aabb1[ ..., 1, : ] - aabb2[ ..., 0, : ] - aabb2[ ..., 1, : ]) * 0.5
+    extents = (aabb1[ ..., 1, : ] - aabb1[ ..., 0, : ] + aabb2[ ..., 1, : ] - aabb2[ ..., 0, : ]) * 0.5
+    # the distance the first AABB must move along each axis to separate them
+    overlap = extents - numpy.absolute( delta )
+    return _penetration( numpy.amin( overlap, axis = -1 ), _axis_normal( overlap, delta ) )
+
+def _aabb_plane_distances( aabb, plane ):
+    # the distance the AABB extends along the plane normal,
+    # and the height of the centre above the plane
+    normal = plane[ ..., 0:3 ]
+    centre = (aabb[ ..., 0, : ] + aabb[ ..., 1, : ]) * 0.5
+    extents = (aabb[ ..., 1, : ] - aabb[ ..., 0, : ]) * 0.5
+    radius = numpy.sum( extents * numpy.absolute( normal ), axis = -1 )
+    height = numpy.sum( centre * normal, axis = -1 ) + plane[ ..., 3 ]
+    return radius, height
+
+@batchable( (2, 1), 'pass (N,2,3) AABBs and / or (N,4) planes' )
+def aabb_intersect_plane( aabb, plane ):
+    """Checks if AABBs intersect planes.
+
+    Supports stacks of AABBs with shape (N,2,3) and / or planes with
+    shape (N,4), which are broadcast against each other.
+
+    :param numpy.array aabb: The AABB, or stack of AABBs.
+    :param numpy.array plane: The plane, or stack of planes.
+    :rtype: boolean, numpy.array
+    :return: True if the AABB crosses, or touches, the plane.
+    """
+    radius, height = _aabb_plane_distances( numpy.asarray( aabb ), numpy.asarray( plane ) )
+    return numpy.absolute( height ) <= radius
+
+@batchable( (2, 1), 'pass (N,2,3) AABBs and / or (N,4) planes' )
+def aabb_penetration_plane( aabb, plane ):
+    """Calculates how far AABBs have penetrated behind planes.
+
+    The space behind the plane is treated as solid, such as the ground.
+    Moving the AABB along the plane normal by the depth moves it in
+    front of the plane.
+
+    Broadcasts in the same way as aabb_intersect_plane.
+
+    :param numpy.array aabb: The AABB, or stack of AABBs.
+    :param numpy.array plane: The plane, or stack of planes.
+    :rtype: tuple
+    :return: The depth and the unit normal of the penetration.
+        AABBs in front of the plane have a depth of 0.0 and a zero normal.
+    """
+    plane = numpy.asarray( plane )
+    radius, height = _aabb_plane_distances( numpy.asarray( aabb ), plane )
+    depth = radius - height
+    return _penetration( depth, numpy.broadcast_to( plane[ ..., 0:3 ], depth.shape + (3,) ) )
+
+@batchable( (1, 2), 'pass (N,4) spheres and / or (N,2,3) AABBs' )
+def sphere_intersect_aabb( sphere, aabb ):
+    """Checks if spheres overlap or touch AABBs.
+
+    Spheres with shape (N,4) and AABBs with shape (N,2,3) are broadcast
+    against each other.
+
+    :param numpy.array sphere: A sphere, or an array of spheres.
+    :param numpy.array aabb: An AABB, or an array of AABBs.
+    :rtype: boolean, numpy.array
+    :return: True where the sphere overlaps the AABB.
+    """
+    sphere = numpy.asarray( sphere )
+    aabb = numpy.asarray( aabb )
+    centre = sphere[ ..., 0:3 ]
+    delta = centre - numpy.minimum( numpy.maximum( centre, aabb[ ..., 0, : ] ), aabb[ ..., 1, : ] )
+    return numpy.sum( delta * delta, axis = -1 ) <= sphere[ ..., 3 ] * sphere[ ..., 3 ]
+
+@batchable( (1, 2), 'pass (N,4) spheres and / or (N,2,3) AABBs' )
+def sphere_penetration_aabb( sphere, aabb ):
+    """Calculates how far spheres have penetrated into AABBs.
+
+    When the centre of the sphere is outside the AABB, the normal points
+    from the closest point of the AABB to the centre. When the centre is
+    inside, the normal is the world axis towards the closest face.
+    Moving the sphere along the normal by the depth separates them.
+
+    Broadcasts in the same way as sphere_intersect_aabb.
+
+    :param numpy.array sphere: A sphere, or an array of spheres.
+    :param numpy.array aabb: An AABB, or an array of AABBs.
+    :rtype: tuple
+    :return: The depth and the unit normal of the penetration.
+        Spheres which do not overlap have a depth of 0.0 and a zero normal.
+    """
+    sphere = numpy.asarray( sphere )
+    aabb = numpy.asarray( aabb )
+    centre = sphere[ ..., 0:3 ]
+    radius = sphere[ ..., 3 ]
+    delta = centre - numpy.minimum( numpy.maximum( centre, aabb[ ..., 0, : ] ), aabb[ ..., 1, : ] )
+    distance = numpy.sqrt( numpy.sum( delta * delta, axis = -1 ) )
+    outside = distance > 0.0
+
+    # the distance to the faces of the AABB from a centre inside it
+    local = centre - (aabb[ ..., 0, : ] + aabb[ ..., 1, : ]) * 0.5
+    faces = (aabb[ ..., 1, : ] - aabb[ ..., 0, : ]) * 0.5 - numpy.absolute( local )
 
-    combined_radii = s1[ 3 ] + s2[ 3 ]
-    penetration = combined_radii - distance
+    with numpy.errstate( divide = 'ignore', invalid = 'ignore' ):
+        normal = numpy.where(
+            outside[ ..., numpy.newaxis ],
+            delta / distance[ ..., numpy.newaxis ],
+            _axis_normal( faces, local )
+            )
+    depth = numpy.where( outside, radius - distance, radius + numpy.amin( faces, axis = -1 ) )
+    return _penetration( depth, normal )
 
-    if penetration <= 0.0:
-        return 0.0
-    return penetration
+@batchable( (1, 1), 'pass (N,4) spheres and / or (N,4) planes' )
+def sphere_intersect_plane( sphere, plane ):
+    """Checks if spheres intersect planes.
+
+    Supports stacks of spheres with shape (N,4) and / or planes with
+    shape (N,4), which are broadcast against each other.
+
+    :param numpy.array sphere: The sphere, or stack of spheres.
+    :param numpy.array plane: The plane, or stack of planes.
+    :rtype: boolean, numpy.array
+    :return: True if the sphere crosses, or touches, the plane.
+    """
+    sphere = numpy.asarray( sphere )
+    plane = numpy.asarray( plane )
+    height = numpy.sum( sphere[ ..., 0:3 ] * plane[ ..., 0:3 ], axis = -1 ) + plane[ ..., 3 ]
+    return numpy.absolute( height ) <= sphere[ ..., 3 ]
+
+@batchable( (1, 1), 'pass (N,4) spheres and / or (N,4) planes' )
+def sphere_penetration_plane( sphere, plane ):
+    """Calculates how far spheres have penetrated behind planes.
+
+    The space behind the plane is treated as solid, such as the ground.
+    Moving the sphere along the plane normal by the depth moves it in
+    front of the plane.
+
+    Broadcasts in the same way as sphere_intersect_plane.
+
+    :param numpy.array sphere: The sphere, or stack of spheres.
+    :param numpy.array plane: The plane, or stack of planes.
+    :rtype: tuple
+    :return: The depth and the unit normal of the penetration.
+        Spheres in front of the plane have a depth of 0.0 and a zero normal.
+    """
+    sphere = numpy.asarray( sphere )
+    plane = numpy.asarray( plane )
+    height = numpy.sum( sphere[ ..., 0:3 ] * plane[ ..., 0:3 ], axis = -1 ) + plane[ ..., 3 ]
+    depth = sphere[ ..., 3 ] - height
+    return _penetration( depth, numpy.broadcast_to( plane[ ..., 0:3 ], depth.shape + (3,) ) )
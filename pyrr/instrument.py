@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""Provides instrumentation of Pyrr's public functions.
+
+When enabled, every public function of the mathematical modules is
+replaced with a wrapper which records the number of calls, the
+cumulative time spent in the function and the shapes and types of
+its arguments.
+Disabling instrumentation restores the original functions, so
+instrumentation has no cost unless it is enabled.
+
+Instrumentation is enabled from code::
+
+    >>> pyrr.instrument.enable()
+    >>> run_frame()
+    >>> print( pyrr.instrument.report() )
+
+Or by setting the PYRR_INSTRUMENT environment variable, which also
+prints the report to stderr when the program exits.
+Setting it to 'callsites' also records call sites.
+
+Only calls made through the module are recorded, ie.
+pyrr.vector.normalise( v ). Functions imported directly into another
+namespace before instrumentation is enabled are not replaced.
+Only module level functions are instrumented, not the methods of
+classes such as rtree.RTree, objects.Vector3 or packing.Atlas.
+The objects module is not instrumented, as the cost of the wrapper
+would exceed the cost of its operations.
+
+Times are cumulative, and include the time spent in any other
+instrumented functions that are called.
+
+Call sites can also be recorded, which finds code that calls a
+function many times with a single item when it could pass a stack
+of items in one call::
+
+    >>> pyrr.instrument.enable( callsites = True )
+    >>> run_frame()
+    >>> print( pyrr.instrument.batchability_report() )
+
+Recording call sites inspects the caller of every call and is
+considerably slower. Only calls from outside of Pyrr's modules
+are recorded.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+import atexit
+import collections
+import importlib
+import inspect
+import os
+import sys
+import threading
+import time
+from functools import wraps
+
+import numpy
+
+from pyrr.utils import batchable_functions
+
+
+#: The modules which are instrumented.
+modules = (
+    'aabb',
+    'aambb',
+    'animation',
+    'curve',
+    'euler',
+    'geometric_tests',
+    'integer',
+    'line',
+    'matrix',
+    'matrix33',
+    'matrix44',
+    'obb',
+    'packing',
+    'parallel',
+    'plane',
+    'quaternion',
+    'ray',
+    'rectangle',
+    'rtree',
+    'sphere',
+    'stream',
+    'trig',
+    'vector',
+    'vector3',
+    'vector4',
+    )
+
+#: Functions which accept stacks of items, by qualified name.
+#: Each value is the number of dimensions of a single item for each
+#: positional argument, and a description of how to batch the calls.
+#: Functions are registered where they are defined, see utils.batchable.
+batched = batchable_functions
+
+# the directory of pyrr's modules
+# calls from these modules are not recorded as call sites
+_package = os.path.dirname( os.path.abspath( __file__ ) )
+
+_callsites = False
+
+# the original function of each instrumented attribute
+# by (module, name)
+_originals = {}
+
+# the statistics of each function by qualified name
+_statistics = {}
+
+_lock = threading.Lock()
+
+
+class Statistics( object ):
+    """The recorded calls of a single function.
+    """
+    __slots__ = ( 'name', 'calls', 'time', 'signatures', 'callsites', 'single_calls' )
+
+    def __init__( self, name ):
+        #: The qualified name of the function, ie. 'pyrr.vector.normalise'.
+        self.name = name
+
+        #: The number of calls.
+        self.calls = 0
+
+        #: The cumulative time, in seconds.
+        self.time = 0.0
+
+        #: The number of calls for each set of argument types.
+        self.signatures = collections.Counter()
+
+        #: The number of calls from each call site, a tuple of
+        #: (filename, line number, function name).
+        #: Only recorded when call sites are enabled.
+        self.callsites = collections.Counter()
+
+        #: The number of calls from each call site which passed a
+        #: single item to a function which accepts stacks of items.
+        self.single_calls = collections.Counter()
+
+
+def _describe( value ):
+    if isinstance( value, numpy.ndarray ):
+        return ( value.dtype.name, value.shape )
+    return ( type( value ).__name__, None )
+
+def _signature( args, kwargs ):
+    signature = tuple( _describe( arg ) for arg in args )
+    if kwargs:
+        signature += tuple( (key,) + _describe( value ) for key, value in sorted( kwargs.items() ) )
+    return signature
+
+def format_signature( signature ):
+    """Formats a signature as recorded by Statistics.signatures.
+
+    :rtype: str
+    :return: A string such as '(float64[3], float64[4,4], float)'.
+    """
+    def format_argument( argument ):
+        if len( argument ) == 3:
+            return '%s = %s' % (argument[ 0 ], format_argument( argument[ 1: ] ))
+        name, shape = argument
+        if shape is None:
+            return name
+        return '%s[%s]' % (name, ','.join( str( size ) for size in shape ))
+    return '(%s)' % ', '.join( format_argument( argument ) for argument in signature )
+
+def _is_single( args, dimensions ):
+    # a call is of a single item if no argument has more
+    # dimensions than a single item of that argument
+    return all(
+        numpy.ndim( arg ) <= ndim
+        for arg, ndim in zip( args, dimensions )
+        )
+
+def _callsite():
+    # the caller of the instrumented wrapper
+    frame = sys._getframe( 2 )
+    filename = frame.f_code.co_filename
+    if os.path.dirname( os.path.abspath( filename ) ) == _package:
+        return None
+    return ( filename, frame.f_lineno, frame.f_code.co_name )
+
+def _wrap( fn, statistics ):
+    dimensions = batched.get( statistics.name, ( None, None ) )[ 0 ]
+
+    @wraps( fn )
+    def wrapper( *args, **kwargs ):
+        start = time.perf_counter()
+        try:
+            return fn( *args, **kwargs )
+        finally:
+            elapsed = time.perf_counter() - start
+            signature = _signature( args, kwargs )
+            callsite = _callsite() if _callsites else None
+            single = callsite is not None and dimensions is not None and _is_single( args, dimensions )
+            with _lock:
+                statistics.calls += 1
+                statistics.time += elapsed
+                statistics.signatures[ signature ] += 1
+                if callsite is not None:
+                    statistics.callsites[ callsite ] += 1
+                    if single:
+                        statistics.single_calls[ callsite ] += 1
+    return wrapper
+
+def _public_functions( module ):
+    for name, value in vars( module ).items():
+        if name.startswith( '_' ) or not inspect.isfunction( value ):
+            continue
+        # ignore functions imported from other modules
+        if value.__module__ != module.__name__:
+            continue
+        yield name, value
+
+def is_enabled():
+    """Returns True if instrumentation is enabled.
+
+    :rtype: boolean
+    """
+    return bool( _originals )
+
+def enable( callsites = False ):
+    """Replaces the public functions of each module with
+    instrumented wrappers.
+
+    Calling enable when instrumentation is already enabled only
+    changes whether call sites are recorded.
+    Previously recorded statistics are kept.
+
+    :param boolean callsites: Record the call site of each call.
+    """
+    global _callsites
+    with _lock:
+        _callsites = callsites
+        if _originals:
+            return
+        for module_name in modules:
+            module = importlib.import_module( 'pyrr.%s' % module_name )
+            for name, fn in list( _public_functions( module ) ):
+                qualified_name = '%s.%s' % (module.__name__, name)
+                statistics = _statistics.setdefault( qualified_name, Statistics( qualified_name ) )
+                _originals[ (module, name) ] = fn
+                setattr( module, name, _wrap( fn, statistics ) )
+
+def disable():
+    """Restores the original functions.
+
+    The recorded statistics are kept until reset is called.
+    """
+    with _lock:
+        for (module, name), fn in _originals.items():
+            setattr( module, name, fn )
+        _originals.clear()
+
+def reset():
+    """Discards all recorded statistics.
+    """
+    with _lock:
+        for statistics in _statistics.values():
+            statistics.calls = 0
+            statistics.time = 0.0
+            statistics.signatures.clear()
+            statistics.callsites.clear()
+            statistics.single_calls.clear()
+
+def statistics():
+    """Returns the statistics of each function which has been called.
+
+    :rtype: dict
+    :return: A dictionary of qualified function names to Statistics.
+    """
+    with _lock:
+        return dict(
+            (name, value)
+            for name, value in _statistics.items()
+            if value.calls
+            )
+
+def report( sort = 'time', limit = None, signatures = 3 ):
+    """Creates a text report of the recorded statistics.
+
+    :param str sort: The column to sort by, 'time' or 'calls'.
+    :param int limit: The maximum number of functions to include.
+    :param int signatures: The number of the most common argument
+        signatures to list for each function.
+    :raise ValueError: raised if sort is not a valid column.
+    :rtype: str
+    :return: The report.
+    """
+    if sort not in ( 'time', 'calls' ):
+        raise ValueError( "Unknown sort column '%s'" % sort )
+
+    values = sorted( statistics().values(), key = lambda value: getattr( value, sort ), reverse = True )
+    if limit is not None:
+        values = values[ :limit ]
+
+    lines = [ '%10s %12s %14s  %s' % ('calls', 'time (s)', 'per call (us)', 'function') ]
+    for value in values:
+        lines.append( '%10d %12.6f %14.3f  %s' % (
+            value.calls,
+            value.time,
+            value.time / value.calls * 1.0e6,
+            value.name
+            ) )
+        for signature, count in value.signatures.most_common( signatures ):
+            lines.append( '%10d %12s %14s    %s' % (count, '', '', format_signature( signature )) )
+    return '\n'.join( lines )
+
+def batchability( threshold = 100 ):
+    """Finds call sites which repeatedly pass single items to
+    functions which accept stacks of items.
+
+    Call sites must be recorded, see enable.
+
+    :param int threshold: The minimum number of single item calls
+        from a call site.
+    :rtype: list
+    :return: A list of tuples of (function name, call site,
+        single item calls, total calls, suggestion), with the
+        most single item calls first.
+    """
+    findings = []
+    for name, value in statistics().items():
+        if name not in batched:
+            continue
+        for callsite, count in value.single_calls.items():
+            if count >= threshold:
+                findings.append( ( name, callsite, count, value.callsites[ callsite ], batched[ name ][ 1 ] ) )
+    return sorted( findings, key = lambda finding: finding[ 2 ], reverse = True )
+
+def batchability_report( threshold = 100, limit = None ):
+    """Creates a text report of the call sites found by batchability.
+
+    :param int threshold: The minimum number of single item calls
+        from a call site.
+    :param int limit: The maximum number of call sites to include.
+    :rtype: str
+    :return: The report.
+    """
+    findings = batchability( threshold )
+    if limit is not None:
+        findings = findings[ :limit ]
+
+    lines = [ '%10s %10s  %s' % ('single', 'calls', 'call site') ]
+    for name, ( filename, line, function ), count, calls, suggestion in findings:
+        lines.append( '%10d %10d  %s:%d in %s' % (count, calls, filename, line, function) )
+        lines.append( '%10s %10s    %s: %s' % ('', '', name, suggestion) )
+    return '\n'.join( lines )
+
+
+def _report_at_exit():
+    print( report(), file = sys.stderr )
+    if _callsites:
+        print( batchability_report(), file = sys.stderr )
+
+
+if os.environ.get( 'PYRR_INSTRUMENT' ):
+    enable( callsites = os.environ[ 'PYRR_INSTRUMENT' ] == 'callsites' )
+    atexit.register( _report_at_exit )
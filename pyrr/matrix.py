@@ -112,3 +112,88 @@ def apply_scale( vectors, scale ):
         ])
     return numpy.dot( vectors, matrix )
 
+def multiply( m1, m2, out = None ):
+    """Multiplies two matrices, or two stacks of matrices, m1 . m2.
+
+    This is essentially a wrapper around numpy.matmul.
+    Unlike numpy.dot, stacks of matrices are multiplied pair by pair
+    rather than each matrix of m1 with every matrix of m2.
+
+    The usual numpy broadcasting rules apply, so a single matrix
+    can be multiplied against a stack of matrices::
+
+        # (N,4,4) . (N,4,4) -> (N,4,4)
+        matrix.multiply( stack1, stack2 )
+
+        # (4,4) . (N,4,4) -> (N,4,4)
+        matrix.multiply( mat, stack )
+
+    :param numpy.array m1: The first matrix, or stack of matrices.
+    :param numpy.array m2: The second matrix, or stack of matrices.
+    :param numpy.array out: An optional array to store the result in.
+        This must not be one of the inputs.
+    :raise ValueError: raised if out shares memory with m1 or m2.
+    :rtype: numpy.array
+    :return: The result of m1 . m2.
+    """
+    m1 = numpy.asarray( m1 )
+    m2 = numpy.asarray( m2 )
+
+    # using an input as the out value will cause corruption
+    if out is not None and \
+        (numpy.may_share_memory( out, m1 ) or numpy.may_share_memory( out, m2 )):
+        raise ValueError( "Output must not be one of the inputs, use assignment instead" )
+
+    if out is None:
+        return numpy.matmul( m1, m2 )
+    return numpy.matmul( m1, m2, out = out )
+
+def multiply_chain( matrices, out = None ):
+    """Multiplies a sequence of matrices together, in order.
+
+    The result is matrices[0] . matrices[1] . ... . matrices[-1].
+
+    If matrices is a single array of shape (K,N,N), the K matrices are
+    reduced pairwise, which requires only log2(K) calls to numpy.matmul.
+
+    If matrices is a list, each item may be a single matrix or a stack
+    of matrices, which are broadcast against each other as in multiply.
+    This can be used to combine per-instance transforms, ie::
+
+        # scale, rotation and translation are each (N,4,4)
+        matrix.multiply_chain( [ scale, rotation, translation ] )
+
+    :param matrices: A list of matrices or an array of shape (K,N,N).
+    :param numpy.array out: An optional array to store the result in.
+        This must not be one of the inputs.
+    :raise ValueError: raised if no matrices are provided.
+    :rtype: numpy.array
+    :return: The product of the matrices.
+    """
+    if isinstance( matrices, numpy.ndarray ):
+        if len( matrices ) == 0:
+            raise ValueError( "At least one matrix must be provided" )
+
+        # reduce neighbouring pairs until a single matrix remains
+        # the order of the matrices is preserved
+        while len( matrices ) > 2:
+            paired = numpy.matmul( matrices[ 0:-1:2 ], matrices[ 1::2 ] )
+            if len( matrices ) % 2:
+                paired = numpy.concatenate( [ paired, matrices[ -1: ] ] )
+            matrices = paired
+        matrices = list( matrices )
+    else:
+        matrices = [ numpy.asarray( m ) for m in matrices ]
+        if len( matrices ) == 0:
+            raise ValueError( "At least one matrix must be provided" )
+
+    if len( matrices ) == 1:
+        if out is None:
+            return matrices[ 0 ].copy()
+        out[...] = matrices[ 0 ]
+        return out
+
+    result = matrices[ 0 ]
+    for m in matrices[ 1:-1 ]:
+        result = numpy.matmul( result, m )
+    return multiply( result, matrices[ -1 ], out = out )
@@ -11,8 +11,8 @@ import math
 
 import numpy
 
-from pyrr import quaternion
-from pyrr.utils import all_parameters_as_numpy_arrays
+from pyrr import backend, euler, matrix, quaternion
+from pyrr.utils import all_parameters_as_numpy_arrays, batchable
 
 def create_identity():
     """Creates a new matrix33 and sets it to
@@ -32,68 +32,39 @@ def create_from_matrix44( mat ):
     """
     return numpy.array( mat[ 0:3, 0:3 ] )
 
-def create_from_eulers( eulers ):
+@batchable( (1,), 'pass (N,3) eulers' )
+def create_from_eulers( eulers, rotation_order = euler.order.default ):
     """Creates a matrix from the specified Euler rotations.
 
+    Supports stacks of eulers with shape (N,3).
+
     :param numpy.array eulers: A set of euler rotations in the format
         specified by the euler modules.
+    :param str rotation_order: The rotation order of the eulers.
     :rtype: numpy.array
     :return: A matrix with shape (3,3) with the euler's rotation.
     """
-    pitchOver2 = eulers[ 0 ] * 0.5
-    rollOver2 = eulers[ 1 ] * 0.5
-    yawOver2 = eulers[ 2 ] * 0.5
-    
-    sinPitch = math.sin( pitchOver2 )
-    cosPitch = math.cos( pitchOver2 )
-    sinRoll = math.sin( rollOver2 )
-    cosRoll = math.cos( rollOver2 )
-    sinYaw = math.sin( yawOver2 )
-    cosYaw = math.cos( yawOver2 )
-    
-    return numpy.array(
-        [
-            # m1
-            [
-                # m11 = cy * cr + sy * sp * sr
-                (cosYaw * cosRoll) + (sinYaw * sinPitch * sinRoll),
-                # m12 = -cy * sr + sy * sp * cr
-                (-cosYaw * sinRoll) + (sinYaw * sinPitch * cosRoll),
-                # m13 = sy * cp
-                sinYaw * cosPitch
-                ],
-            # m2
-            [
-                # m21 = sr * cp
-                sinRoll * cosPitch,
-                # m22 = cr * cp
-                cosRoll * cosPitch,
-                # m23 = -sp
-                -sinPitch
-                ],
-            # m3
-            [
-                # m31 = -sy * cr + cy * sp * sr
-                (-sinYaw * cosRoll) + (cosYaw * sinPitch * sinRoll),
-                # m32 = sr * sy + cy * sp * cr
-                (sinRoll * sinYaw) + (cosYaw * sinPitch * cosRoll),
-                # m33 = cy * cp
-                cosYaw * cosPitch
-                ]
-            ]
-        )
+    return create_from_quaternion( quaternion.create_from_eulers( eulers, rotation_order ) )
 
+@batchable( (1,), 'pass (N,4) quaternions' )
 def create_from_quaternion( quat ):
     """Creates a matrix with the same rotation as a quaternion.
 
+    Supports a stack of quaternions with shape (N,4), which
+    will return a stack of matrices with shape (N,3,3).
+
     :param quat: The quaternion to create the matrix from.
     :rtype: numpy.array
     :return: A matrix with shape (3,3) with the quaternion's rotation.
     """
-    x = quat[ 0 ]
-    y = quat[ 1 ]
-    z = quat[ 2 ]
-    w = quat[ 3 ]
+    return _create_from_quaternion( numpy.asarray( quat, dtype = 'float' ) )
+
+@backend.kernel
+def _create_from_quaternion( quat ):
+    x = quat[ ..., 0 ]
+    y = quat[ ..., 1 ]
+    z = quat[ ..., 2 ]
+    w = quat[ ..., 3 ]
 
     y2 = y**2
     x2 = x**2
@@ -104,39 +75,79 @@ def create_from_quaternion( quat ):
     wx = w * x
     wy = w * y
     wz = w * z
-    
-    return numpy.array(
-        [
-            # m1
-            [
-                # m11 = 1.0 - 2.0 * (q.y * q.y + q.z * q.z)
-                1.0 - 2.0 * (y2 + z2),
-                # m12 = 2.0 * (q.x * q.y + q.w * q.z)
-                2.0 * (xy + wz),
-                # m13 = 2.0 * (q.x * q.z - q.w * q.y)
-                2.0 * (xz - wy)
-                ],
-            # m2
-            [
-                # m21 = 2.0 * (q.x * q.y - q.w * q.z)
-                2.0 * (xy - wz),
-                # m22 = 1.0 - 2.0 * (q.x * q.x + q.z * q.z)
-                1.0 - 2.0 * (x2 + z2),
-                # m23 = 2.0 * (q.y * q.z + q.w * q.x)
-                2.0 * (yz + wx)
-                ],
-            # m3
-            [
-                # m31 = 2.0 * (q.x * q.z + q.w * q.y)
-                2.0 * (xz + wy),
-                # m32 = 2.0 * (q.y * q.z - q.w * q.x)
-                2.0 * (yz - wx),
-                # m33 = 1.0 - 2.0 * (q.x * q.x + q.y * q.y)
-                1.0 - 2.0 * (x2 + y2)
-                ]
-            ]
+
+    mat = numpy.empty( quat.shape[ :-1 ] + (3,3) )
+
+    # m11 = 1.0 - 2.0 * (q.y * q.y + q.z * q.z)
+    mat[ ..., 0, 0 ] = 1.0 - 2.0 * (y2 + z2)
+    # m12 = 2.0 * (q.x * q.y + q.w * q.z)
+    mat[ ..., 0, 1 ] = 2.0 * (xy + wz)
+    # m13 = 2.0 * (q.x * q.z - q.w * q.y)
+    mat[ ..., 0, 2 ] = 2.0 * (xz - wy)
+
+    # m21 = 2.0 * (q.x * q.y - q.w * q.z)
+    mat[ ..., 1, 0 ] = 2.0 * (xy - wz)
+    # m22 = 1.0 - 2.0 * (q.x * q.x + q.z * q.z)
+    mat[ ..., 1, 1 ] = 1.0 - 2.0 * (x2 + z2)
+    # m23 = 2.0 * (q.y * q.z + q.w * q.x)
+    mat[ ..., 1, 2 ] = 2.0 * (yz + wx)
+
+    # m31 = 2.0 * (q.x * q.z + q.w * q.y)
+    mat[ ..., 2, 0 ] = 2.0 * (xz + wy)
+    # m32 = 2.0 * (q.y * q.z - q.w * q.x)
+    mat[ ..., 2, 1 ] = 2.0 * (yz - wx)
+    # m33 = 1.0 - 2.0 * (q.x * q.x + q.y * q.y)
+    mat[ ..., 2, 2 ] = 1.0 - 2.0 * (x2 + y2)
+    return mat
+
+@_create_from_quaternion.register( 'numexpr' )
+def _create_from_quaternion( quat ):
+    # each matrix value is evaluated in a single pass
+    # without the intermediate products being stored
+    variables = {
+        'x': quat[ ..., 0 ],
+        'y': quat[ ..., 1 ],
+        'z': quat[ ..., 2 ],
+        'w': quat[ ..., 3 ],
+        }
+    expressions = (
+        ( '1.0 - 2.0 * (y * y + z * z)', '2.0 * (x * y + w * z)', '2.0 * (x * z - w * y)' ),
+        ( '2.0 * (x * y - w * z)', '1.0 - 2.0 * (x * x + z * z)', '2.0 * (y * z + w * x)' ),
+        ( '2.0 * (x * z + w * y)', '2.0 * (y * z - w * x)', '1.0 - 2.0 * (x * x + y * y)' ),
         )
 
+    evaluate = backend.numexpr().evaluate
+    mat = numpy.empty( quat.shape[ :-1 ] + (3,3) )
+    for row, row_expressions in enumerate( expressions ):
+        for column, expression in enumerate( row_expressions ):
+            mat[ ..., row, column ] = evaluate( expression, local_dict = variables )
+    return mat
+
+@_create_from_quaternion.register( 'numba' )
+def _create_from_quaternion( quat ):
+    quats = numpy.ascontiguousarray( quat ).reshape( (-1, 4) )
+    mat = numpy.empty( (len( quats ), 3, 3) )
+    _create_from_quaternion_loop( quats, mat )
+    return mat.reshape( quat.shape[ :-1 ] + (3,3) )
+
+@backend.jit
+def _create_from_quaternion_loop( quats, out ):
+    for i in range( quats.shape[ 0 ] ):
+        x = quats[ i, 0 ]
+        y = quats[ i, 1 ]
+        z = quats[ i, 2 ]
+        w = quats[ i, 3 ]
+
+        out[ i, 0, 0 ] = 1.0 - 2.0 * (y * y + z * z)
+        out[ i, 0, 1 ] = 2.0 * (x * y + w * z)
+        out[ i, 0, 2 ] = 2.0 * (x * z - w * y)
+        out[ i, 1, 0 ] = 2.0 * (x * y - w * z)
+        out[ i, 1, 1 ] = 1.0 - 2.0 * (x * x + z * z)
+        out[ i, 1, 2 ] = 2.0 * (y * z + w * x)
+        out[ i, 2, 0 ] = 2.0 * (x * z + w * y)
+        out[ i, 2, 1 ] = 2.0 * (y * z - w * x)
+        out[ i, 2, 2 ] = 1.0 - 2.0 * (x * x + y * y)
+
 def create_from_inverse_of_quaternion( quat ):
     """Creates a matrix with the inverse rotation of a quaternion.
 
@@ -291,29 +302,54 @@ def apply_to_vector( mat, vec ):
     else:
         raise ValueError( "Vector size unsupported" )
 
+@batchable( (2, 2), 'pass (N,3,3) matrices' )
 def multiply( m1, m2, out = None ):
     """Multiply two matricies, m1 . m2.
 
     This is essentially a wrapper around
-    numpy.dot( m1, m2 )
+    numpy.matmul( m1, m2 )
+
+    Stacks of matrices are multiplied pair by pair.
+    A single matrix may be multiplied against a stack of matrices.
 
     :param numpy.array m1: The first matrix.
         Can be a list of matrices.
     :param numpy.array m2: The second matrix.
         Can be a list of matrices.
+    :param numpy.array out: An optional array to store the result in.
+        This must not be one of the inputs.
     :rtype: numpy.array
     :return: A matrix that results from multiplying m1 by m2.
+
+    .. seealso:: matrix.multiply
     """
-    # using an input as the out value will cause corruption
-    if out == m1 or out == m2:
-        raise ValueError( "Output must not be one of the inputs, use assignment instead" )
+    return matrix.multiply( m1, m2, out = out )
+
+def multiply_chain( matrices, out = None ):
+    """Multiplies a sequence of matrices together, in order.
+
+    The result is matrices[0] . matrices[1] . ... . matrices[-1].
+
+    :param matrices: A list of matrices or stacks of matrices,
+        or an array of shape (K,3,3).
+    :param numpy.array out: An optional array to store the result in.
+        This must not be one of the inputs.
+    :rtype: numpy.array
+    :return: The product of the matrices.
 
-    return numpy.dot( m1, m2, out = out )
+    .. seealso:: matrix.multiply_chain
+    """
+    return matrix.multiply_chain( matrices, out = out )
 
+@batchable( (2,), 'pass (N,3,3) matrices' )
 def inverse( mat ):
     """Returns the inverse of the matrix.
 
     This is essentially a wrapper around numpy.linalg.inv.
+    Supports stacks of matrices.
+
+    For rotation and scale matrices, the specialised inverse functions
+    in this module are considerably faster.
 
     :param numpy.array m: A matrix.
     :rtype: numpy.array
@@ -322,3 +358,95 @@ def inverse( mat ):
     .. seealso:: http://docs.scipy.org/doc/numpy/reference/generated/numpy.linalg.inv.html
     """
     return numpy.linalg.inv( mat )
+
+def inverse_orthonormal( mat ):
+    """Returns the inverse of an orthonormal (pure rotation) matrix.
+
+    The inverse of an orthonormal matrix is its transpose, which
+    avoids the LU decomposition performed by numpy.linalg.inv.
+
+    The result is only correct if the matrix has orthogonal
+    rows of unit length. Use inverse_orthogonal if the matrix
+    also contains a scale.
+
+    Supports stacks of matrices with shape (N,3,3).
+
+    :param numpy.array mat: A matrix, or stack of matrices.
+    :rtype: numpy.array
+    :return: The inverse of the specified matrix.
+    """
+    mat = numpy.asarray( mat )
+    return mat.swapaxes( -1, -2 ).copy()
+
+def inverse_orthogonal( mat ):
+    """Returns the inverse of a rotation and scale matrix.
+
+    The matrix must have mutually orthogonal rows, which is the case
+    for a scale followed by a rotation.
+    The rows may be of any non-zero length.
+
+    Given M = S . R, the inverse is R^T . S^-1, which is the transpose
+    of M with each column divided by the squared length of the
+    matching row of M.
+
+    Supports stacks of matrices with shape (N,3,3).
+
+    :param numpy.array mat: A matrix, or stack of matrices.
+    :rtype: numpy.array
+    :return: The inverse of the specified matrix.
+    """
+    mat = numpy.asarray( mat )
+    # the squared length of each row is the squared scale
+    # applied along that axis
+    squared_scale = numpy.sum( mat ** 2, axis = -1 )
+    return mat.swapaxes( -1, -2 ) / squared_scale[ ..., numpy.newaxis, : ]
+
+def is_orthogonal( mat, tolerance = 1.0e-6 ):
+    """Checks if the rows of a matrix are mutually orthogonal.
+
+    Matrices that pass this test can be inverted using
+    inverse_orthogonal.
+
+    :param numpy.array mat: A matrix, or stack of matrices.
+    :param float tolerance: The maximum off-diagonal value of
+        mat . mat^T, relative to the largest squared row length.
+    :rtype: boolean, numpy.array
+    :return: True if the matrix rows are orthogonal and non-zero.
+        A stack of matrices will return an array of booleans.
+    """
+    mat = numpy.asarray( mat )
+    product = numpy.matmul( mat, mat.swapaxes( -1, -2 ) )
+    squared_scale = numpy.diagonal( product, axis1 = -2, axis2 = -1 )
+    off_diagonal = product - squared_scale[ ..., numpy.newaxis ] * numpy.identity( 3 )
+
+    largest = numpy.amax( squared_scale, axis = -1 )
+    return \
+        (numpy.amin( squared_scale, axis = -1 ) > 0.0) & \
+        (numpy.amax( numpy.absolute( off_diagonal ), axis = (-2, -1) ) <= tolerance * largest)
+
+def inverse_auto( mat, tolerance = 1.0e-6 ):
+    """Returns the inverse of the matrix, choosing the
+    fastest method that is valid for each matrix.
+
+    Matrices with orthogonal rows are inverted with inverse_orthogonal.
+    All other matrices are inverted using numpy.linalg.inv.
+
+    Supports stacks of matrices with shape (N,3,3).
+    Each matrix in the stack is checked individually.
+
+    :param numpy.array mat: A matrix, or stack of matrices.
+    :param float tolerance: The tolerance passed to is_orthogonal.
+    :rtype: numpy.array
+    :return: The inverse of the specified matrix.
+    """
+    mat = numpy.asarray( mat, dtype = 'float' )
+    stack = mat.reshape( (-1, 3, 3) )
+
+    orthogonal = is_orthogonal( stack, tolerance )
+
+    result = numpy.empty_like( stack )
+    result[ orthogonal ] = inverse_orthogonal( stack[ orthogonal ] )
+    general = ~orthogonal
+    if numpy.any( general ):
+        result[ general ] = numpy.linalg.inv( stack[ general ] )
+    return result.reshape( mat.shape )
@@ -11,8 +11,8 @@ import math
 
 import numpy
 
-from pyrr import matrix33
-from pyrr.utils import all_parameters_as_numpy_arrays
+from pyrr import cache, euler, matrix, matrix33
+from pyrr.utils import all_parameters_as_numpy_arrays, batchable
 
 
 def create_identity():
@@ -47,21 +47,23 @@ def create_matrix33_view( mat ):
     """
     return mat[ 0:3, 0:3 ]
 
-def create_from_eulers( eulers ):
+@batchable( (1,), 'pass (N,3) eulers' )
+def create_from_eulers( eulers, rotation_order = euler.order.default ):
     """Creates a matrix from the specified Euler rotations.
 
+    Supports stacks of eulers with shape (N,3).
+
     :param numpy.array eulers: A set of euler rotations in the format
         specified by the euler modules.
+    :param str rotation_order: The rotation order of the eulers.
     :rtype: numpy.array
     :return: A matrix with shape (4,4) with the euler's rotation.
     """
-    # set to identity matrix
-    # this will populate our extra rows for us
-    mat = create_identity()
-    
-    # we'll use Matrix33 for our conversion
-    mat33 = mat[ 0:3, 0:3 ]
-    mat[ 0:3, 0:3 ] = matrix33.create_from_eulers( eulers, mat33 )
+    mat33 = matrix33.create_from_eulers( eulers, rotation_order )
+
+    mat = numpy.zeros( mat33.shape[ :-2 ] + (4,4) )
+    mat[ ..., 0:3, 0:3 ] = mat33
+    mat[ ..., 3, 3 ] = 1.0
     return mat
 
 def create_from_quaternion( quat ):
@@ -165,6 +167,7 @@ def create_from_z_rotation( theta ):
     mat[ 0:3, 0:3 ] = matrix33.create_from_z_rotation( theta )
     return mat
 
+@batchable( (2, 1), 'pass (N,3) vectors or use parallel.apply_matrix44' )
 @all_parameters_as_numpy_arrays
 def apply_to_vector( mat, vec ):
     """Apply a matrix to a vector.
@@ -172,6 +175,9 @@ def apply_to_vector( mat, vec ):
     The matrix's rotation and translation are applied to the vector.
     Supports multiple matrices and vectors.
 
+    Vectors of size 3 are treated as points with a W value of 1.0
+    and are divided by the resulting W value, if it is not 0.0.
+
     :param numpy.array mat: The rotation / translation matrix.
         Can be a list of matrices.
     :param numpy.array vec: The vector to modify.
@@ -179,39 +185,60 @@ def apply_to_vector( mat, vec ):
     :rtype: numpy.array
     :return: The vectors rotated by the specified matrix.
     """
-    if vec.size == 3:
-        # convert to a vec4
-        vec4 = numpy.array( [ vec[ 0 ], vec[ 1 ], vec[ 2 ], 1.0 ] )
-        vec4 = numpy.dot( vec4, mat )
+    if vec.shape[ -1 ] == 3:
+        # treat as a vec4 with a W value of 1.0
+        # this avoids creating a copy of the vectors
+        vec4 = numpy.matmul( vec[ ..., numpy.newaxis, : ], mat[ ..., 0:3, : ] )[ ..., 0, : ]
+        vec4 += mat[ ..., 3, : ]
 
         # handle W value
-        if vec4[-1] != 0.0:
-            vec4 /= vec4[-1]
-        return vec4[:-1]
-    elif vec.size == 4:
-        return numpy.dot( vec, mat )
+        w = vec4[ ..., 3:4 ]
+        return vec4[ ..., 0:3 ] / numpy.where( w != 0.0, w, 1.0 )
+    elif vec.shape[ -1 ] == 4:
+        return numpy.matmul( vec[ ..., numpy.newaxis, : ], mat )[ ..., 0, : ]
     else:
         raise ValueError( "Vector size unsupported" )
 
+@batchable( (2, 2), 'pass (N,4,4) matrices' )
 def multiply( m1, m2, out = None ):
     """Multiply two matricies, m1 . m2.
 
     This is essentially a wrapper around
-    numpy.dot( m1, m2 )
+    numpy.matmul( m1, m2 )
+
+    Stacks of matrices are multiplied pair by pair.
+    A single matrix may be multiplied against a stack of matrices.
 
     :param numpy.array m1: The first matrix.
         Can be a list of matrices.
     :param numpy.array m2: The second matrix.
         Can be a list of matrices.
+    :param numpy.array out: An optional array to store the result in.
+        This must not be one of the inputs.
     :rtype: numpy.array
     :return: A matrix that results from multiplying m1 by m2.
+
+    .. seealso:: matrix.multiply
     """
-    # using an input as the out value will cause corruption
-    if out == m1 or out == m2:
-        raise ValueError( "Output must not be one of the inputs, use assignment instead" )
+    return matrix.multiply( m1, m2, out = out )
+
+def multiply_chain( matrices, out = None ):
+    """Multiplies a sequence of matrices together, in order.
+
+    The result is matrices[0] . matrices[1] . ... . matrices[-1].
+
+    :param matrices: A list of matrices or stacks of matrices,
+        or an array of shape (K,4,4).
+    :param numpy.array out: An optional array to store the result in.
+        This must not be one of the inputs.
+    :rtype: numpy.array
+    :return: The product of the matrices.
 
-    return numpy.dot( m1, m2, out = out )
+    .. seealso:: matrix.multiply_chain
+    """
+    return matrix.multiply_chain( matrices, out = out )
 
+@cache.cacheable
 def create_perspective_projection_matrix(fovy, aspect, znear, zfar):
     '''
     Creates perspective projection matrix.
@@ -238,6 +265,7 @@ def create_perspective_projection_matrix(fovy, aspect, znear, zfar):
         (0, 0, C, 0)
         ), dtype='float')
 
+@cache.cacheable
 def create_perspective_projection_matrix_from_bounds(
     left,
     right,
@@ -294,6 +322,7 @@ def create_perspective_projection_matrix_from_bounds(
             dtype = 'float'
         )
 
+@cache.cacheable
 def create_orthogonal_projection_matrix(
     left,
     right,
@@ -342,10 +371,15 @@ def create_orthogonal_projection_matrix(
             dtype = 'float'
         )
 
+@batchable( (2,), 'pass (N,4,4) matrices' )
 def inverse( m ):
     """Returns the inverse of the matrix.
 
     This is essentially a wrapper around numpy.linalg.inv.
+    Supports stacks of matrices.
+
+    For rotation and scale matrices, the specialised inverse functions
+    in this module are considerably faster.
 
     :param numpy.array m: A matrix.
     :rtype: numpy.array
@@ -354,3 +388,125 @@ def inverse( m ):
     .. seealso:: http://docs.scipy.org/doc/numpy/reference/generated/numpy.linalg.inv.html
     """
     return numpy.linalg.inv( m )
+
+def inverse_orthonormal( m ):
+    """Returns the inverse of an orthonormal matrix.
+
+    The inverse of an orthonormal matrix is its transpose, which
+    avoids the LU decomposition performed by numpy.linalg.inv.
+
+    The matrix must be a pure rotation with no translation or scale.
+    Use inverse_rigid for a matrix that also has a translation.
+
+    Supports stacks of matrices with shape (N,4,4).
+
+    :param numpy.array m: A matrix, or stack of matrices.
+    :rtype: numpy.array
+    :return: The inverse of the specified matrix.
+    """
+    m = numpy.asarray( m )
+    return m.swapaxes( -1, -2 ).copy()
+
+def _inverse_affine( m, inverse_rotation ):
+    """Inverts an affine matrix given the inverse of its
+    upper 3x3 matrix.
+
+    Given M = [ A 0 ; t 1 ], the inverse is [ A^-1 0 ; -t.A^-1 1 ].
+    """
+    m = numpy.asarray( m )
+    result = numpy.zeros( m.shape, dtype = numpy.result_type( m, inverse_rotation ) )
+    result[ ..., 0:3, 0:3 ] = inverse_rotation
+    result[ ..., 3, 0:3 ] = -numpy.matmul(
+        m[ ..., 3:4, 0:3 ],
+        inverse_rotation
+        )[ ..., 0, : ]
+    result[ ..., 3, 3 ] = 1.0
+    return result
+
+def inverse_rigid( m ):
+    """Returns the inverse of a rigid body transform.
+
+    A rigid body transform is a rotation followed by a translation.
+    The rotation is inverted by transposing it and the translation
+    is rotated by the transposed rotation and negated.
+
+    The result is only correct if the upper 3x3 matrix is
+    orthonormal and the last column is (0,0,0,1).
+    Use inverse_trs if the matrix also contains a scale.
+
+    Supports stacks of matrices with shape (N,4,4).
+
+    :param numpy.array m: A matrix, or stack of matrices.
+    :rtype: numpy.array
+    :return: The inverse of the specified matrix.
+    """
+    m = numpy.asarray( m )
+    return _inverse_affine( m, matrix33.inverse_orthonormal( m[ ..., 0:3, 0:3 ] ) )
+
+def inverse_trs( m ):
+    """Returns the inverse of a scale, rotation and translation transform.
+
+    The upper 3x3 matrix is inverted using matrix33.inverse_orthogonal,
+    which permits a non-uniform scale applied before the rotation.
+    The translation is then inverted as for inverse_rigid.
+
+    The result is only correct if the upper 3x3 matrix has orthogonal
+    rows and the last column is (0,0,0,1).
+
+    Supports stacks of matrices with shape (N,4,4).
+
+    :param numpy.array m: A matrix, or stack of matrices.
+    :rtype: numpy.array
+    :return: The inverse of the specified matrix.
+    """
+    m = numpy.asarray( m )
+    return _inverse_affine( m, matrix33.inverse_orthogonal( m[ ..., 0:3, 0:3 ] ) )
+
+def is_trs( m, tolerance = 1.0e-6 ):
+    """Checks if a matrix can be inverted using inverse_trs.
+
+    The last column must be (0,0,0,1) and the upper 3x3
+    matrix must have orthogonal rows.
+
+    :param numpy.array m: A matrix, or stack of matrices.
+    :param float tolerance: The tolerance passed to matrix33.is_orthogonal
+        and used when checking the last column.
+    :rtype: boolean, numpy.array
+    :return: True if the matrix is a scale, rotation and translation
+        transform. A stack of matrices will return an array of booleans.
+    """
+    m = numpy.asarray( m )
+    last_column = numpy.amax(
+        numpy.absolute( m[ ..., :, 3 ] - [ 0.0, 0.0, 0.0, 1.0 ] ),
+        axis = -1
+        )
+    return \
+        (last_column <= tolerance) & \
+        matrix33.is_orthogonal( m[ ..., 0:3, 0:3 ], tolerance )
+
+def inverse_auto( m, tolerance = 1.0e-6 ):
+    """Returns the inverse of the matrix, choosing the
+    fastest method that is valid for each matrix.
+
+    Matrices that pass is_trs are inverted with inverse_trs.
+    All other matrices are inverted using numpy.linalg.inv.
+
+    Supports stacks of matrices with shape (N,4,4).
+    Each matrix in the stack is checked individually.
+
+    :param numpy.array m: A matrix, or stack of matrices.
+    :param float tolerance: The tolerance passed to is_trs.
+    :rtype: numpy.array
+    :return: The inverse of the specified matrix.
+    """
+    m = numpy.asarray( m, dtype = 'float' )
+    stack = m.reshape( (-1, 4, 4) )
+
+    trs = is_trs( stack, tolerance )
+
+    result = numpy.empty_like( stack )
+    result[ trs ] = inverse_trs( stack[ trs ] )
+    general = ~trs
+    if numpy.any( general ):
+        result[ general ] = numpy.linalg.inv( stack[ general ] )
+    return result.reshape( m.shape )
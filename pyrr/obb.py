@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Provides functions to calculate and manipulate
+Oriented Bounding Boxes (OBB).
+
+OBB are a 3D rectangle with an orientation, which fit rotated
+objects more tightly than an AABB.
+
+An OBB is represented by an array of 5 x 3D vectors.
+The first vector is the centre of the box.
+The next 3 vectors are the axes of the box, which are unit length
+and perpendicular to each other. The axes are the rows of a rotation
+matrix which converts from the space of the box to world space.
+The last vector is the half size of the box along each axis.
+
+Stacks of OBBs with shape (N,5,3) are supported by every function.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import numpy
+
+from pyrr.utils import batchable
+
+
+class index:
+    #: The index of the centre vector within the OBB
+    centre = 0
+
+    #: The indices of the axis vectors within the OBB
+    axes = slice( 1, 4 )
+
+    #: The index of the half size vector within the OBB
+    extents = 4
+
+
+def create( centre, axes, extents ):
+    """Creates an OBB from its centre, axes and half sizes.
+
+    :param numpy.array centre: The centre of the box.
+    :param numpy.array axes: The axes of the box with shape (3,3),
+        one axis per row.
+    :param numpy.array extents: The half size of the box along each axis.
+    :rtype: numpy.array
+    """
+    centre, axes, extents = numpy.broadcast_arrays(
+        numpy.asarray( centre, dtype = 'float' )[ ..., numpy.newaxis, : ],
+        numpy.asarray( axes, dtype = 'float' ),
+        numpy.asarray( extents, dtype = 'float' )[ ..., numpy.newaxis, : ]
+        )
+    return numpy.concatenate( [ centre[ ..., :1, : ], axes, extents[ ..., :1, : ] ], axis = -2 )
+
+@batchable( (2,), 'pass (N,M,3) point sets' )
+def create_from_points( points ):
+    """Creates an OBB which fits a set of points.
+
+    The axes of the box are the principal axes of the points,
+    found from the covariance of the points.
+    Stacks of point sets with shape (N,M,3) create a stack of OBBs.
+
+    :param numpy.array points: The points with shape (M,3).
+    :rtype: numpy.array
+    """
+    points = numpy.asarray( points, dtype = 'float' )
+    mean = numpy.mean( points, axis = -2 )
+    relative = points - mean[ ..., numpy.newaxis, : ]
+    covariance = numpy.matmul( relative.swapaxes( -1, -2 ), relative ) / points.shape[ -2 ]
+
+    # eigh returns eigenvectors as columns, largest eigenvalue last
+    _, vectors = numpy.linalg.eigh( covariance )
+    axes = vectors.swapaxes( -1, -2 )[ ..., ::-1, : ]
+    # keep the axes right handed
+    axes[ ..., 2, : ] = numpy.cross( axes[ ..., 0, : ], axes[ ..., 1, : ] )
+
+    local = numpy.matmul( relative, axes.swapaxes( -1, -2 ) )
+    minimum = numpy.amin( local, axis = -2 )
+    maximum = numpy.amax( local, axis = -2 )
+    middle = numpy.matmul( ((minimum + maximum) * 0.5)[ ..., numpy.newaxis, : ], axes )[ ..., 0, : ]
+    return create( mean + middle, axes, (maximum - minimum) * 0.5 )
+
+@batchable( (2, 2), 'pass (N,2,3) AABBs and / or (N,4,4) matrices' )
+def create_from_aabb( aabb, matrix = None ):
+    """Creates an OBB from an AABB transformed by a matrix.
+
+    The matrix may contain a rotation, translation and scale, but not
+    a shear. Stacks of AABBs with shape (N,2,3) and / or matrices with
+    shape (N,4,4) are broadcast against each other.
+
+    :param numpy.array aabb: The AABB in the space of the matrix.
+    :param numpy.array matrix: A matrix44 which converts the AABB
+        to world space, or None.
+    :rtype: numpy.array
+    """
+    aabb = numpy.asarray( aabb, dtype = 'float' )
+    centre = (aabb[ ..., 0, : ] + aabb[ ..., 1, : ]) * 0.5
+    extents = numpy.absolute( aabb[ ..., 1, : ] - aabb[ ..., 0, : ] ) * 0.5
+    if matrix is None:
+        return create( centre, numpy.identity( 3 ), extents )
+
+    matrix = numpy.asarray( matrix, dtype = 'float' )
+    rotation = matrix[ ..., 0:3, 0:3 ]
+    # matrices are applied to row vectors, so each row is an axis
+    centre = numpy.matmul( centre[ ..., numpy.newaxis, : ], rotation )[ ..., 0, : ] + matrix[ ..., 3, 0:3 ]
+    scale = numpy.sqrt( numpy.sum( rotation * rotation, axis = -1 ) )
+    return create( centre, rotation / scale[ ..., numpy.newaxis ], extents * scale )
+
+def centre( obb ):
+    """Returns the centre point of the OBB.
+    """
+    return obb[ ..., index.centre, : ]
+
+def axes( obb ):
+    """Returns the axes of the OBB, one axis per row.
+    """
+    return obb[ ..., index.axes, : ]
+
+def extents( obb ):
+    """Returns the half size of the OBB along each axis.
+    """
+    return obb[ ..., index.extents, : ]
+
+@batchable( (2,), 'pass (N,5,3) OBBs' )
+def corners( obb ):
+    """Returns the 8 corners of the OBB.
+
+    :rtype: numpy.array
+    :return: The corners with shape (8,3), or (N,8,3) for a stack.
+    """
+    obb = numpy.asarray( obb )
+    signs = numpy.array( [ [ x, y, z ] for x in ( -1, 1 ) for y in ( -1, 1 ) for z in ( -1, 1 ) ], dtype = 'float' )
+    local = signs * obb[ ..., index.extents:, : ]
+    return numpy.matmul( local, axes( obb ) ) + obb[ ..., index.centre:1, : ]
+
+@batchable( (2,), 'pass (N,5,3) OBBs' )
+def create_aabb( obb ):
+    """Creates the AABB which encloses the OBB.
+
+    :rtype: numpy.array
+    """
+    obb = numpy.asarray( obb )
+    # the half size along each world axis
+    size = numpy.sum( numpy.absolute( axes( obb ) ) * extents( obb )[ ..., numpy.newaxis ], axis = -2 )
+    return numpy.stack( [ centre( obb ) - size, centre( obb ) + size ], axis = -2 )
@@ -0,0 +1,601 @@
+# -*- coding: utf-8 -*-
+"""Provides pure Python value types for single vectors, quaternions
+and matrices.
+
+Creating and operating on small NumPy arrays is dominated by the cost
+of allocating the array and dispatching the operation.
+When working with a single vector at a time, such as in gameplay
+code, these types perform the arithmetic directly on Python floats.
+
+Operations follow the functional API:
+
+    * Vector3 * Matrix44 is matrix44.apply_to_vector.
+    * Matrix44 * Matrix44 is matrix44.multiply.
+    * Quaternion * Quaternion is quaternion.cross.
+    * Quaternion * Vector3 is quaternion.apply_to_vector.
+    * ~Quaternion is quaternion.conjugate.
+    * Vector3 ^ Vector3 is vector.cross.
+    * Vector3 | Vector3 is vector.dot.
+
+Values are stored as Python floats, so they cannot share memory with
+a NumPy array. Conversion to and from arrays copies the values::
+
+    >>> vec = objects.Vector3.from_array( points[ 0 ] )
+    >>> points = objects.to_array( [ vec1, vec2, vec3 ] )
+
+Each type supports numpy.asarray, so objects may also be passed
+directly to the functional API.
+For large numbers of values, use arrays and the functional API.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+import math
+import numbers
+
+import numpy
+
+
+def _is_scalar( value ):
+    return type( value ) in ( float, int ) or isinstance( value, numbers.Real )
+
+def _cross( ax, ay, az, aw, bx, by, bz, bw ):
+    # the same product as quaternion.cross
+    return (
+        (aw * bx) + (ax * bw) + (az * by) - (ay * bz),
+        (aw * by) + (ay * bw) + (ax * bz) - (az * bx),
+        (aw * bz) + (az * bw) + (ay * bx) - (ax * by),
+        (aw * bw) - (ax * bx) - (ay * by) - (az * bz),
+        )
+
+def to_array( values ):
+    """Converts a list of objects of the same type into an array.
+
+    :param list values: A list of Vector3, Vector4, Quaternion or Matrix44.
+    :rtype: numpy.array
+    :return: An array with shape (N,3), (N,4) or (N,4,4).
+    """
+    return numpy.array( [ value.to_array() for value in values ], dtype = 'float' )
+
+
+class _Value( object ):
+    """The sequence and conversion behaviour of every value type.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_array( cls, array ):
+        """Creates an object from an array of values.
+        """
+        return cls( *numpy.asarray( array, dtype = 'float' ).ravel().tolist() )
+
+    @classmethod
+    def list_from_array( cls, array ):
+        """Creates a list of objects from a stack of arrays.
+        """
+        array = numpy.asarray( array, dtype = 'float' )
+        return [ cls( *values ) for values in array.reshape( len( array ), -1 ).tolist() ]
+
+    def to_array( self ):
+        return numpy.array( tuple( self ), dtype = 'float' )
+
+    def __array__( self, dtype = None, copy = None ):
+        return numpy.array( self.to_array(), dtype = dtype )
+
+    def __iter__( self ):
+        for name in self.__slots__:
+            yield getattr( self, name )
+
+    def __len__( self ):
+        return len( self.__slots__ )
+
+    def __getitem__( self, key ):
+        return tuple( self )[ key ]
+
+    def __eq__( self, other ):
+        return type( self ) is type( other ) and tuple( self ) == tuple( other )
+
+    def __ne__( self, other ):
+        return not self == other
+
+    # the values are mutable
+    __hash__ = None
+
+    def __repr__( self ):
+        return '%s(%s)' % (type( self ).__name__, ', '.join( repr( value ) for value in self ))
+
+
+class Vector3( _Value ):
+    __slots__ = ( 'x', 'y', 'z' )
+
+    def __init__( self, x = 0.0, y = 0.0, z = 0.0 ):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __add__( self, other ):
+        if isinstance( other, Vector3 ):
+            return Vector3( self.x + other.x, self.y + other.y, self.z + other.z )
+        if _is_scalar( other ):
+            return Vector3( self.x + other, self.y + other, self.z + other )
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__( self, other ):
+        if isinstance( other, Vector3 ):
+            return Vector3( self.x - other.x, self.y - other.y, self.z - other.z )
+        if _is_scalar( other ):
+            return Vector3( self.x - other, self.y - other, self.z - other )
+        return NotImplemented
+
+    def __rsub__( self, other ):
+        if _is_scalar( other ):
+            return Vector3( other - self.x, other - self.y, other - self.z )
+        return NotImplemented
+
+    def __mul__( self, other ):
+        if isinstance( other, Vector3 ):
+            return Vector3( self.x * other.x, self.y * other.y, self.z * other.z )
+        if isinstance( other, Matrix44 ):
+            return other.apply_to_vector( self )
+        if _is_scalar( other ):
+            return Vector3( self.x * other, self.y * other, self.z * other )
+        return NotImplemented
+
+    def __rmul__( self, other ):
+        if _is_scalar( other ):
+            return Vector3( self.x * other, self.y * other, self.z * other )
+        return NotImplemented
+
+    def __truediv__( self, other ):
+        if isinstance( other, Vector3 ):
+            return Vector3( self.x / other.x, self.y / other.y, self.z / other.z )
+        if _is_scalar( other ):
+            return Vector3( self.x / other, self.y / other, self.z / other )
+        return NotImplemented
+
+    def __rtruediv__( self, other ):
+        if _is_scalar( other ):
+            return Vector3( other / self.x, other / self.y, other / self.z )
+        return NotImplemented
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __neg__( self ):
+        return Vector3( -self.x, -self.y, -self.z )
+
+    def __xor__( self, other ):
+        if isinstance( other, Vector3 ):
+            return self.cross( other )
+        return NotImplemented
+
+    def __or__( self, other ):
+        if isinstance( other, Vector3 ):
+            return self.dot( other )
+        return NotImplemented
+
+    def dot( self, other ):
+        """
+        .. seealso:: vector.dot
+        """
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross( self, other ):
+        """
+        .. seealso:: vector.cross
+        """
+        return Vector3(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x
+            )
+
+    def squared_length( self ):
+        """
+        .. seealso:: vector.squared_length
+        """
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    def length( self ):
+        """
+        .. seealso:: vector.length
+        """
+        return math.sqrt( self.x * self.x + self.y * self.y + self.z * self.z )
+
+    def normalise( self ):
+        """Returns a unit length copy of the vector.
+
+        .. seealso:: vector.normalise
+        """
+        return self / self.length()
+
+    def interpolate( self, other, delta ):
+        """
+        .. seealso:: vector.interpolate
+        """
+        return self + ((other - self) * delta)
+
+
+class Vector4( _Value ):
+    __slots__ = ( 'x', 'y', 'z', 'w' )
+
+    def __init__( self, x = 0.0, y = 0.0, z = 0.0, w = 0.0 ):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.w = w
+
+    def __add__( self, other ):
+        if isinstance( other, Vector4 ):
+            return Vector4( self.x + other.x, self.y + other.y, self.z + other.z, self.w + other.w )
+        if _is_scalar( other ):
+            return Vector4( self.x + other, self.y + other, self.z + other, self.w + other )
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__( self, other ):
+        if isinstance( other, Vector4 ):
+            return Vector4( self.x - other.x, self.y - other.y, self.z - other.z, self.w - other.w )
+        if _is_scalar( other ):
+            return Vector4( self.x - other, self.y - other, self.z - other, self.w - other )
+        return NotImplemented
+
+    def __rsub__( self, other ):
+        if _is_scalar( other ):
+            return Vector4( other - self.x, other - self.y, other - self.z, other - self.w )
+        return NotImplemented
+
+    def __mul__( self, other ):
+        if isinstance( other, Vector4 ):
+            return Vector4( self.x * other.x, self.y * other.y, self.z * other.z, self.w * other.w )
+        if isinstance( other, Matrix44 ):
+            return other.apply_to_vector( self )
+        if _is_scalar( other ):
+            return Vector4( self.x * other, self.y * other, self.z * other, self.w * other )
+        return NotImplemented
+
+    def __rmul__( self, other ):
+        if _is_scalar( other ):
+            return Vector4( self.x * other, self.y * other, self.z * other, self.w * other )
+        return NotImplemented
+
+    def __truediv__( self, other ):
+        if isinstance( other, Vector4 ):
+            return Vector4( self.x / other.x, self.y / other.y, self.z / other.z, self.w / other.w )
+        if _is_scalar( other ):
+            return Vector4( self.x / other, self.y / other, self.z / other, self.w / other )
+        return NotImplemented
+
+    def __rtruediv__( self, other ):
+        if _is_scalar( other ):
+            return Vector4( other / self.x, other / self.y, other / self.z, other / self.w )
+        return NotImplemented
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __neg__( self ):
+        return Vector4( -self.x, -self.y, -self.z, -self.w )
+
+    def __or__( self, other ):
+        if isinstance( other, Vector4 ):
+            return self.dot( other )
+        return NotImplemented
+
+    def dot( self, other ):
+        """
+        .. seealso:: vector.dot
+        """
+        return self.x * other.x + self.y * other.y + self.z * other.z + self.w * other.w
+
+    def squared_length( self ):
+        """
+        .. seealso:: vector.squared_length
+        """
+        return self.dot( self )
+
+    def length( self ):
+        """
+        .. seealso:: vector.length
+        """
+        return math.sqrt( self.dot( self ) )
+
+    def normalise( self ):
+        """Returns a unit length copy of the vector.
+
+        .. seealso:: vector.normalise
+        """
+        return self / self.length()
+
+    def interpolate( self, other, delta ):
+        """
+        .. seealso:: vector.interpolate
+        """
+        return self + ((other - self) * delta)
+
+
+class Quaternion( _Value ):
+    __slots__ = ( 'x', 'y', 'z', 'w' )
+
+    def __init__( self, x = 0.0, y = 0.0, z = 0.0, w = 1.0 ):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.w = w
+
+    @classmethod
+    def create_from_x_rotation( cls, theta ):
+        return cls( math.sin( theta * 0.5 ), 0.0, 0.0, math.cos( theta * 0.5 ) )
+
+    @classmethod
+    def create_from_y_rotation( cls, theta ):
+        return cls( 0.0, math.sin( theta * 0.5 ), 0.0, math.cos( theta * 0.5 ) )
+
+    @classmethod
+    def create_from_z_rotation( cls, theta ):
+        return cls( 0.0, 0.0, math.sin( theta * 0.5 ), math.cos( theta * 0.5 ) )
+
+    @classmethod
+    def create_from_axis_rotation( cls, axis, theta ):
+        """
+        .. seealso:: quaternion.create_from_axis_rotation
+        """
+        x, y, z = axis
+        sinThetaOver2 = math.sin( theta * 0.5 )
+        return cls( x * sinThetaOver2, y * sinThetaOver2, z * sinThetaOver2, math.cos( theta * 0.5 ) )
+
+    def __mul__( self, other ):
+        if isinstance( other, Quaternion ):
+            return self.cross( other )
+        if isinstance( other, ( Vector3, Vector4 ) ):
+            return self.apply_to_vector( other )
+        return NotImplemented
+
+    def __invert__( self ):
+        return self.conjugate()
+
+    def __neg__( self ):
+        return Quaternion( -self.x, -self.y, -self.z, -self.w )
+
+    def __or__( self, other ):
+        if isinstance( other, Quaternion ):
+            return self.dot( other )
+        return NotImplemented
+
+    def cross( self, other ):
+        """
+        .. seealso:: quaternion.cross
+        """
+        return Quaternion( *_cross( self.x, self.y, self.z, self.w, other.x, other.y, other.z, other.w ) )
+
+    def dot( self, other ):
+        """
+        .. seealso:: quaternion.dot
+        """
+        return self.x * other.x + self.y * other.y + self.z * other.z + self.w * other.w
+
+    def length( self ):
+        """
+        .. seealso:: quaternion.length
+        """
+        return math.sqrt( self.dot( self ) )
+
+    def normalise( self ):
+        """Returns a unit length copy of the quaternion.
+
+        .. seealso:: quaternion.normalise
+        """
+        length = self.length()
+        return Quaternion( self.x / length, self.y / length, self.z / length, self.w / length )
+
+    def conjugate( self ):
+        """
+        .. seealso:: quaternion.conjugate
+        """
+        return Quaternion( -self.x, -self.y, -self.z, self.w )
+
+    def inverse( self ):
+        """
+        .. seealso:: quaternion.inverse
+        """
+        squared_length = self.dot( self )
+        return Quaternion(
+            -self.x / squared_length,
+            -self.y / squared_length,
+            -self.z / squared_length,
+            self.w / squared_length
+            )
+
+    def apply_to_vector( self, vec ):
+        """Rotates a Vector3 or Vector4. The W value of a Vector4 is not changed.
+
+        .. seealso:: quaternion.apply_to_vector
+        """
+        x, y, z, w = self.x, self.y, self.z, self.w
+        # quat * vec * quat^-1
+        vx, vy, vz, vw = _cross( vec.x, vec.y, vec.z, 0.0, -x, -y, -z, w )
+        rx, ry, rz, rw = _cross( x, y, z, w, vx, vy, vz, vw )
+        if isinstance( vec, Vector4 ):
+            return Vector4( rx, ry, rz, vec.w )
+        return Vector3( rx, ry, rz )
+
+
+class Matrix44( _Value ):
+    """A 4x4 matrix stored as a tuple of 16 values in row-major order.
+
+    Elements are accessed using a (row, column) tuple::
+
+        >>> mat[ 3, 0 ]
+    """
+    __slots__ = ( 'values', )
+
+    def __init__( self, *values ):
+        if not values:
+            values = (
+                1.0, 0.0, 0.0, 0.0,
+                0.0, 1.0, 0.0, 0.0,
+                0.0, 0.0, 1.0, 0.0,
+                0.0, 0.0, 0.0, 1.0,
+                )
+        if len( values ) != 16:
+            raise ValueError( "Matrix44 requires 16 values" )
+        self.values = tuple( values )
+
+    @classmethod
+    def create_from_translation( cls, vec ):
+        """
+        .. seealso:: matrix44.create_from_translation
+        """
+        return cls(
+            1.0, 0.0, 0.0, 0.0,
+            0.0, 1.0, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            vec[ 0 ], vec[ 1 ], vec[ 2 ], 1.0
+            )
+
+    @classmethod
+    def create_from_scale( cls, scale ):
+        """
+        .. seealso:: matrix44.create_from_scale
+        """
+        return cls(
+            scale[ 0 ], 0.0, 0.0, 0.0,
+            0.0, scale[ 1 ], 0.0, 0.0,
+            0.0, 0.0, scale[ 2 ], 0.0,
+            0.0, 0.0, 0.0, 1.0
+            )
+
+    @classmethod
+    def create_from_x_rotation( cls, theta ):
+        """
+        .. seealso:: matrix44.create_from_x_rotation
+        """
+        cosT = math.cos( theta )
+        sinT = math.sin( theta )
+        return cls(
+            1.0, 0.0, 0.0, 0.0,
+            0.0, cosT,-sinT, 0.0,
+            0.0, sinT, cosT, 0.0,
+            0.0, 0.0, 0.0, 1.0
+            )
+
+    @classmethod
+    def create_from_y_rotation( cls, theta ):
+        """
+        .. seealso:: matrix44.create_from_y_rotation
+        """
+        cosT = math.cos( theta )
+        sinT = math.sin( theta )
+        return cls(
+            cosT, 0.0, sinT, 0.0,
+            0.0, 1.0, 0.0, 0.0,
+           -sinT, 0.0, cosT, 0.0,
+            0.0, 0.0, 0.0, 1.0
+            )
+
+    @classmethod
+    def create_from_z_rotation( cls, theta ):
+        """
+        .. seealso:: matrix44.create_from_z_rotation
+        """
+        cosT = math.cos( theta )
+        sinT = math.sin( theta )
+        return cls(
+            cosT,-sinT, 0.0, 0.0,
+            sinT, cosT, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            0.0, 0.0, 0.0, 1.0
+            )
+
+    @classmethod
+    def create_from_quaternion( cls, quat ):
+        """
+        .. seealso:: matrix44.create_from_quaternion
+        """
+        x, y, z, w = quat.x, quat.y, quat.z, quat.w
+        return cls(
+            1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y + w * z), 2.0 * (x * z - w * y), 0.0,
+            2.0 * (x * y - w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z + w * x), 0.0,
+            2.0 * (x * z + w * y), 2.0 * (y * z - w * x), 1.0 - 2.0 * (x * x + y * y), 0.0,
+            0.0, 0.0, 0.0, 1.0
+            )
+
+    def to_array( self ):
+        return numpy.array( self.values, dtype = 'float' ).reshape( 4, 4 )
+
+    def __iter__( self ):
+        return iter( self.values )
+
+    def __len__( self ):
+        return 16
+
+    def __getitem__( self, key ):
+        if isinstance( key, tuple ):
+            row, column = key
+            return self.values[ row * 4 + column ]
+        return self.values[ key ]
+
+    def __mul__( self, other ):
+        if isinstance( other, Matrix44 ):
+            return self.multiply( other )
+        if _is_scalar( other ):
+            return Matrix44( *[ value * other for value in self.values ] )
+        return NotImplemented
+
+    def __rmul__( self, other ):
+        if _is_scalar( other ):
+            return Matrix44( *[ value * other for value in self.values ] )
+        return NotImplemented
+
+    def multiply( self, other ):
+        """
+        .. seealso:: matrix44.multiply
+        """
+        a = self.values
+        b = other.values
+        return Matrix44( *[
+            a[ row ] * b[ column ] + a[ row + 1 ] * b[ column + 4 ] + a[ row + 2 ] * b[ column + 8 ] + a[ row + 3 ] * b[ column + 12 ]
+            for row in ( 0, 4, 8, 12 )
+            for column in ( 0, 1, 2, 3 )
+            ] )
+
+    def transpose( self ):
+        m = self.values
+        return Matrix44( *[ m[ column * 4 + row ] for row in range( 4 ) for column in range( 4 ) ] )
+
+    def inverse( self ):
+        """Returns the inverse of the matrix.
+
+        This uses numpy.linalg.inv, as a general inverse is not
+        faster in pure Python.
+
+        .. seealso:: matrix44.inverse
+        """
+        return Matrix44.from_array( numpy.linalg.inv( self.to_array() ) )
+
+    def apply_to_vector( self, vec ):
+        """Applies the matrix to a Vector3 or Vector4.
+
+        .. seealso:: matrix44.apply_to_vector
+        """
+        m = self.values
+        x, y, z = vec.x, vec.y, vec.z
+        if isinstance( vec, Vector4 ):
+            w = vec.w
+            return Vector4(
+                x * m[ 0 ] + y * m[ 4 ] + z * m[ 8 ] + w * m[ 12 ],
+                x * m[ 1 ] + y * m[ 5 ] + z * m[ 9 ] + w * m[ 13 ],
+                x * m[ 2 ] + y * m[ 6 ] + z * m[ 10 ] + w * m[ 14 ],
+                x * m[ 3 ] + y * m[ 7 ] + z * m[ 11 ] + w * m[ 15 ]
+                )
+
+        # treat as a point with a W value of 1.0
+        w = x * m[ 3 ] + y * m[ 7 ] + z * m[ 11 ] + m[ 15 ]
+        if w == 0.0:
+            w = 1.0
+        return Vector3(
+            (x * m[ 0 ] + y * m[ 4 ] + z * m[ 8 ] + m[ 12 ]) / w,
+            (x * m[ 1 ] + y * m[ 5 ] + z * m[ 9 ] + m[ 13 ]) / w,
+            (x * m[ 2 ] + y * m[ 6 ] + z * m[ 10 ] + m[ 14 ]) / w
+            )
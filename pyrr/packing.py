@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""Provides rectangle packing for building texture atlases.
+
+Rectangles are specified by their sizes as a numpy.array of shape (N,2),
+and are returned as rectangles with shape (N,2,2) in the layout of the
+rectangle module, in the same order as the sizes.
+
+Rectangles are packed into an atlas of a fixed width. The height of
+the atlas may be fixed, in which case rectangles which do not fit are
+returned as NaN, or unbounded, in which case the atlas grows as required::
+
+    >>> rects = pyrr.packing.pack( glyph_sizes, 1024 )
+    >>> height = pyrr.rectangle.top( rects ).max()
+
+The following kinds of packing are supported:
+
+    * Skyline: Tracks the top edge of the packed rectangles and places
+      each rectangle at the lowest point of the edge. Each rectangle
+      is placed in roughly constant time, which suits large numbers of
+      rectangles such as the glyphs of a font.
+    * MaxRects: Tracks every maximal free rectangle and places each
+      rectangle at the lowest position it fits. Packs more tightly,
+      and fills gaps left by earlier rectangles, but each placement
+      tests every free rectangle. Suited to hundreds of rectangles.
+
+Each batch of sizes is sorted by height before packing. The Atlas
+class keeps the free space between batches so rectangles can be added
+to an existing atlas.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import numpy
+
+
+class kind:
+    #: Places rectangles along the top edge of the packed rectangles.
+    skyline = 'skyline'
+
+    #: Places rectangles within the maximal free rectangles.
+    maxrects = 'maxrects'
+
+
+def _sort( sizes ):
+    # tallest first, then widest
+    return numpy.lexsort( (-sizes[ :, 0 ], -sizes[ :, 1 ]) )
+
+def pack( sizes, width, height = None, packing_kind = kind.skyline ):
+    """Packs rectangles into a new atlas.
+
+    :param numpy.array sizes: The width and height of each rectangle with shape (N,2).
+    :param float width: The width of the atlas.
+    :param float height: The height of the atlas, or None if the
+        height is unbounded.
+    :param str packing_kind: A value from the kind class.
+    :rtype: numpy.array
+    :return: The placed rectangles with shape (N,2,2). Rectangles
+        which do not fit are NaN.
+    """
+    return Atlas( width, height, packing_kind ).insert( sizes )
+
+
+class Atlas( object ):
+    """A rectangular area which rectangles are packed into.
+
+    :param float width: The width of the atlas.
+    :param float height: The height of the atlas, or None if the
+        height is unbounded.
+    :param str packing_kind: A value from the kind class.
+    """
+
+    def __init__( self, width, height = None, packing_kind = kind.skyline ):
+        if packing_kind not in ( kind.skyline, kind.maxrects ):
+            raise ValueError( "Unknown packing kind '%s'" % packing_kind )
+        if width <= 0 or (height is not None and height <= 0):
+            raise ValueError( "Atlas size must be positive" )
+
+        self.width = width
+        self.height = height
+        self.kind = packing_kind
+
+        #: The number of rectangles placed in the atlas.
+        self.count = 0
+
+        #: The total area of the rectangles placed in the atlas.
+        self.area = 0.0
+
+        #: The height of the highest placed rectangle.
+        self.used_height = 0.0
+
+        limit = numpy.inf if height is None else height
+        # the skyline is stored as the x, y and width of each segment
+        self._skyline = ( [ 0.0 ], [ 0.0 ], [ float( width ) ] )
+        # the free rectangles are stored as x, y, width, height
+        self._free = numpy.array( [ [ 0.0, 0.0, width, limit ] ] )
+
+    @property
+    def occupancy( self ):
+        """The fraction of the used area of the atlas covered by rectangles.
+
+        The used area is the width of the atlas by the height of the
+        highest rectangle.
+        """
+        if not self.used_height:
+            return 0.0
+        return self.area / (self.width * self.used_height)
+
+    def insert( self, sizes ):
+        """Packs rectangles into the atlas.
+
+        :param numpy.array sizes: The width and height of each rectangle with shape (N,2).
+        :rtype: numpy.array
+        :return: The placed rectangles with shape (N,2,2). Rectangles
+            which do not fit are NaN.
+        """
+        sizes = numpy.asarray( sizes, dtype = 'float' ).reshape( -1, 2 )
+        if numpy.any( sizes < 0.0 ):
+            raise ValueError( "Rectangle sizes must not be negative" )
+
+        order = _sort( sizes )
+        if self.kind == kind.skyline:
+            positions = self._insert_skyline( sizes[ order ] )
+        else:
+            positions = self._insert_maxrects( sizes[ order ] )
+
+        rects = numpy.empty( (len( sizes ), 2, 2) )
+        rects[ order, 0 ] = positions
+        rects[ :, 1 ] = sizes
+        placed = ~numpy.isnan( rects[ :, 0, 0 ] )
+        rects[ ~placed ] = numpy.nan
+
+        if numpy.any( placed ):
+            self.count += int( numpy.count_nonzero( placed ) )
+            self.area += float( numpy.sum( numpy.prod( sizes[ placed ], axis = -1 ) ) )
+            top = numpy.max( rects[ placed, 0, 1 ] + sizes[ placed, 1 ] )
+            self.used_height = max( self.used_height, float( top ) )
+        return rects
+
+    def _insert_skyline( self, sizes ):
+        xs, ys, ws = self._skyline
+        limit = numpy.inf if self.height is None else self.height
+        positions = numpy.full( (len( sizes ), 2), numpy.nan )
+
+        for index, ( w, h ) in enumerate( sizes.tolist() ):
+            if w > self.width:
+                continue
+            while True:
+                # the lowest, and then left most, segment
+                i = ys.index( min( ys ) )
+                y = ys[ i ]
+                if y + h > limit:
+                    # every other segment is higher
+                    break
+
+                if ws[ i ] >= w:
+                    positions[ index ] = xs[ i ], y
+                    if ws[ i ] > w:
+                        xs.insert( i + 1, xs[ i ] + w )
+                        ys.insert( i + 1, y )
+                        ws.insert( i + 1, ws[ i ] - w )
+                        ws[ i ] = w
+                    ys[ i ] = y + h
+                    if i + 1 < len( ys ) and ys[ i + 1 ] == ys[ i ]:
+                        ws[ i ] += ws[ i + 1 ]
+                        del xs[ i + 1 ], ys[ i + 1 ], ws[ i + 1 ]
+                    if i and ys[ i - 1 ] == ys[ i ]:
+                        ws[ i - 1 ] += ws[ i ]
+                        del xs[ i ], ys[ i ], ws[ i ]
+                    break
+
+                # the gap is too narrow, fill it to the height
+                # of the lower neighbour and merge them
+                left = ys[ i - 1 ] if i else numpy.inf
+                right = ys[ i + 1 ] if i + 1 < len( ys ) else numpy.inf
+                if left <= right:
+                    ws[ i - 1 ] += ws[ i ]
+                    del xs[ i ], ys[ i ], ws[ i ]
+                    i -= 1
+                else:
+                    ys[ i ] = right
+                    ws[ i ] += ws[ i + 1 ]
+                    del xs[ i + 1 ], ys[ i + 1 ], ws[ i + 1 ]
+                if i + 1 < len( ys ) and ys[ i + 1 ] == ys[ i ]:
+                    ws[ i ] += ws[ i + 1 ]
+                    del xs[ i + 1 ], ys[ i + 1 ], ws[ i + 1 ]
+        return positions
+
+    def _insert_maxrects( self, sizes ):
+        free = self._free
+        positions = numpy.full( (len( sizes ), 2), numpy.nan )
+
+        for index, ( w, h ) in enumerate( sizes.tolist() ):
+            fits = numpy.flatnonzero( (free[ :, 2 ] >= w) & (free[ :, 3 ] >= h) )
+            if not len( fits ):
+                continue
+
+            # the lowest top edge, and then the left most
+            candidates = free[ fits ]
+            i = fits[ numpy.lexsort( (candidates[ :, 0 ], candidates[ :, 1 ] + h) )[ 0 ] ]
+            x, y = free[ i, 0 ], free[ i, 1 ]
+            positions[ index ] = x, y
+
+            # split the free rectangles which overlap the placed rectangle
+            fx, fy, fw, fh = free.T
+            overlap = (fx < x + w) & (x < fx + fw) & (fy < y + h) & (y < fy + fh)
+            split = free[ overlap ]
+            sx, sy, sw, sh = split.T
+            right = numpy.full_like( sx, x + w )
+            top = numpy.full_like( sy, y + h )
+            parts = numpy.concatenate( [
+                numpy.stack( [ sx, sy, x - sx, sh ], axis = -1 ),
+                numpy.stack( [ right, sy, sx + sw - right, sh ], axis = -1 ),
+                numpy.stack( [ sx, sy, sw, y - sy ], axis = -1 ),
+                numpy.stack( [ sx, top, sw, sy + sh - top ], axis = -1 ),
+                ] )
+            parts = parts[ (parts[ :, 2 ] > 0.0) & (parts[ :, 3 ] > 0.0) ]
+
+            # remove the new free rectangles which are inside another,
+            # free rectangles which did not overlap can not be inside
+            # the new rectangles as they were not inside the rectangle
+            # that was split
+            free = numpy.concatenate( [ parts, free[ ~overlap ] ] )
+            inner = parts[ :, numpy.newaxis ]
+            outer = free[ numpy.newaxis ]
+            contained = (
+                (outer[ ..., 0 ] <= inner[ ..., 0 ]) &
+                (outer[ ..., 1 ] <= inner[ ..., 1 ]) &
+                (inner[ ..., 0 ] + inner[ ..., 2 ] <= outer[ ..., 0 ] + outer[ ..., 2 ]) &
+                (inner[ ..., 1 ] + inner[ ..., 3 ] <= outer[ ..., 1 ] + outer[ ..., 3 ])
+                )
+            # a rectangle is always inside itself, and of identical
+            # rectangles only the first is kept
+            count = len( parts )
+            identical = numpy.all( parts[ :, numpy.newaxis ] == parts[ numpy.newaxis ], axis = -1 )
+            contained[ :, :count ] &= ~identical | numpy.tri( count, k = -1, dtype = 'bool' )
+            keep = numpy.ones( len( free ), dtype = 'bool' )
+            keep[ :count ] = ~numpy.any( contained, axis = -1 )
+            free = free[ keep ]
+
+        self._free = free
+        return positions
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""Provides functions to run batched operations on multiple threads.
+
+NumPy releases the GIL during most array operations, so large
+arrays can be processed by multiple threads at once.
+Arrays are split into chunks along their first axis and each chunk
+is processed by a thread pool. The results are written directly
+into a single output array.
+
+Arrays smaller than a single chunk are processed on the calling thread.
+
+The number of threads defaults to the number of CPUs and can be
+changed using set_workers::
+
+    >>> pyrr.parallel.set_workers( 8 )
+    >>> points = pyrr.parallel.apply_matrix44( mat, points )
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+
+from pyrr import geometric_tests, matrix44, vector
+
+
+#: The default number of items per chunk.
+#: This is small enough that the arrays used by a chunk remain in cache.
+chunk_size = 2 ** 14
+
+_workers = None
+_executor = None
+_lock = threading.Lock()
+
+
+def get_workers():
+    """Returns the number of threads used to process chunks.
+
+    :rtype: int
+    """
+    return _workers or os.cpu_count() or 1
+
+def set_workers( count = None ):
+    """Sets the number of threads used to process chunks.
+
+    The existing thread pool is shut down once its work completes.
+
+    :param int count: The number of threads. None uses the number of CPUs.
+    :raise ValueError: raised if count is less than 1.
+    """
+    global _workers, _executor
+    if count is not None and count < 1:
+        raise ValueError( "Worker count must be at least 1" )
+
+    with _lock:
+        _workers = count
+        if _executor is not None:
+            _executor.shutdown( wait = False )
+            _executor = None
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor( max_workers = get_workers() )
+        return _executor
+
+def apply( fn, arrays, args = (), out = None, size = None ):
+    """Applies a function to chunks of arrays using a thread pool.
+
+    Each array is split along its first axis. The function is called
+    with a chunk of each array followed by args and must return an
+    array with one item for each item in the chunk::
+
+        fn( arrays[0][ start:end ], arrays[1][ start:end ], *args )
+
+    The result of each call is written to out[ start:end ].
+
+    :param function fn: The function to apply. It must be thread safe.
+    :param list arrays: The arrays to split. Each must have the same length.
+    :param tuple args: Arguments passed unchanged to every call.
+    :param numpy.array out: An optional array to write the results to.
+        If None, an array is allocated using the result of the first chunk.
+    :param int size: The number of items per chunk.
+        Defaults to parallel.chunk_size.
+    :raise ValueError: raised if the arrays are of differing lengths.
+    :rtype: numpy.array
+    :return: The combined results.
+    """
+    arrays = [ numpy.asarray( array ) for array in arrays ]
+    length = len( arrays[ 0 ] )
+    if any( len( array ) != length for array in arrays ):
+        raise ValueError( "Arrays must be the same length" )
+
+    size = size or chunk_size
+    bounds = [
+        (start, min( start + size, length ))
+        for start in range( 0, length, size )
+        ]
+
+    def process( start, end ):
+        result = fn( *([ array[ start:end ] for array in arrays ] + list( args )) )
+        out[ start:end ] = result
+
+    if len( bounds ) <= 1 or get_workers() == 1:
+        if out is None:
+            return numpy.asarray( fn( *(arrays + list( args )) ) )
+        for start, end in bounds:
+            process( start, end )
+        return out
+
+    if out is None:
+        # use the first chunk to determine the output shape and type
+        start, end = bounds.pop( 0 )
+        first = numpy.asarray( fn( *([ array[ start:end ] for array in arrays ] + list( args )) ) )
+        out = numpy.empty( (length,) + first.shape[ 1: ], dtype = first.dtype )
+        out[ start:end ] = first
+
+    futures = [ _get_executor().submit( process, start, end ) for start, end in bounds ]
+    for future in futures:
+        # re-raises any exception from the worker
+        future.result()
+    return out
+
+def _apply_matrix44( vecs, mat ):
+    return matrix44.apply_to_vector( mat, vecs )
+
+def apply_matrix44( mat, vecs, out = None, size = None ):
+    """Applies a matrix to an array of vectors using a thread pool.
+
+    :param numpy.array mat: The matrix to apply.
+    :param numpy.array vecs: An array of vectors with shape (N,3) or (N,4).
+    :param numpy.array out: An optional array to write the results to.
+    :param int size: The number of vectors per chunk.
+    :rtype: numpy.array
+    :return: The transformed vectors.
+
+    .. seealso:: matrix44.apply_to_vector
+    """
+    return apply( _apply_matrix44, [ vecs ], ( numpy.asarray( mat ), ), out, size )
+
+def normalise( vecs, out = None, size = None ):
+    """Normalises an array of vectors using a thread pool.
+
+    :param numpy.array vecs: An array of vectors with shape (N,3).
+    :param numpy.array out: An optional array to write the results to.
+    :param int size: The number of vectors per chunk.
+    :rtype: numpy.array
+    :return: The normalised vectors.
+
+    .. seealso:: vector.normalise
+    """
+    return apply( vector.normalise, [ vecs ], (), out, size )
+
+def ray_intersect_aabb( rays, aabb, out = None, size = None ):
+    """Intersects an array of rays with a single AABB using a thread pool.
+
+    :param numpy.array rays: An array of rays with shape (N,2,3).
+    :param numpy.array aabb: The AABB to check against.
+    :param numpy.array out: An optional array to write the results to.
+    :param int size: The number of rays per chunk.
+    :rtype: numpy.array
+    :return: The intersection point of each ray, with NaN values
+        where no intersection occurs.
+
+    .. seealso:: geometric_tests.ray_intersect_aabb
+    """
+    return apply( geometric_tests.ray_intersect_aabb, [ rays ], ( aabb, ), out, size )
+
+def sphere_inside_planes( spheres, planes, out = None, size = None ):
+    """Culls an array of spheres against a convex volume using a thread pool.
+
+    :param numpy.array spheres: An array of spheres with shape (N,4).
+    :param numpy.array planes: The planes of the volume with shape (M,4).
+    :param numpy.array out: An optional array to write the results to.
+    :param int size: The number of spheres per chunk.
+    :rtype: numpy.array
+    :return: An array of booleans which are True where the sphere is
+        not outside of the volume.
+
+    .. seealso:: geometric_tests.sphere_inside_planes
+    """
+    return apply( geometric_tests.sphere_inside_planes, [ spheres ], ( planes, ), out, size )
@@ -6,7 +6,8 @@ import math
 
 import numpy
 
-from pyrr import vector, vector3, vector4
+from pyrr import euler, vector, vector4
+from pyrr.utils import batchable
 
 
 class index:
@@ -23,12 +24,17 @@ class index:
     w = 3
 
 
+# multiplying by this inverts the x,y,z values
+_conjugate = numpy.array( [ -1.0, -1.0, -1.0, 1.0 ] )
+
+
 def create( x, y, z, w ):
     return numpy.array( [ x, y, z, w ], dtype = float )
 
 def create_identity():
     return vector4.create_identity()
 
+@batchable( (0,), 'use create_from_axis_rotation with (N,) angles' )
 def create_from_x_rotation( theta ):
     thetaOver2 = theta * 0.5
 
@@ -45,6 +51,7 @@ def create_from_x_rotation( theta ):
             ]
         )
 
+@batchable( (0,), 'use create_from_axis_rotation with (N,) angles' )
 def create_from_y_rotation( theta ):
     thetaOver2 = theta * 0.5
 
@@ -61,6 +68,7 @@ def create_from_y_rotation( theta ):
             ]
         )
 
+@batchable( (0,), 'use create_from_axis_rotation with (N,) angles' )
 def create_from_z_rotation( theta ):
     thetaOver2 = theta * 0.5
 
@@ -77,120 +85,185 @@ def create_from_z_rotation( theta ):
             ]
         )
 
+@batchable( (1, 0), 'pass (N,3) axes and / or (N,) angles' )
 def create_from_axis_rotation( axis, theta ):
-    # make sure the vector is normalised
-    assert (numpy.linalg.norm( axis, ord = None ) - 1.0) < 0.01
-    
-    thetaOver2 = theta * 0.5
-    sinThetaOver2 = math.sin( thetaOver2 )
-    
-    return numpy.array(
-        [
-            # x
-            axis[ 0 ] * sinThetaOver2,
-            # y
-            axis[ 1 ] * sinThetaOver2,
-            # z
-            axis[ 2 ] * sinThetaOver2,
-            # w
-            math.cos( thetaOver2 )
-            ]
-        )
+    """Creates a quaternion with a rotation about an axis.
 
-def create_from_eulers( eulers ):
-    """Creates a quaternion from a set of Euler angles.
+    Supports stacks of axes with shape (N,3) and / or an array of
+    angles with shape (N,), which are broadcast against each other.
 
-    Eulers are an array of length 3 in the following order::
-        [ yaw, pitch, roll ]
+    :param numpy.array axis: The axis of rotation, which must be unit length.
+    :param float theta: The rotation, in radians, about the axis.
+    :rtype: numpy.array
+    :return: A quaternion, or a stack of quaternions with shape (N,4).
     """
-    halfYaw = eulers[ 0 ] * 0.5
-    sinYaw = math.sin( halfYaw )
-    cosYaw = math.cos( halfYaw )
+    axis = numpy.asarray( axis, dtype = 'float' )
+    thetaOver2 = numpy.asarray( theta, dtype = 'float' ) * 0.5
 
-    halfPitch = eulers[ 1 ] * 0.5
-    sinPitch = math.sin( halfPitch )
-    cosPitch = math.cos( halfPitch )
+    sinThetaOver2 = numpy.sin( thetaOver2 )[ ..., numpy.newaxis ]
+    xyz = axis * sinThetaOver2
 
-    halfRoll = eulers[ 2 ] * 0.5
-    sinRoll = math.sin( halfRoll )
-    cosRoll = math.cos( halfRoll )
-    
-    return numpy.array(
-        [
-            # x = -cy * sp * cr - sy * cp * sr
-            (-cosYaw * sinPitch * cosRoll) - (sinYaw * cosPitch * sinRoll),
-            # y = cy * sp * sr - sy * cp * cr
-            (cosYaw * sinPitch * sinRoll) - (sinYaw * cosPitch * cosRoll),
-            # z = sy * sp * cr - cy * cp * sr
-            (sinYaw * sinPitch * cosRoll) - (cosYaw * cosPitch * sinRoll),
-            # w = cy * cp * cr + sy * sp * sr
-            (cosYaw * cosPitch * cosRoll) + (sinYaw * sinPitch * sinRoll) 
-            ]
-        )
+    quat = numpy.empty( xyz.shape[ :-1 ] + (4,) )
+    quat[ ..., 0:3 ] = xyz
+    quat[ ..., 3 ] = numpy.cos( thetaOver2 )
+    return quat
 
-def create_from_inverse_of_eulers( eulers ):
-    """Creates a quaternion from the inverse of a set of Euler angles.
+@batchable( (2,), 'pass (N,3,3) matrices' )
+def create_from_matrix( mat ):
+    """Creates a quaternion with the same rotation as a matrix.
+
+    Accepts a matrix33 or matrix44, or stacks of either with
+    shape (N,3,3) or (N,4,4). Only the upper 3x3 matrix is used,
+    which must be a pure rotation.
 
-    Eulers are an array of length 3 in the following order::
-        [ yaw, pitch, roll ]
+    Each quaternion is calculated from whichever of x, y, z or w has
+    the largest magnitude, which avoids the loss of precision that
+    occurs when dividing by a small value. The selection is performed
+    per matrix without branching, so stacks are converted in a
+    single pass.
+
+    The returned quaternions have a W value >= 0.0.
+
+    :param numpy.array mat: The matrix, or stack of matrices.
+    :rtype: numpy.array
+    :return: A quaternion, or a stack of quaternions with shape (N,4).
+
+    .. seealso:: http://www.euclideanspace.com/maths/geometry/rotations/conversions/matrixToQuaternion/
     """
-    halfYaw = eulers[ 0 ] * 0.5
-    sinYaw = math.sin( halfYaw )
-    cosYaw = math.cos( halfYaw )
+    mat = numpy.asarray( mat, dtype = 'float' )
+
+    m00 = mat[ ..., 0, 0 ]
+    m01 = mat[ ..., 0, 1 ]
+    m02 = mat[ ..., 0, 2 ]
+    m10 = mat[ ..., 1, 0 ]
+    m11 = mat[ ..., 1, 1 ]
+    m12 = mat[ ..., 1, 2 ]
+    m20 = mat[ ..., 2, 0 ]
+    m21 = mat[ ..., 2, 1 ]
+    m22 = mat[ ..., 2, 2 ]
+
+    # each row is the quaternion scaled by 4 times one of its values
+    # the diagonal is 4 times that value squared
+    # row 0 = 4x * q, row 1 = 4y * q, row 2 = 4z * q, row 3 = 4w * q
+    candidates = numpy.empty( mat.shape[ :-2 ] + (4,4) )
+    candidates[ ..., 0, : ] = numpy.stack( [ 1.0 + m00 - m11 - m22, m01 + m10, m02 + m20, m12 - m21 ], axis = -1 )
+    candidates[ ..., 1, : ] = numpy.stack( [ m01 + m10, 1.0 - m00 + m11 - m22, m12 + m21, m20 - m02 ], axis = -1 )
+    candidates[ ..., 2, : ] = numpy.stack( [ m02 + m20, m12 + m21, 1.0 - m00 - m11 + m22, m01 - m10 ], axis = -1 )
+    candidates[ ..., 3, : ] = numpy.stack( [ m12 - m21, m20 - m02, m01 - m10, 1.0 + m00 + m11 + m22 ], axis = -1 )
+
+    # select the row with the largest diagonal value
+    diagonal = numpy.diagonal( candidates, axis1 = -2, axis2 = -1 )
+    largest = numpy.argmax( diagonal, axis = -1 )[ ..., numpy.newaxis, numpy.newaxis ]
+    quat = numpy.take_along_axis( candidates, largest, axis = -2 )[ ..., 0, : ]
+
+    # keep W positive so the quaternions are in the same hemisphere
+    quat *= numpy.where( quat[ ..., 3:4 ] < 0.0, -1.0, 1.0 )
+    return normalise( quat, out = quat )
+
+@batchable( (1,), 'pass (N,3) eulers' )
+def create_from_eulers( eulers, rotation_order = euler.order.default ):
+    """Creates a quaternion from a set of Euler angles.
 
-    halfPitch = eulers[ 1 ] * 0.5
-    sinPitch = math.sin( halfPitch )
-    cosPitch = math.cos( halfPitch )
-    
-    halfRoll = eulers[ 2 ] * 0.5
-    sinRoll = math.sin( halfRoll )
-    cosRoll = math.cos( halfRoll )
-    
-    return numpy.array(
-        [
-            # x = cy * sp * cr + sy * cp * sr
-            (cosYaw * sinPitch * cosRoll) + (sinYaw * cosPitch * sinRoll),
-            # y = -cy * sp * sr + sy * cp * cr
-            (-cosYaw * sinPitch * sinRoll) + (sinYaw * cosPitch * cosRoll),
-            # z = -sy * sp * cr + cy * cp * sr
-            (-sinYaw * sinPitch * cosRoll) + (cosYaw * cosPitch * sinRoll),
-            # w = cy * cp * cr + sy * sp * sr
-            (cosYaw * cosPitch * cosRoll) + (sinYaw * sinPitch * sinRoll)
-            ]
-        )
+    Supports stacks of eulers with shape (N,3).
 
-def cross( quat1, quat2 ):
+    :param numpy.array eulers: The euler angles, in radians.
+    :param str rotation_order: The rotation order of the eulers.
+        Defaults to the order of the euler module.
+    :rtype: numpy.array
+    :return: A quaternion, or a stack of quaternions with shape (N,4).
+
+    .. seealso:: euler.axes
+    """
+    eulers = numpy.asarray( eulers, dtype = 'float' )
+    axes, intrinsic = euler.axes( rotation_order )
+    if intrinsic:
+        eulers = eulers[ ..., ::-1 ]
+
+    halfAngles = eulers * 0.5
+    sinHalfAngles = numpy.sin( halfAngles )
+    cosHalfAngles = numpy.cos( halfAngles )
+
+    # create a quaternion for the rotation about each axis
+    # and combine them in the order they are applied
+    rotations = numpy.zeros( eulers.shape[ :-1 ] + (3,4) )
+    for rotation, axis in enumerate( axes ):
+        rotations[ ..., rotation, axis ] = sinHalfAngles[ ..., rotation ]
+        rotations[ ..., rotation, 3 ] = cosHalfAngles[ ..., rotation ]
+
+    result = cross( rotations[ ..., 0, : ], rotations[ ..., 1, : ] )
+    return cross( result, rotations[ ..., 2, : ], out = result )
+
+def create_from_inverse_of_eulers( eulers, rotation_order = euler.order.default ):
+    """Creates a quaternion from the inverse of a set of Euler angles.
+
+    Supports stacks of eulers with shape (N,3).
+
+    :param numpy.array eulers: The euler angles, in radians.
+    :param str rotation_order: The rotation order of the eulers.
+    :rtype: numpy.array
+    :return: A quaternion, or a stack of quaternions with shape (N,4).
+    """
+    quat = create_from_eulers( eulers, rotation_order )
+    return conjugate( quat, out = quat )
+
+@batchable( (1, 1), 'pass (N,4) quaternions' )
+def cross( quat1, quat2, out = None ):
     """Returns the cross-product of the two quaternions.
 
     Quaternions are **not** communicative. Therefore, order is important.
 
     This is NOT the same as a vector cross-product.
     Quaternion cross-product is the equivalent of matrix multiplication.
-    """
-    q1x, q1y, q1z, q1w = quat1
-    q2x, q2y, q2z, q2w = quat2
 
-    return numpy.array(
-        [
-            # x = q1.w * q2.x + q1.x * q2.w + q1.z * q2.y - q1.y * q2.z 
-            (q1w * q2x) + (q1x * q2w) + (q1z * q2y) - (q1y * q2z),
-            # y = q1.w * q2.y + q1.y * q2.w + q1.x * q2.z - q1.z * q2.x
-            (q1w * q2y) + (q1y * q2w) + (q1x * q2z) - (q1z * q2x),
-            # z = q1.w * q2.z + q1.z * q2.w + q1.y * q2.x - q1.x * q2.y
-            (q1w * q2z) + (q1z * q2w) + (q1y * q2x) - (q1x * q2y),
-            # w = q1.w * q2.w - q1.x * q2.x - q1.y * q2.y - q1.z * q2.z
-            (q1w * q2w) - (q1x * q2x) - (q1y * q2y) - (q1z * q2z)
-            ]
-        )
+    Supports stacks of quaternions with shape (N,4).
+    A single quaternion may be multiplied against a stack of quaternions.
+
+    :param numpy.array quat1: The first quaternion(s).
+    :param numpy.array quat2: The second quaternion(s).
+    :param numpy.array out: An optional array to store the result in.
+        This may be one of the inputs.
+    :rtype: numpy.array
+    :return: The product of the quaternions.
+    """
+    quat1 = numpy.asarray( quat1 )
+    quat2 = numpy.asarray( quat2 )
+
+    q1x = quat1[ ..., 0 ]
+    q1y = quat1[ ..., 1 ]
+    q1z = quat1[ ..., 2 ]
+    q1w = quat1[ ..., 3 ]
+    q2x = quat2[ ..., 0 ]
+    q2y = quat2[ ..., 1 ]
+    q2z = quat2[ ..., 2 ]
+    q2w = quat2[ ..., 3 ]
+
+    # x = q1.w * q2.x + q1.x * q2.w + q1.z * q2.y - q1.y * q2.z 
+    x = (q1w * q2x) + (q1x * q2w) + (q1z * q2y) - (q1y * q2z)
+    # y = q1.w * q2.y + q1.y * q2.w + q1.x * q2.z - q1.z * q2.x
+    y = (q1w * q2y) + (q1y * q2w) + (q1x * q2z) - (q1z * q2x)
+    # z = q1.w * q2.z + q1.z * q2.w + q1.y * q2.x - q1.x * q2.y
+    z = (q1w * q2z) + (q1z * q2w) + (q1y * q2x) - (q1x * q2y)
+    # w = q1.w * q2.w - q1.x * q2.x - q1.y * q2.y - q1.z * q2.z
+    w = (q1w * q2w) - (q1x * q2x) - (q1y * q2y) - (q1z * q2z)
+
+    # the inputs are no longer needed, so out may be one of them
+    if out is None:
+        out = numpy.empty( x.shape + (4,), dtype = x.dtype )
+    out[ ..., 0 ] = x
+    out[ ..., 1 ] = y
+    out[ ..., 2 ] = z
+    out[ ..., 3 ] = w
+    return out
 
 def is_zero_length( quat ):
     """Checks if a quaternion is zero length.
 
-    :param numpy.array quat: The quaternion to check.
-    :rtype: boolean.
+    :param numpy.array quat: The quaternion(s) to check.
+    :rtype: boolean, numpy.array
     :return: True if the quaternion is zero length, otherwise False.
+        A stack of quaternions will return an array of booleans.
     """
-    return quat[ 0 ] == quat[ 1 ] == quat[ 2 ] == quat[ 3 ] == 0.0
+    return numpy.all( numpy.asarray( quat ) == 0.0, axis = -1 )
 
 def is_non_zero_length( quat ):
     """Checks if a quaternion is not zero length.
@@ -198,13 +271,14 @@ def is_non_zero_length( quat ):
     This is the opposite to 'is_zero_length'.
     This is provided for readabilities sake.
 
-    :param numpy.array quat: The quaternion to check.
-    :rtype: boolean
+    :param numpy.array quat: The quaternion(s) to check.
+    :rtype: boolean, numpy.array
     :return: False if the quaternion is zero length, otherwise True.
+        A stack of quaternions will return an array of booleans.
 
     .. seealso:: is_zero_length
     """
-    return not is_zero_length( quat )
+    return numpy.logical_not( is_zero_length( quat ) )
 
 def squared_length( quat ):
     """Calculates the squared length of a quaternion.
@@ -231,59 +305,64 @@ def length( quat ):
     """
     return vector.length( quat )
 
-def normalise( quat ):
+@batchable( (1,), 'pass (N,4) quaternions' )
+def normalise( quat, out = None ):
     """Ensure a quaternion is unit length (length ~= 1.0).
 
-    The quaternion is **not** changed in place.
-    
-    :param numpy.array quat: The quaternion to normalise.
+    The quaternion is **not** changed in place, unless it is
+    passed as out.
+
+    :param numpy.array quat: The quaternion(s) to normalise.
+    :param numpy.array out: An optional array to store the result in.
     :rtype: numpy.array
     :return: The normalised quaternion(s).
     """
-    return vector.normalise( quat )
+    quat = numpy.asarray( quat )
+    lengths = numpy.sqrt( numpy.sum( quat ** 2, axis = -1 ) )
+    return numpy.divide( quat, lengths[ ..., numpy.newaxis ], out = out )
 
 def get_rotation_angle( quat ):
     """Calculates the rotation around the quaternion's axis.
 
-    :param numpy.array quat: The quaternion.
-    :rtype: float.
+    :param numpy.array quat: The quaternion, or a stack of quaternions.
+    :rtype: float, numpy.array
     :return: The quaternion's rotation about the its axis in radians.
+        A stack of quaternions will return an array of angles.
     """
     # extract the W component
-    thetaOver2 = math.acos( quat[ 3 ] )
+    # clip to avoid NaN values due to numerical imprecision
+    w = numpy.clip( numpy.asarray( quat )[ ..., 3 ], -1.0, 1.0 )
+    thetaOver2 = numpy.arccos( w )
     return thetaOver2 * 2.0
 
 def get_rotation_axis( quat ):
     """Calculates the axis of the quaternion's rotation.
 
-    :param numpy.array quat: The quaternion.
+    Identity quaternions do not have an axis of rotation.
+    These, and quaternions with a rotation too small to
+    calculate the axis of, will return an axis of -Z.
+
+    :param numpy.array quat: The quaternion, or a stack of quaternions.
     :rtype: numpy.array.
     :return: The quaternion's rotation axis.
+        A stack of quaternions will return a stack of axes with shape (N,3).
     """
+    quat = numpy.asarray( quat, dtype = 'float' )
+
     # extract W component
-    sinThetaOver2Sq = 1.0 - (quat[ 3 ] ** 2)
-    
-    if sinThetaOver2Sq <= 0.0:
-        # assert here for the time being
-        assert False
-        print("rotation axis was identity")
-        
-        # identity quaternion or numerical imprecision.
-        # return a valid vector
-        # we'll treat -Z as the default
-        out[:] = [ 0.0, 0.0, -1.0 ]
-        return out
-    
-    oneOverSinThetaOver2 = 1.0 / math.sqrt( sinThetaOver2Sq )
-    
+    sinThetaOver2Sq = 1.0 - (quat[ ..., 3 ] ** 2)
+
+    # identity quaternion or numerical imprecision.
+    identity = sinThetaOver2Sq <= 1.0e-12
+    oneOverSinThetaOver2 = 1.0 / numpy.sqrt( numpy.where( identity, 1.0, sinThetaOver2Sq ) )
+
     # we use the x,y,z values
-    return numpy.array(
-        [
-            quat[ 0 ] * oneOverSinThetaOver2,
-            quat[ 1 ] * oneOverSinThetaOver2,
-            quat[ 2 ] * oneOverSinThetaOver2
-            ]
-        )
+    axis = quat[ ..., 0:3 ] * oneOverSinThetaOver2[ ..., numpy.newaxis ]
+
+    # return a valid vector
+    # we'll treat -Z as the default
+    axis[ identity ] = [ 0.0, 0.0, -1.0 ]
+    return axis
 
 def dot( quat1, quat2 ):
     """Calculate the dot product of quaternions.
@@ -297,122 +376,217 @@ def dot( quat1, quat2 ):
     """
     return vector.dot( quat1, quat2 )
 
-def conjugate( quat ):
+@batchable( (1,), 'pass (N,4) quaternions' )
+def conjugate( quat, out = None ):
     """Calculates a quaternion with the opposite rotation.
 
-    :param numpy.array quat: The quaternion.
+    :param numpy.array quat: The quaternion(s).
+    :param numpy.array out: An optional array to store the result in.
     :rtype: numpy.array.
     :return: A quaternion representing the conjugate.
     """
-
     # invert x,y,z and leave w as is
-    return numpy.array(
-        [
-            -quat[ 0 ],
-            -quat[ 1 ],
-            -quat[ 2 ],
-            quat[ 3 ]
-            ]
+    return numpy.multiply( quat, _conjugate, out = out )
+
+def exp( quat ):
+    """Calculates the exponential of a quaternion.
+
+    For a quaternion q = (v, w), this is::
+
+        exp(q) = e^w * (v / |v| * sin(|v|), cos(|v|))
+
+    The exponential of a pure quaternion (W = 0.0) is a unit
+    quaternion, which can be used to integrate angular velocity::
+
+        # omega is an (N,3) array of angular velocities
+        delta = numpy.zeros( (N,4) )
+        delta[ :, 0:3 ] = omega * (dt * 0.5)
+        quats = quaternion.cross( quaternion.exp( delta ), quats )
+
+    Supports stacks of quaternions with shape (N,4).
+    Quaternions with a zero length vector are handled without
+    a division by zero.
+
+    :param numpy.array quat: The quaternion, or a stack of quaternions.
+    :rtype: numpy.array
+    :return: The exponential of the quaternion.
+    """
+    quat = numpy.asarray( quat, dtype = 'float' )
+    theta = numpy.sqrt( numpy.sum( quat[ ..., 0:3 ] ** 2, axis = -1 ) )
+    scale = numpy.exp( quat[ ..., 3 ] )
+
+    result = numpy.empty( quat.shape )
+    # sinc(x) is sin(pi * x) / (pi * x) and is 1.0 at 0.0
+    result[ ..., 0:3 ] = quat[ ..., 0:3 ] * (scale * numpy.sinc( theta / math.pi ))[ ..., numpy.newaxis ]
+    result[ ..., 3 ] = scale * numpy.cos( theta )
+    return result
+
+def log( quat ):
+    """Calculates the natural logarithm of a quaternion.
+
+    For a quaternion q = (v, w), this is::
+
+        log(q) = (v / |v| * atan2(|v|, w), log(|q|))
+
+    This is the inverse of exp. The vector of the logarithm of a unit
+    quaternion is half its rotation about its axis.
+
+    Supports stacks of quaternions with shape (N,4).
+    Quaternions with a zero length vector and a positive w will have
+    a zero vector. With a negative w, the quaternion is a rotation
+    of 2 pi about any axis, and the X axis is used.
+
+    :param numpy.array quat: The quaternion, or a stack of quaternions.
+    :rtype: numpy.array
+    :return: The logarithm of the quaternion.
+    """
+    quat = numpy.asarray( quat, dtype = 'float' )
+    sin_length = numpy.sqrt( numpy.sum( quat[ ..., 0:3 ] ** 2, axis = -1 ) )
+    length = numpy.sqrt( sin_length ** 2 + quat[ ..., 3 ] ** 2 )
+    theta = numpy.arctan2( sin_length, quat[ ..., 3 ] )
+
+    # as |v| approaches 0 with a positive w, atan2(|v|, w) / |v|
+    # approaches 1 / w. With a negative w, theta approaches pi and
+    # the division is well behaved until |v| is exactly 0
+    small = (sin_length <= 1.0e-12) & (quat[ ..., 3 ] > 0.0)
+    scale = numpy.where(
+        small,
+        1.0 / numpy.where( small, length, 1.0 ),
+        theta / numpy.where( sin_length > 0.0, sin_length, 1.0 )
         )
 
+    result = numpy.empty( quat.shape )
+    result[ ..., 0:3 ] = quat[ ..., 0:3 ] * scale[ ..., numpy.newaxis ]
+    # a rotation of 2 pi has no axis, so use the X axis
+    result[ ..., 0 ] = numpy.where( sin_length > 0.0, result[ ..., 0 ], theta )
+    with numpy.errstate( divide = 'ignore' ):
+        result[ ..., 3 ] = numpy.log( length )
+    return result
+
 def power( quat, exponent ):
-    """Multiplies the quaternion by the exponent.
+    """Raises the quaternion to the power of the exponent.
 
+    This scales the rotation about the quaternion's axis.
     The quaternion is **not** changed in place.
 
+    Supports stacks of quaternions with shape (N,4) and / or
+    an array of exponents with shape (N,).
+    Identity quaternions are returned unchanged.
+
     :param numpy.array quat: The quaternion.
-    :param float scalar: The exponent.
+    :param float exponent: The exponent.
     :rtype: numpy.array.
     :return: A quaternion representing the original quaternion
         to the specified power.
     """
-    # check for identify quaternion
-    if math.fabs( quat[ w ] ) > 0.9999:
-        # assert for the time being
-        assert False
-        print("rotation axis was identity")
-        
-        out[:] = quat
-        return out
-    
-    alpha = math.acos( quat[ index.w ] )
-    newAlpha = alpha * exponent
-    multi = math.sin( newAlpha ) / math.sin( alpha )
-    
-    return numpy.array(
-        [
-            # x
-            quat[ index.x ] * multi,
-            # y
-            quat[ index.y ] * multi,
-            # z
-            quat[ index.z ] * multi,
-            # w
-            math.cos( newAlpha )
-            ]
-        )
+    exponent = numpy.asarray( exponent, dtype = 'float' )[ ..., numpy.newaxis ]
+    return exp( log( quat ) * exponent )
 
-def inverse( quat ):
+@batchable( (1,), 'pass (N,4) quaternions' )
+def inverse( quat, out = None ):
     """Calculates the inverse quaternion.
 
     The inverse of a quaternion is defined as
     the conjugate of the quaternion divided
     by the magnitude of the original quaternion.
 
-    :param numpy.array quat: The quaternion to invert.
+    :param numpy.array quat: The quaternion(s) to invert.
+    :param numpy.array out: An optional array to store the result in.
     :rtype: numpy.array.
     :return: The inverse of the quaternion.
     """
-    return conjugate( quat ) / squared_length( quat )
+    quat = numpy.asarray( quat )
+    lengths = squared_length( quat )
+    out = conjugate( quat, out = out )
+    out /= lengths[ ..., numpy.newaxis ]
+    return out
 
-def negate( quat ):
+def negate( quat, out = None ):
     """Calculates the negated quaternion.
 
     This is essentially the quaternion * -1.0.
 
-    :param numpy.array quat: The quaternion.
+    :param numpy.array quat: The quaternion(s).
+    :param numpy.array out: An optional array to store the result in.
     :rtype: numpy.array
     :return: The negated quaternion.
     """
-    return quat * -1.0
+    return numpy.negative( quat, out = out )
+
+@batchable( (1, 1, 0), 'pass (N,4) quaternions' )
+def slerp( quat1, quat2, delta ):
+    """Spherically interpolates between quaternions.
 
+    The interpolation takes the shortest path between the rotations.
+    Quaternions that are very close together are linearly
+    interpolated to avoid dividing by a small value.
+
+    Supports stacks of quaternions with shape (N,4) and / or
+    an array of deltas with shape (N,).
+
+    :param numpy.array quat1: The quaternion(s) to interpolate from.
+    :param numpy.array quat2: The quaternion(s) to interpolate to.
+    :param float delta: The interpolation percentage to apply,
+        where 0.0 <= delta <= 1.0.
+        When delta is 0.0, the result will be quat1.
+        When delta is 1.0, the result will be quat2.
+    :rtype: numpy.array
+    :return: The interpolated unit quaternion(s).
+    """
+    quat1 = numpy.asarray( quat1, dtype = 'float' )
+    quat2 = numpy.asarray( quat2, dtype = 'float' )
+    delta = numpy.asarray( delta, dtype = 'float' )[ ..., numpy.newaxis ]
+
+    # take the shortest path by flipping quat2 into
+    # the same hemisphere as quat1
+    cos_theta = dot( quat1, quat2 )[ ..., numpy.newaxis ]
+    quat2 = numpy.where( cos_theta < 0.0, -quat2, quat2 )
+    cos_theta = numpy.clip( numpy.absolute( cos_theta ), 0.0, 1.0 )
+
+    theta = numpy.arccos( cos_theta )
+    sin_theta = numpy.sin( theta )
+
+    # fall back to a linear interpolation when the
+    # quaternions are too close together
+    small = sin_theta < 1.0e-6
+    sin_theta = numpy.where( small, 1.0, sin_theta )
+    scale1 = numpy.where( small, 1.0 - delta, numpy.sin( (1.0 - delta) * theta ) / sin_theta )
+    scale2 = numpy.where( small, delta, numpy.sin( delta * theta ) / sin_theta )
+
+    result = (quat1 * scale1) + (quat2 * scale2)
+    return normalise( result, out = result )
+
+@batchable( (1, 1), 'pass (N,3) vectors and / or (N,4) quaternions' )
 def apply_to_vector( quat, vec ):
     """Rotates a vector by a quaternion.
 
-    :param numpy.array quat: The quaternion.
-    :param numpy.array vec: The vector.
+    Supports stacks of quaternions and / or vectors, which are
+    broadcast against each other.
+    The W value of 4D vectors is not changed.
+
+    :param numpy.array quat: The quaternion(s).
+    :param numpy.array vec: The vector(s).
     :rtype: numpy.array
     :return: The vector rotated by the quaternion.
 
     .. seealso:: http://content.gpwiki.org/index.php/OpenGL:Tutorials:Using_Quaternions_to_represent_rotation
     """
-    def apply( quat, vec3 ):
-        """
-        v = numpy.array( vec )
-        return v + 2.0 * vector.cross(
-            quat[:-1],
-            vector.cross( quat[:-1], v ) + (quat[-1] * v)
-            )
-        """
-        length = vector.length( vec3 )
-        vec3 = vector.normalise( vec3 )
-
-        # use the vector to create a new quaternion
-        # this is basically the vector3 to vector4 conversion with W = 0
-        vec_quat = numpy.array( [ vec3[ 0 ], vec3[ 1 ], vec3[ 2 ], 0.0 ] )
-
-        # quat * vec * quat^-1
-        result = cross( quat, cross( vec_quat, conjugate( quat ) ) )
-        return result[ :-1 ] * length
-
-    if vec.size == 3:
-        # convert to vector4
-        # ignore w component
-        return apply( quat, vec )
-    elif vec.size == 4:
-        vec3 = vector3.create_from_vector4( vec )
-        vec3 = apply( quat, vec3 )
-        return vector4.create_from_vector3( vec3 )
-    else:
+    quat = numpy.asarray( quat )
+    vec = numpy.asarray( vec )
+
+    if vec.shape[ -1 ] not in ( 3, 4 ):
         raise ValueError( "Vector size unsupported" )
 
+    # use the vector to create a new quaternion
+    # this is basically the vector3 to vector4 conversion with W = 0
+    vec_quat = numpy.zeros( vec.shape[ :-1 ] + (4,) )
+    vec_quat[ ..., 0:3 ] = vec[ ..., 0:3 ]
+
+    # quat * vec * quat^-1
+    result = cross( quat, cross( vec_quat, conjugate( quat ) ) )
+
+    if vec.shape[ -1 ] == 3:
+        return result[ ..., 0:3 ]
+
+    result[ ..., 3 ] = vec[ ..., 3 ]
+    return result
@@ -5,13 +5,16 @@ Rectangles are represented using a numpy.array of shape (2,2,).
 
 The first value is a vector of x, y position of the rectangle.
 The second value is a vector with the width, height of the rectangle.
+
+Stacks of rectangles with shape (N,2,2) are supported by every function.
+Functions which return a single value for a rectangle return an array
+of values for a stack.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
-import math
 
 import numpy
 
-from pyrr.utils import all_parameters_as_numpy_arrays, parameters_as_numpy_arrays
+from pyrr.utils import all_parameters_as_numpy_arrays
 
 
 class index:
@@ -31,16 +34,20 @@ def create_from_position( x, y, width, height, dtype = None ):
     This function will interpret the values literally. A negative width
     or height will be represented by the returned value.
 
+    Arrays of values will create a stack of rectangles.
+
     :rtype: numpy.array
     :return: Returns a rectangle with the specified values.
     """
-    return numpy.array(
+    x, y, width, height = numpy.broadcast_arrays( x, y, width, height )
+    rect = numpy.stack(
         [
-            [ x, y ],
-            [ width, height ]
+            numpy.stack( [ x, y ], axis = -1 ),
+            numpy.stack( [ width, height ], axis = -1 ),
             ],
-        dtype = dtype
+        axis = -2
         )
+    return rect.astype( dtype ) if dtype else rect
 
 def create_from_bounds( left, right, bottom, top, dtype = None ):
     """Creates a rectangle from the specified boundaries.
@@ -48,15 +55,17 @@ def create_from_bounds( left, right, bottom, top, dtype = None ):
     This caters for the left and right, and for the
     top and bottom being swapped.
 
+    Arrays of values will create a stack of rectangles.
+
     :rtype: numpy.array
     :return: Returns a rectangle with the specified values.
         The rectangle will have a positive width and height
         regardless of the values passed in.
     """
-    xmin = min( left, right )
-    xmax = max( left, right )
-    ymin = min( top, bottom )
-    ymax = max( top, bottom )
+    xmin = numpy.minimum( left, right )
+    xmax = numpy.maximum( left, right )
+    ymin = numpy.minimum( top, bottom )
+    ymax = numpy.maximum( top, bottom )
 
     return create_from_position(
         xmin,
@@ -66,7 +75,6 @@ def create_from_bounds( left, right, bottom, top, dtype = None ):
         dtype
         )
 
-@all_parameters_as_numpy_arrays
 def bounds( rect ):
     """Returns the absolute boundaries of the rectangle.
 
@@ -74,19 +82,33 @@ def bounds( rect ):
 
     :rtype: Tuple of 4 floats
     :return: The absolute left, right, bottom and top of the rectangle.
+        For a stack of rectangles, each value is an array.
     """
-    left = rect[ 0,0 ]
-    right = rect[ 0,0 ] + rect[ 1,0 ]
-    top = rect[ 0,1 ]
-    bottom = rect[ 0,1 ] + rect[ 1,1 ]
+    rect = numpy.asarray( rect )
+    position = rect[ ..., 0, : ]
+    opposite = position + rect[ ..., 1, : ]
 
-    xmin = min( left, right )
-    xmax = max( left, right )
-    ymin = min( top, bottom )
-    ymax = max( top, bottom )
+    xmin, ymin = numpy.rollaxis( numpy.minimum( position, opposite ), -1 )
+    xmax, ymax = numpy.rollaxis( numpy.maximum( position, opposite ), -1 )
 
     return xmin, xmax, ymin, ymax
 
+def normalise( rect ):
+    """Returns rectangles with a positive width and height.
+
+    Rectangles with a negative width or height are moved so that
+    they cover the same area.
+
+    :param numpy.array rect: The rectangle, or stack of rectangles.
+    :rtype: numpy.array
+    :return: The normalised rectangles.
+    """
+    rect = numpy.asarray( rect )
+    result = numpy.empty_like( rect )
+    result[ ..., 0, : ] = rect[ ..., 0, : ] + numpy.minimum( rect[ ..., 1, : ], 0 )
+    result[ ..., 1, : ] = numpy.absolute( rect[ ..., 1, : ] )
+    return result
+
 def position( rect ):
     """Returns the literal position of the rectangle.
 
@@ -96,7 +118,7 @@ def position( rect ):
     :rtype: numpy.array
     :return: The position of the rectangle.
     """
-    return rect[ 0 ]
+    return rect[ ..., 0, : ]
 
 def size( rect ):
     """Returns the literal size of the rectangle.
@@ -106,7 +128,7 @@ def size( rect ):
     :rtype: numpy.array
     :return: The size of the rectangle.
     """
-    return rect[ 1 ]
+    return rect[ ..., 1, : ]
 
 def abs_size( rect ):
     """Returns the absolute size of the rectangle.
@@ -114,7 +136,7 @@ def abs_size( rect ):
     :rtype: numpy.array
     :return: The absolute size of the rectangle.
     """
-    return numpy.absolute( rect[ 1 ] )
+    return numpy.absolute( rect[ ..., 1, : ] )
 
 
 @all_parameters_as_numpy_arrays
@@ -127,7 +149,7 @@ def x( rect ):
     :return: The X position of the rectangle. This value
         will be further right than the 'right' if the width is negative.
     """
-    return rect[ 0,0 ]
+    return rect[ ..., 0, 0 ]
 
 @all_parameters_as_numpy_arrays
 def y( rect ):
@@ -139,7 +161,7 @@ def y( rect ):
     :return: The Y position of the rectangle. This value
         will be above the bottom if the height is negative.
     """
-    return rect[ 0,1 ]
+    return rect[ ..., 0, 1 ]
 
 @all_parameters_as_numpy_arrays
 def width( rect ):
@@ -149,7 +171,7 @@ def width( rect ):
     :return: The width of the rectangle. This can be a
         negative value.
     """
-    return rect[ 1,0 ]
+    return rect[ ..., 1, 0 ]
 
 def abs_width( rect ):
     """Returns the absolute width of the rectangle.
@@ -159,7 +181,7 @@ def abs_width( rect ):
     :rtype: float
     :return: The absolute width of the rectangle.
     """
-    return abs( width( rect ) )
+    return numpy.absolute( width( rect ) )
 
 @all_parameters_as_numpy_arrays
 def height( rect ):
@@ -169,7 +191,7 @@ def height( rect ):
     :return: The height of the rectangle. This can be a
         negative value.
     """
-    return rect[ 1,1 ]
+    return rect[ ..., 1, 1 ]
 
 def abs_height( rect ):
     """Returns the absolute height of the rectangle.
@@ -179,7 +201,7 @@ def abs_height( rect ):
     :rtype: float
     :return: The absolute height of the rectangle.
     """
-    return abs( height( rect ) )
+    return numpy.absolute( height( rect ) )
 
 @all_parameters_as_numpy_arrays
 def top( rect ):
@@ -190,9 +212,9 @@ def top( rect ):
     :rtype: float
     :return: The biggest Y value.
     """
-    return max(
-        rect[ 0,1 ],
-        rect[ 0,1 ] + rect[ 1,1 ]
+    return numpy.maximum(
+        rect[ ..., 0, 1 ],
+        rect[ ..., 0, 1 ] + rect[ ..., 1, 1 ]
         )
 
 @all_parameters_as_numpy_arrays
@@ -204,9 +226,9 @@ def bottom( rect ):
     :rtype: float
     :return: The smallest Y value.
     """
-    return min(
-        rect[ 0,1 ],
-        rect[ 0,1 ] + rect[ 1,1 ]
+    return numpy.minimum(
+        rect[ ..., 0, 1 ],
+        rect[ ..., 0, 1 ] + rect[ ..., 1, 1 ]
         )
 
 @all_parameters_as_numpy_arrays
@@ -218,9 +240,9 @@ def left( rect ):
     :rtype: float
     :return: The smallest X value.
     """
-    return min(
-        rect[ 0,0 ],
-        rect[ 0,0 ] + rect[ 1,0 ]
+    return numpy.minimum(
+        rect[ ..., 0, 0 ],
+        rect[ ..., 0, 0 ] + rect[ ..., 1, 0 ]
         )
 
 @all_parameters_as_numpy_arrays
@@ -232,12 +254,12 @@ def right( rect ):
     :rtype: float
     :return: The biggest X value.
     """
-    return max(
-        rect[ 0,0 ],
-        rect[ 0,0 ] + rect[ 1,0 ]
+    return numpy.maximum(
+        rect[ ..., 0, 0 ],
+        rect[ ..., 0, 0 ] + rect[ ..., 1, 0 ]
         )
 
-@parameters_as_numpy_arrays( 'rect' )
+@all_parameters_as_numpy_arrays
 def scale_by_vector( rect, vec ):
     """Scales a rectangle by a 2D vector.
 
@@ -250,12 +272,14 @@ def scale_by_vector( rect, vec ):
 
     :param numpy.array rect: the rectangle to scale.
         Both x,y and width,height will be scaled.
+        May be a stack of rectangles with shape (N,2,2).
     :param vec: A 2D vector to scale the rect by.
+        May be a stack of vectors with shape (N,2).
     :rtype: numpy.array.
     """
-    if rect.shape != (2,2):
+    if rect.shape[ -2: ] != (2,2):
         raise ValueError( "Rect must be shape (2,2)" )
-    if len(vec) != 2:
+    if vec.shape[ -1: ] != (2,):
         raise ValueError( "Vec must be length 2" )
-    return rect * vec
+    return rect * vec[ ..., numpy.newaxis, : ]
 
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""Provides a spatial index for finding rectangles quickly.
+
+The index is a packed R-tree stored as arrays. Rectangles are sorted
+along a Z-order curve and grouped into nodes of node_size children,
+so each level of the tree is a grid of cells similar to a quadtree.
+Queries descend the tree one level at a time, testing every candidate
+node of every query at once, which reduces the cost of a query from
+O(N) to roughly O(log N + k), where k is the number of results.
+
+Each rectangle is identified by its index in the array the tree was
+created from. Inserted rectangles are given the following ids::
+
+    >>> tree = pyrr.rtree.RTree( sprites )
+    >>> tree.query_point( [ 10.0, 20.0 ] )
+    array([ 3, 41])
+
+Rectangles may be moved with update. The bounds of the nodes above
+each rectangle are grown or shrunk to fit, which is fast but may
+reduce the quality of the tree if rectangles move far from their
+neighbours. Call rebuild to sort the rectangles again.
+
+Inserted rectangles are tested individually until the tree is rebuilt,
+which happens automatically once enough have been inserted.
+
+Each query accepts a single query or a stack of queries. A single
+query returns an array of the ids found. A stack of queries returns a
+tuple of two arrays, the index of each query and the id found, with
+one value for every pair of query and rectangle that intersect.
+Results are sorted by query and then by id.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import numpy
+
+from pyrr import rectangle
+
+
+def _create_bounds( rects ):
+    # converts rectangles into an array of (N,2,2) min and max corners
+    rects = rectangle.normalise( numpy.asarray( rects, dtype = 'float' ).reshape( -1, 2, 2 ) )
+    return numpy.stack( [ rects[ :, 0 ], rects[ :, 0 ] + rects[ :, 1 ] ], axis = 1 )
+
+def _create_empty( count ):
+    # bounds which fail every test
+    bounds = numpy.empty( (count, 2, 2) )
+    bounds[ :, 0 ] = numpy.inf
+    bounds[ :, 1 ] = -numpy.inf
+    return bounds
+
+def _pad( bounds, size ):
+    return numpy.concatenate( [ bounds, _create_empty( -len( bounds ) % size ) ] )
+
+def _merge( children ):
+    # merges the bounds along the second axis
+    return numpy.stack( [ children[ :, :, 0 ].min( axis = 1 ), children[ :, :, 1 ].max( axis = 1 ) ], axis = 1 )
+
+def _spread( values ):
+    # spreads the bits of 16 bit integers out to every second bit
+    values = values & 0x0000ffff
+    values = (values | (values << 8)) & 0x00ff00ff
+    values = (values | (values << 4)) & 0x0f0f0f0f
+    values = (values | (values << 2)) & 0x33333333
+    values = (values | (values << 1)) & 0x55555555
+    return values
+
+def _results( single, results ):
+    return results[ 1 ] if single else results
+
+def _z_order( bounds ):
+    centres = (bounds[ :, 0 ] + bounds[ :, 1 ]) * 0.5
+    minimum = centres.min( axis = 0 )
+    extent = numpy.maximum( centres.max( axis = 0 ) - minimum, 1e-12 )
+    cells = ((centres - minimum) / extent * 0xffff).astype( 'uint64' )
+    codes = _spread( cells[ :, 0 ] ) | (_spread( cells[ :, 1 ] ) << numpy.uint64( 1 ))
+    return numpy.argsort( codes, kind = 'stable' )
+
+
+class RTree( object ):
+    """An array based R-tree of 2D rectangles.
+
+    :param numpy.array rects: The rectangles to index with shape (N,2,2).
+        Rectangles may have negative sizes.
+    :param int node_size: The number of children of each node.
+    """
+
+    def __init__( self, rects = None, node_size = 16 ):
+        if node_size < 2:
+            raise ValueError( "Nodes must have at least 2 children" )
+        self.node_size = node_size
+
+        if rects is None:
+            self._bounds = _create_empty( 0 )
+        else:
+            self._bounds = _create_bounds( rects )
+        self._alive = numpy.ones( len( self._bounds ), dtype = 'bool' )
+        self.rebuild()
+
+    def __len__( self ):
+        return int( numpy.count_nonzero( self._alive ) )
+
+    @property
+    def ids( self ):
+        """The ids of the rectangles in the tree.
+        """
+        return numpy.flatnonzero( self._alive )
+
+    @property
+    def depth( self ):
+        """The number of levels in the tree, including the rectangles.
+        """
+        return len( self._levels )
+
+    def rebuild( self ):
+        """Sorts every rectangle into the tree again.
+        """
+        size = self.node_size
+        ids = numpy.flatnonzero( self._alive )
+        if len( ids ):
+            ids = ids[ _z_order( self._bounds[ ids ] ) ]
+
+        self._order = ids
+        self._slot = numpy.full( len( self._bounds ), -1, dtype = 'intp' )
+        self._slot[ ids ] = numpy.arange( len( ids ) )
+        self._pending = numpy.empty( 0, dtype = 'intp' )
+
+        levels = [ _pad( self._bounds[ ids ], size ) ]
+        while len( levels[ -1 ] ) > size:
+            parents = _merge( levels[ -1 ].reshape( -1, size, 2, 2 ) )
+            levels.append( _pad( parents, size ) )
+        self._levels = levels
+
+    def insert( self, rects ):
+        """Adds rectangles to the tree.
+
+        :param numpy.array rects: A rectangle, or stack of rectangles.
+        :rtype: numpy.array
+        :return: The ids of the new rectangles.
+        """
+        bounds = _create_bounds( rects )
+        ids = numpy.arange( len( self._bounds ), len( self._bounds ) + len( bounds ) )
+
+        self._bounds = numpy.concatenate( [ self._bounds, bounds ] )
+        self._alive = numpy.concatenate( [ self._alive, numpy.ones( len( ids ), dtype = 'bool' ) ] )
+        self._slot = numpy.concatenate( [ self._slot, numpy.full( len( ids ), -1, dtype = 'intp' ) ] )
+        self._pending = numpy.concatenate( [ self._pending, ids ] )
+
+        if len( self._pending ) > max( self.node_size ** 2, len( self._order ) // 4 ):
+            self.rebuild()
+        return ids
+
+    def update( self, ids, rects ):
+        """Moves or resizes rectangles in the tree.
+
+        :param numpy.array ids: The id, or array of ids, to update.
+        :param numpy.array rects: The new rectangles.
+        """
+        ids = numpy.atleast_1d( numpy.asarray( ids, dtype = 'intp' ) )
+        bounds = numpy.broadcast_to( _create_bounds( rects ), (len( ids ), 2, 2) )
+        if not numpy.all( self._alive[ ids ] ):
+            raise ValueError( "Rectangles which were removed cannot be updated" )
+        self._set_bounds( ids, bounds )
+
+    def remove( self, ids ):
+        """Removes rectangles from the tree.
+
+        The ids of removed rectangles are not reused.
+
+        :param numpy.array ids: The id, or array of ids, to remove.
+        """
+        ids = numpy.atleast_1d( numpy.asarray( ids, dtype = 'intp' ) )
+        self._alive[ ids ] = False
+        self._set_bounds( ids, _create_empty( len( ids ) ) )
+        self._pending = self._pending[ self._alive[ self._pending ] ]
+
+    def _set_bounds( self, ids, bounds ):
+        self._bounds[ ids ] = bounds
+
+        slots = self._slot[ ids ]
+        indexed = slots >= 0
+        slots = slots[ indexed ]
+        levels = self._levels
+        levels[ 0 ][ slots ] = bounds[ indexed ]
+
+        # refit the nodes above the changed rectangles
+        size = self.node_size
+        for depth in range( 1, len( levels ) ):
+            slots = numpy.unique( slots // size )
+            children = slots[ :, numpy.newaxis ] * size + numpy.arange( size )
+            levels[ depth ][ slots ] = _merge( levels[ depth - 1 ][ children ] )
+
+    def _search( self, count, test ):
+        # finds every pair of query and rectangle which pass the test
+        size = self.node_size
+        levels = self._levels
+
+        top = len( levels[ -1 ] )
+        query = numpy.repeat( numpy.arange( count ), top )
+        node = numpy.tile( numpy.arange( top ), count )
+        for depth in range( len( levels ) - 1, -1, -1 ):
+            hit = test( levels[ depth ][ node ], query )
+            query, node = query[ hit ], node[ hit ]
+            if depth:
+                query = numpy.repeat( query, size )
+                node = (node[ :, numpy.newaxis ] * size + numpy.arange( size )).ravel()
+        ids = self._order[ node ]
+
+        # rectangles which were inserted since the tree was built
+        if len( self._pending ):
+            pending_query = numpy.repeat( numpy.arange( count ), len( self._pending ) )
+            pending_ids = numpy.tile( self._pending, count )
+            hit = test( self._bounds[ pending_ids ], pending_query )
+            query = numpy.concatenate( [ query, pending_query[ hit ] ] )
+            ids = numpy.concatenate( [ ids, pending_ids[ hit ] ] )
+
+        order = numpy.lexsort( (ids, query) )
+        return query[ order ], ids[ order ]
+
+    def query_point( self, point ):
+        """Finds the rectangles which contain points.
+
+        Points on the edge of a rectangle are inside it.
+
+        :param numpy.array point: A point, or stack of points with shape (Q,2).
+        :rtype: numpy.array
+        :return: The ids found for a single point, or a tuple of the
+            query indices and ids for a stack of points.
+        """
+        point = numpy.asarray( point, dtype = 'float' )
+        single = point.ndim == 1
+        points = point.reshape( -1, 2 )
+
+        def test( bounds, query ):
+            p = points[ query ]
+            return numpy.all( (bounds[ :, 0 ] <= p) & (p <= bounds[ :, 1 ]), axis = -1 )
+        return _results( single, self._search( len( points ), test ) )
+
+    def query_rectangle( self, rect ):
+        """Finds the rectangles which overlap, or touch, rectangles.
+
+        :param numpy.array rect: A rectangle, or stack of rectangles with shape (Q,2,2).
+        :rtype: numpy.array
+        :return: The ids found for a single rectangle, or a tuple of the
+            query indices and ids for a stack of rectangles.
+        """
+        rect = numpy.asarray( rect, dtype = 'float' )
+        single = rect.ndim == 2
+        rects = _create_bounds( rect )
+
+        def test( bounds, query ):
+            r = rects[ query ]
+            return numpy.all( (r[ :, 0 ] <= bounds[ :, 1 ]) & (bounds[ :, 0 ] <= r[ :, 1 ]), axis = -1 )
+        return _results( single, self._search( len( rects ), test ) )
+
+    def query_radius( self, point, radius ):
+        """Finds the rectangles within a distance of points.
+
+        :param numpy.array point: A point, or stack of points with shape (Q,2).
+        :param radius: The distance, or an array of distances for each point.
+        :rtype: numpy.array
+        :return: The ids found for a single point, or a tuple of the
+            query indices and ids for a stack of points.
+        """
+        point = numpy.asarray( point, dtype = 'float' )
+        single = point.ndim == 1
+        points = point.reshape( -1, 2 )
+        squared = numpy.broadcast_to( numpy.asarray( radius, dtype = 'float' ) ** 2, (len( points ), ) )
+
+        def test( bounds, query ):
+            p = points[ query ]
+            # the distance to the closest point of the rectangle
+            distance = numpy.maximum( numpy.maximum( bounds[ :, 0 ] - p, p - bounds[ :, 1 ] ), 0.0 )
+            return numpy.sum( distance * distance, axis = -1 ) <= squared[ query ]
+        return _results( single, self._search( len( points ), test ) )
@@ -8,15 +8,25 @@ The fourth value is the sphere's radius.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import itertools
+
 import numpy
 
-from pyrr.utils import all_parameters_as_numpy_arrays
+from pyrr.utils import all_parameters_as_numpy_arrays, batchable, reduce_segment_ids, segment_ids_from_offsets
+
+
+#: Points within this fraction of the radius outside a bounding sphere
+#: are considered to be inside it.
+tolerance = 1e-10
+
 
 @all_parameters_as_numpy_arrays
 def create_from_points( points ):
     """Creates a sphere centred around 0,0,0 that encompasses
     the furthest point in the provided list.
 
+    Use create_bounding for a sphere centred on the points.
+
     :param numpy.array points: An Nd array of vectors.
     :rtype: A sphere as a two value tuple.
     """
@@ -35,6 +45,229 @@ def create_from_points( points ):
     radius = numpy.sqrt( maximum )
     return numpy.array( [ 0.0, 0.0, 0.0, radius ] )
 
+def create_from_segments( points, offsets ):
+    """Creates a sphere centred around 0,0,0 for each object in a set
+    of points, in the same way as create_from_points.
+
+    The points of every object are concatenated into one array.
+    The offsets are the index of the first point of each object,
+    as used by numpy.maximum.reduceat.
+
+    :param numpy.array points: The points of every object with shape (M,3).
+    :param numpy.array offsets: The index of the first point of each
+        object with shape (K,).
+    :raise ValueError: raised if an object has no points.
+    :rtype: numpy.array
+    :return: The spheres with shape (K,4).
+    """
+    points = numpy.asarray( points )
+    offsets, _ = segment_ids_from_offsets( offsets, len( points ) )
+    lengths = numpy.sum( points * points, axis = -1 )
+    radii = numpy.sqrt( numpy.maximum.reduceat( lengths, offsets ) )
+
+    spheres = numpy.zeros( (len( offsets ), 4) )
+    spheres[ :, 3 ] = radii
+    return spheres
+
+def create_from_segment_ids( points, segment_ids, count = None ):
+    """Creates a sphere centred around 0,0,0 for each object in a set
+    of points.
+
+    The points may be in any order.
+    Objects with no points have NaN spheres.
+
+    :param numpy.array points: The points of every object with shape (M,3).
+    :param numpy.array segment_ids: The object of each point with shape (M,).
+    :param int count: The number of objects. Defaults to the largest
+        id plus 1.
+    :rtype: numpy.array
+    :return: The spheres with shape (K,4).
+    """
+    return reduce_segment_ids( create_from_segments, points, segment_ids, count )
+
+def _farthest( points, centres, ids, offsets ):
+    # the index of, and squared distance to, the point in each
+    # segment which is farthest from the segment's centre
+    delta = points - centres[ ids ]
+    distances = numpy.sum( delta * delta, axis = -1 )
+    maximum = numpy.maximum.reduceat( distances, offsets )
+    candidates = numpy.flatnonzero( distances == maximum[ ids ] )
+    _, first = numpy.unique( ids[ candidates ], return_index = True )
+    return candidates[ first ], maximum
+
+def _ritter( points, offsets, ids ):
+    # start with the two points which are far apart in each segment,
+    # then grow each sphere to include the farthest point outside it
+    # until every point is inside
+    far, _ = _farthest( points, points[ offsets ], ids, offsets )
+    other, _ = _farthest( points, points[ far ], ids, offsets )
+    centres = (points[ far ] + points[ other ]) * 0.5
+    radii = numpy.sqrt( numpy.sum( (points[ far ] - centres) ** 2, axis = -1 ) )
+
+    while True:
+        far, squared = _farthest( points, centres, ids, offsets )
+        distances = numpy.sqrt( squared )
+        outside = distances > radii * (1.0 + tolerance)
+        if not numpy.any( outside ):
+            return numpy.concatenate( [ centres, radii[ :, numpy.newaxis ] ], axis = -1 )
+
+        # move the centre towards the point so the new sphere
+        # touches the point and the far side of the old sphere
+        distances = distances[ outside ]
+        grown = (radii[ outside ] + distances) * 0.5
+        direction = (points[ far[ outside ] ] - centres[ outside ]) / distances[ :, numpy.newaxis ]
+        centres[ outside ] += direction * (grown - radii[ outside ])[ :, numpy.newaxis ]
+        radii[ outside ] = grown
+
+def _circumsphere( points ):
+    # the smallest sphere with every point on its surface,
+    # or None if the points are degenerate
+    a = points[ 0 ]
+    if len( points ) == 1:
+        return a, 0.0
+    if len( points ) == 2:
+        centre = (a + points[ 1 ]) * 0.5
+        return centre, numpy.sqrt( numpy.sum( (points[ 1 ] - centre) ** 2 ) )
+
+    # the centre lies in the space of the points, solve for the
+    # weights of the edges from the first point which are
+    # equidistant from every point
+    edges = points[ 1: ] - a
+    gram = numpy.dot( edges, edges.T )
+    if abs( numpy.linalg.det( gram ) ) <= 1e-12 * numpy.prod( numpy.diagonal( gram ) ):
+        return None
+    weights = numpy.linalg.solve( 2.0 * gram, numpy.diagonal( gram ) )
+    offset = numpy.dot( weights, edges )
+    return a + offset, numpy.sqrt( numpy.sum( offset ** 2 ) )
+
+def _minimum_sphere( support ):
+    # the smallest sphere containing up to 5 points, and the points
+    # on its surface, found by testing the sphere of every subset
+    best = None
+    for size in range( 1, min( len( support ), 4 ) + 1 ):
+        for subset in itertools.combinations( range( len( support ) ), size ):
+            sphere = _circumsphere( support[ list( subset ) ] )
+            if sphere is None or (best is not None and sphere[ 1 ] >= best[ 1 ]):
+                continue
+            centre, radius = sphere
+            distances = numpy.sqrt( numpy.sum( (support - centre) ** 2, axis = -1 ) )
+            if numpy.all( distances <= radius * (1.0 + tolerance) + 1e-12 ):
+                best = centre, radius, support[ list( subset ) ]
+    return best
+
+def _exact( points ):
+    # add the farthest point outside the smallest sphere of the support
+    # points to the support, until no point is outside, the radius grows
+    # each step so this ends with the smallest sphere of every point
+    support = points[ :1 ]
+    while True:
+        centre, radius, support = _minimum_sphere( support )
+        distances = numpy.sum( (points - centre) ** 2, axis = -1 )
+        farthest = numpy.argmax( distances )
+        if numpy.sqrt( distances[ farthest ] ) <= radius * (1.0 + tolerance) + 1e-12:
+            return numpy.append( centre, radius )
+        support = numpy.concatenate( [ support, points[ farthest:farthest + 1 ] ] )
+
+@batchable( (2,), 'use create_bounding_from_segments with the concatenated points' )
+def create_bounding( points, exact = False ):
+    """Creates a sphere which tightly encloses a set of points.
+
+    Unlike create_from_points, the sphere is centred on the points.
+
+    By default Ritter's algorithm is used, which is fast and creates a
+    sphere which is usually 5 to 20 percent larger than the smallest
+    possible sphere, and depends on the order of the points.
+    When exact is True, the smallest enclosing sphere
+    is found, using the pivoting form of Welzl's algorithm.
+
+    :param numpy.array points: The points with shape (M,3).
+    :param boolean exact: True to find the smallest enclosing sphere.
+    :rtype: numpy.array
+    :return: The bounding sphere.
+
+    .. seealso:: Ritter, "An Efficient Bounding Sphere", Graphics Gems.
+    .. seealso:: Welzl, "Smallest enclosing disks (balls and ellipsoids)".
+    """
+    return create_bounding_from_segments( points, [ 0 ], exact )[ 0 ]
+
+def create_bounding_from_segments( points, offsets, exact = False ):
+    """Creates a bounding sphere for each object in a set of points.
+
+    The points of every object are concatenated into one array.
+    The offsets are the index of the first point of each object,
+    as used by numpy.add.reduceat.
+
+    The Ritter algorithm processes every object at once.
+    The exact algorithm processes each object in turn.
+
+    :param numpy.array points: The points of every object with shape (M,3).
+    :param numpy.array offsets: The index of the first point of each
+        object with shape (K,).
+    :param boolean exact: True to find the smallest enclosing spheres.
+    :raise ValueError: raised if an object has no points.
+    :rtype: numpy.array
+    :return: The bounding spheres with shape (K,4).
+
+    .. seealso:: create_bounding
+    """
+    points = numpy.asarray( points, dtype = 'float' )
+    offsets, ids = segment_ids_from_offsets( offsets, len( points ) )
+    if not exact:
+        return _ritter( points, offsets, ids )
+    return numpy.array( [ _exact( segment ) for segment in numpy.split( points, offsets[ 1: ] ) ] )
+
+def create_bounding_from_segment_ids( points, segment_ids, count = None, exact = False ):
+    """Creates a bounding sphere for each object in a set of points.
+
+    The points may be in any order.
+    Objects with no points have NaN spheres.
+
+    :param numpy.array points: The points of every object with shape (M,3).
+    :param numpy.array segment_ids: The object of each point with shape (M,).
+    :param int count: The number of objects. Defaults to the largest
+        id plus 1.
+    :param boolean exact: True to find the smallest enclosing spheres.
+    :rtype: numpy.array
+    :return: The bounding spheres with shape (K,4).
+
+    .. seealso:: create_bounding
+    """
+    def reduce( points, offsets ):
+        return create_bounding_from_segments( points, offsets, exact )
+    return reduce_segment_ids( reduce, points, segment_ids, count )
+
+@batchable( (1, 1), 'pass (N,4) spheres' )
+def merge( sphere1, sphere2 ):
+    """Creates the smallest sphere which encloses two spheres.
+
+    Supports stacks of spheres with shape (N,4), which are broadcast
+    against each other.
+
+    :param numpy.array sphere1: The first sphere, or stack of spheres.
+    :param numpy.array sphere2: The second sphere, or stack of spheres.
+    :rtype: numpy.array
+    :return: The merged sphere, or stack of spheres.
+    """
+    sphere1, sphere2 = numpy.broadcast_arrays(
+        numpy.asarray( sphere1, dtype = 'float' ),
+        numpy.asarray( sphere2, dtype = 'float' )
+        )
+    delta = sphere2[ ..., 0:3 ] - sphere1[ ..., 0:3 ]
+    distance = numpy.sqrt( numpy.sum( delta * delta, axis = -1 ) )
+    r1 = sphere1[ ..., 3 ]
+    r2 = sphere2[ ..., 3 ]
+
+    radius = (distance + r1 + r2) * 0.5
+    # spheres which are inside the other are replaced below
+    scale = (radius - r1) / numpy.where( distance > 0.0, distance, 1.0 )
+    result = numpy.concatenate(
+        [ sphere1[ ..., 0:3 ] + delta * scale[ ..., numpy.newaxis ], radius[ ..., numpy.newaxis ] ],
+        axis = -1
+        )
+
+    result = numpy.where( (distance + r2 <= r1)[ ..., numpy.newaxis ], sphere1, result )
+    return numpy.where( (distance + r1 <= r2)[ ..., numpy.newaxis ], sphere2, result )
+
 @all_parameters_as_numpy_arrays
 def position( sphere ):
     """Returns the position of the sphere.
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Provides functions to process large arrays of points in fixed size chunks.
+
+This allows point clouds that do not fit in memory, such as
+numpy.memmap arrays, to be transformed and bounded with a fixed
+peak memory usage.
+Chunks are read and written in order, so file access is sequential.
+
+Functions that take a source accept either an array, which is split
+into chunks of chunk_size points, or any iterable of point arrays.
+
+Transform and write functions return generators, which do not
+perform any work until they are consumed.
+This allows a single pass over the data to transform the points,
+write them to disk and calculate their bounds::
+
+    source = numpy.load( 'points.npy', mmap_mode = 'r' )
+    destination = numpy.lib.format.open_memmap(
+        'transformed.npy',
+        mode = 'w+',
+        dtype = source.dtype,
+        shape = source.shape
+        )
+
+    bb = stream.create_aabb_from_points(
+        stream.write(
+            stream.apply_matrix44( source, mat ),
+            destination
+            )
+        )
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import numpy
+
+from pyrr import aabb, matrix44
+
+
+#: The default number of points per chunk.
+chunk_size = 2 ** 16
+
+
+def chunks( source, size = None ):
+    """Splits a source of points into chunks.
+
+    :param source: An array of points or an iterable of arrays of points.
+    :param int size: The number of points per chunk when source is an array.
+        Defaults to stream.chunk_size.
+    :rtype: generator
+    :return: A generator of arrays of points.
+        Chunks of memory mapped arrays are views onto the file.
+    """
+    if isinstance( source, numpy.ndarray ):
+        size = size or chunk_size
+        for start in range( 0, len( source ), size ):
+            yield source[ start:start + size ]
+    else:
+        for chunk in source:
+            yield numpy.asarray( chunk )
+
+def apply_matrix44( source, mat, size = None ):
+    """Applies a matrix to each chunk of points.
+
+    :param source: An array of points or an iterable of arrays of points.
+    :param numpy.array mat: The matrix to apply.
+    :param int size: The number of points per chunk when source is an array.
+    :rtype: generator
+    :return: A generator of the transformed chunks.
+
+    .. seealso:: matrix44.apply_to_vector
+    """
+    mat = numpy.asarray( mat )
+    for chunk in chunks( source, size ):
+        yield matrix44.apply_to_vector( mat, chunk )
+
+def write( source, out, size = None ):
+    """Writes each chunk of points into an array, in order.
+
+    The chunks are passed through unchanged so that further
+    operations can be performed on them.
+
+    :param source: An array of points or an iterable of arrays of points.
+    :param numpy.array out: The array to write to. This is normally a
+        numpy.memmap.
+    :param int size: The number of points per chunk when source is an array.
+    :raise ValueError: raised if the source contains more points than out.
+    :rtype: generator
+    :return: A generator of the chunks.
+    """
+    offset = 0
+    for chunk in chunks( source, size ):
+        end = offset + len( chunk )
+        if end > len( out ):
+            raise ValueError( "Source contains more points than the output array" )
+        out[ offset:end ] = chunk
+        offset = end
+        yield chunk
+
+    # ensure memory mapped data is written to disk
+    if isinstance( out, numpy.memmap ):
+        out.flush()
+
+def consume( source, size = None ):
+    """Processes every chunk of a source.
+
+    This is used to run a generator, such as the one returned by write,
+    when the chunks themselves are not needed.
+
+    :param source: An array of points or an iterable of arrays of points.
+    :param int size: The number of points per chunk when source is an array.
+    :rtype: int
+    :return: The number of points processed.
+    """
+    count = 0
+    for chunk in chunks( source, size ):
+        count += len( chunk )
+    return count
+
+def create_aabb_from_points( source, size = None ):
+    """Creates an AABB from a source of points.
+
+    :param source: An array of points or an iterable of arrays of points.
+    :param int size: The number of points per chunk when source is an array.
+    :raise ValueError: raised if the source contains no points.
+    :rtype: numpy.array
+    :return: An AABB which contains every point.
+
+    .. seealso:: aabb.create_from_points
+    """
+    result = None
+    for chunk in chunks( source, size ):
+        if len( chunk ) == 0:
+            continue
+        if result is None:
+            result = aabb.create_from_points( chunk )
+        else:
+            result = aabb.add_points( result, chunk )
+
+    if result is None:
+        raise ValueError( "Source contains no points" )
+    return result
+
+def create_sphere_from_points( source, size = None ):
+    """Creates a sphere centred around 0,0,0 from a source of points.
+
+    :param source: An array of points or an iterable of arrays of points.
+    :param int size: The number of points per chunk when source is an array.
+    :raise ValueError: raised if the source contains no points.
+    :rtype: numpy.array
+    :return: A sphere which contains every point.
+
+    .. seealso:: sphere.create_from_points
+    """
+    maximum = None
+    for chunk in chunks( source, size ):
+        if len( chunk ) == 0:
+            continue
+        chunk_maximum = numpy.amax( numpy.sum( chunk[ ..., 0:3 ] ** 2, axis = -1 ) )
+        if maximum is None or chunk_maximum > maximum:
+            maximum = chunk_maximum
+
+    if maximum is None:
+        raise ValueError( "Source contains no points" )
+    return numpy.array( [ 0.0, 0.0, 0.0, numpy.sqrt( maximum ) ] )
@@ -145,6 +145,109 @@ class test_aabb( unittest.TestCase ):
             "Add AABB failed"
             )
 
+    def test_create_from_segments( self ):
+        random = numpy.random.RandomState( 0 )
+        points = random.normal( size = (50, 3) )
+        offsets = numpy.array( [ 0, 20, 21, 35 ] )
+
+        result = aabb.create_from_segments( points, offsets )
+        self.assertEqual( result.shape, (4, 2, 3) )
+        for index, segment in enumerate( numpy.split( points, offsets[ 1: ] ) ):
+            self.assertTrue(
+                numpy.array_equal( result[ index ], aabb.create_from_points( segment ) ),
+                "Create from segments failed"
+                )
+
+        self.assertRaises( ValueError, aabb.create_from_segments, points, [ 0, 20, 20 ] )
+        self.assertRaises( ValueError, aabb.create_from_segments, points, [ 10, 20 ] )
+
+        def segment_ids():
+            ids = numpy.repeat( numpy.arange( 4 ), numpy.diff( numpy.append( offsets, 50 ) ) )
+            order = random.permutation( 50 )
+            shuffled = aabb.create_from_segment_ids( points[ order ], ids[ order ] )
+            self.assertTrue( numpy.array_equal( shuffled, result ), "Create from segment ids failed" )
+
+            # segments with no points are NaN
+            ids[ ids == 1 ] = 0
+            sparse = aabb.create_from_segment_ids( points, ids, count = 5 )
+            self.assertEqual( sparse.shape, (5, 2, 3) )
+            self.assertTrue( numpy.all( numpy.isnan( sparse[ [ 1, 4 ] ] ) ), "Empty segments not NaN" )
+            self.assertTrue( numpy.array_equal( sparse[ 3 ], result[ 3 ] ), "Create from segment ids failed" )
+
+            self.assertRaises( ValueError, aabb.create_from_segment_ids, points, ids, 3 )
+        segment_ids()
+
+        def no_points():
+            empty = numpy.zeros( (0, 3) )
+            result = aabb.create_from_segment_ids( empty, [], count = 3 )
+            self.assertEqual( result.shape, (3, 2, 3) )
+            self.assertTrue( numpy.all( numpy.isnan( result ) ), "Empty segments not NaN" )
+            self.assertEqual( aabb.create_from_segment_ids( empty, [] ).shape, (0, 2, 3) )
+        no_points()
+
+        def dtypes():
+            single = points.astype( 'float32' )
+            ids = numpy.array( [ 0 ] * 25 + [ 2 ] * 25 )
+            self.assertEqual( aabb.create_from_segment_ids( single, ids ).dtype, numpy.float32 )
+            self.assertEqual( aabb.create_from_segment_ids( single[ :0 ], [], count = 2 ).dtype, numpy.float32 )
+            # integers are promoted so that empty segments can be NaN
+            integers = numpy.arange( 150 ).reshape( 50, 3 )
+            result = aabb.create_from_segment_ids( integers, ids )
+            self.assertTrue( numpy.issubdtype( result.dtype, numpy.floating ), "Integer segments not promoted" )
+            self.assertTrue( numpy.all( numpy.isnan( result[ 1 ] ) ), "Empty segments not NaN" )
+        dtypes()
+
+    def test_transform( self ):
+        obj = aabb.create_from_bounds( [ 1.0, 2.0, 3.0 ], [ 2.0, 4.0, 6.0 ] )
+
+        def translation():
+            matrix = numpy.identity( 4 )
+            matrix[ 3, 0:3 ] = [ 1.0, -1.0, 0.5 ]
+            result = aabb.transform( obj, matrix )
+            self.assertTrue( numpy.allclose( result, obj + [ 1.0, -1.0, 0.5 ] ), "AABB translation incorrect" )
+        translation()
+
+        def corners():
+            # the result encloses the transformed corners exactly
+            random = numpy.random.RandomState( 0 )
+            matrices = random.normal( size = (10, 4, 4) )
+            matrices[ :, 0:3, 3 ] = 0.0
+            matrices[ :, 3, 3 ] = 1.0
+            result = aabb.transform( obj, matrices )
+            self.assertEqual( result.shape, (10, 2, 3) )
+
+            points = numpy.array( [ [ x, y, z, 1.0 ] for x in obj[ :, 0 ] for y in obj[ :, 1 ] for z in obj[ :, 2 ] ] )
+            transformed = numpy.matmul( points, matrices )[ ..., 0:3 ]
+            expected = numpy.stack( [ transformed.min( axis = 1 ), transformed.max( axis = 1 ) ], axis = 1 )
+            self.assertTrue( numpy.allclose( result, expected ), "AABB transform incorrect" )
+
+            # stacks of AABBs with a single matrix
+            stack = aabb.transform( numpy.stack( [ obj, obj * 2.0 ] ), matrices[ 0 ] )
+            self.assertTrue( numpy.allclose( stack[ 0 ], result[ 0 ] ), "AABB stack transform incorrect" )
+        corners()
+
+    def test_clamp_points( self ):
+        obj = aabb.create_from_bounds( [ -1.0, -1.0, -1.0 ], [ 1.0, 2.0, 3.0 ] )
+        points = numpy.array( [
+            [ 0.0, 0.0, 0.0 ],
+            [ 5.0, -5.0, 1.0 ],
+            [ -2.0, 3.0, 4.0 ],
+            ] )
+
+        result = aabb.clamp_points( obj, points )
+        expected = [
+            [ 0.0, 0.0, 0.0 ],
+            [ 1.0, -1.0, 1.0 ],
+            [ -1.0, 2.0, 3.0 ],
+            ]
+        self.assertTrue( numpy.array_equal( result, expected ), "Clamp points incorrect" )
+        self.assertTrue( numpy.array_equal( aabb.clamp_points( obj, points[ 1 ] ), expected[ 1 ] ), "Clamp point incorrect" )
+
+        # every point against every AABB
+        stack = numpy.stack( [ obj, obj * 2.0 ] )
+        result = aabb.clamp_points( stack, points[ :, numpy.newaxis ] )
+        self.assertEqual( result.shape, (3, 2, 3) )
+        self.assertTrue( numpy.array_equal( result[ :, 0 ], expected ), "Clamp points to AABBs incorrect" )
 
 if __name__ == '__main__':
     unittest.main()
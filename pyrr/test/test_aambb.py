@@ -136,6 +136,49 @@ class test_aambb( unittest.TestCase ):
             "Add AABB failed"
             )
 
+    def test_create_from_segments( self ):
+        random = numpy.random.RandomState( 0 )
+        points = random.normal( size = (50, 3) )
+        offsets = numpy.array( [ 0, 20, 21, 35 ] )
+
+        result = aambb.create_from_segments( points, offsets )
+        self.assertEqual( result.shape, (4, 2, 3) )
+        for index, segment in enumerate( numpy.split( points, offsets[ 1: ] ) ):
+            self.assertTrue(
+                numpy.allclose( result[ index ], aambb.create_from_points( segment ) ),
+                "Create from segments failed"
+                )
+
+        ids = numpy.repeat( numpy.arange( 4 ), numpy.diff( numpy.append( offsets, 50 ) ) )
+        order = random.permutation( 50 )
+        shuffled = aambb.create_from_segment_ids( points[ order ], ids[ order ] )
+        self.assertTrue( numpy.allclose( shuffled, result ), "Create from segment ids failed" )
+
+    def test_transform( self ):
+        obj = aambb.create_from_points( numpy.array( [ [ 1.0, 2.0, 2.0 ] ] ) )
+        self.assertTrue( numpy.allclose( obj, [ [ -3.0, -3.0, -3.0 ], [ 3.0, 3.0, 3.0 ] ] ) )
+
+        # rotation does not change the AAMBB
+        rotation = numpy.array( [
+            [ 0.0, 1.0, 0.0, 0.0 ],
+            [ -1.0, 0.0, 0.0, 0.0 ],
+            [ 0.0, 0.0, 1.0, 0.0 ],
+            [ 1.0, 2.0, 3.0, 1.0 ],
+            ] )
+        result = aambb.transform( obj, rotation )
+        self.assertTrue( numpy.allclose( result, obj + [ 1.0, 2.0, 3.0 ] ), "AAMBB rotation incorrect" )
+
+        # the largest scale is used
+        scale = numpy.diag( [ 1.0, 2.0, 0.5, 1.0 ] )
+        result = aambb.transform( numpy.stack( [ obj, obj ] ), numpy.stack( [ scale, rotation ] ) )
+        self.assertTrue( numpy.allclose( result[ 0 ], obj * 2.0 ), "AAMBB scale incorrect" )
+        self.assertTrue( numpy.allclose( result[ 1 ], obj + [ 1.0, 2.0, 3.0 ] ), "AAMBB stack transform incorrect" )
+
+    def test_clamp_points( self ):
+        obj = numpy.array( [ [ -1.0, -1.0, -1.0 ], [ 1.0, 1.0, 1.0 ] ] )
+        points = numpy.array( [ [ 0.0, 0.0, 0.0 ], [ 10.0, -10.0, 0.5 ] ] )
+        result = aambb.clamp_points( obj, points )
+        self.assertTrue( numpy.allclose( result, numpy.clip( points, obj[ 0 ], obj[ 1 ] ) ), "Clamp points incorrect" )
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+
+import numpy
+
+from pyrr import animation
+from pyrr import quaternion
+
+
+class test_animation( unittest.TestCase ):
+
+    def setUp( self ):
+        self.times = [
+            numpy.array( [ 0.0, 1.0, 2.0 ] ),
+            numpy.array( [ 0.5, 3.0 ] ),
+            numpy.array( [ 1.0 ] ),
+            ]
+        self.values = [
+            numpy.array( [ [ 0.0, 0.0, 0.0 ], [ 1.0, 2.0, 3.0 ], [ 0.0, 0.0, 0.0 ] ] ),
+            numpy.array( [ [ 0.0, 0.0, 0.0 ], [ 5.0, 0.0, 0.0 ] ] ),
+            numpy.array( [ [ 7.0, 7.0, 7.0 ] ] ),
+            ]
+
+    def test_track( self ):
+        track = animation.Track( self.times, self.values )
+
+        self.assertEqual( len( track ), 3 )
+        self.assertTrue( numpy.array_equal( track.first, [ 0, 3, 5 ] ) )
+        self.assertTrue( numpy.array_equal( track.last, [ 2, 4, 5 ] ) )
+
+        self.assertRaises( ValueError, animation.Track, [ [] ], [ [] ] )
+        self.assertRaises( ValueError, animation.Track, [ [ 0.0 ] ], [ [ [ 1.0 ], [ 2.0 ] ] ] )
+        self.assertRaises( ValueError, animation.Track, self.times, self.values, 'cubic' )
+
+    def test_sample( self ):
+        def linear():
+            track = animation.Track( self.times, self.values )
+            result = animation.sample( track, 0.5 )
+
+            expected = numpy.array( [
+                [ 0.5, 1.0, 1.5 ],
+                [ 0.0, 0.0, 0.0 ],
+                [ 7.0, 7.0, 7.0 ],
+                ] )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Animation linear sample incorrect"
+                )
+        linear()
+
+        def step():
+            track = animation.Track( self.times, self.values, animation.interpolation.step )
+            result = animation.sample( track, [ 1.5, 3.0, 0.0 ] )
+
+            expected = numpy.array( [
+                [ 1.0, 2.0, 3.0 ],
+                [ 5.0, 0.0, 0.0 ],
+                [ 7.0, 7.0, 7.0 ],
+                ] )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Animation step sample incorrect"
+                )
+        step()
+
+        def clamped():
+            track = animation.Track( self.times, self.values )
+            before = animation.sample( track, -10.0 )
+            after = animation.sample( track, 10.0 )
+
+            self.assertTrue(
+                numpy.allclose( before, [ v[ 0 ] for v in self.values ] ),
+                "Animation sample before first keyframe incorrect"
+                )
+            self.assertTrue(
+                numpy.allclose( after, [ v[ -1 ] for v in self.values ] ),
+                "Animation sample after last keyframe incorrect"
+                )
+        clamped()
+
+        def slerp():
+            times = [ numpy.array( [ 0.0, 1.0 ] ) ] * 2
+            values = [
+                numpy.array( [ quaternion.create_from_x_rotation( 0.0 ), quaternion.create_from_x_rotation( 1.0 ) ] ),
+                numpy.array( [ quaternion.create_from_y_rotation( 0.0 ), quaternion.create_from_y_rotation( 2.0 ) ] ),
+                ]
+            track = animation.Track( times, values, animation.interpolation.slerp )
+            result = animation.sample( track, 0.5 )
+
+            expected = numpy.array( [
+                quaternion.create_from_x_rotation( 0.5 ),
+                quaternion.create_from_y_rotation( 1.0 ),
+                ] )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Animation slerp sample incorrect"
+                )
+        slerp()
+
+    def test_cursors( self ):
+        times = [ numpy.sort( numpy.random.uniform( 0.0, 10.0, count ) ) for count in ( 1, 2, 5, 50, 200 ) ]
+        values = [ numpy.random.uniform( -1.0, 1.0, (len( t ), 3) ) for t in times ]
+        track = animation.Track( times, values )
+
+        # play forward in small steps, jump and play backwards
+        playback = numpy.concatenate( [
+            numpy.arange( -1.0, 11.0, 0.01 ),
+            [ 5.0, 2.0, 9.0 ],
+            numpy.arange( 10.0, 0.0, -0.3 ),
+            ] )
+        for time in playback:
+            result = track.sample( time )
+            expected = animation.sample( track, time )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Animation sample with cursors incorrect at %s" % time
+                )
+
+        track.seek( 0.0 )
+        self.assertTrue( numpy.array_equal( track.cursors, track.first ) )
+
+    def test_out( self ):
+        track = animation.Track( self.times, self.values )
+        buffer = numpy.empty( (3,3) )
+        result = track.sample( 1.0, out = buffer )
+
+        self.assertTrue( result is buffer, "Animation sample out not used" )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+import numpy
+
+from pyrr import backend
+from pyrr import geometric_tests as gt
+from pyrr import obb
+from pyrr import matrix33
+
+
+class test_backend( unittest.TestCase ):
+
+    def setUp( self ):
+        self.previous = backend.get_backend()
+
+    def tearDown( self ):
+        backend.set_backend( self.previous )
+
+    def test_available_backends( self ):
+        result = backend.available_backends()
+
+        self.assertTrue( 'numpy' in result, "NumPy backend not available" )
+        for name in result:
+            self.assertTrue( backend.is_available( name ), "Backend %s not available" % name )
+        self.assertFalse( backend.is_available( 'unknown' ), "Unknown backend available" )
+
+    def test_set_backend( self ):
+        for name in backend.available_backends():
+            backend.set_backend( name )
+            self.assertEqual( backend.get_backend(), name )
+
+        self.assertRaises( ValueError, backend.set_backend, 'unknown' )
+
+    def test_kernel( self ):
+        @backend.kernel
+        def add( a, b ):
+            return a + b
+
+        @add.register( 'numexpr' )
+        def add( a, b ):
+            return 'numexpr'
+
+        backend.set_backend( 'numpy' )
+        self.assertEqual( add( 1, 2 ), 3 )
+        self.assertEqual( add.implementation( 'numexpr' )( 1, 2 ), 'numexpr' )
+        # backends without an implementation use numpy
+        self.assertEqual( add.implementation( 'numba' )( 1, 2 ), 3 )
+
+    def test_create_from_quaternion( self ):
+        quats = numpy.random.uniform( -1.0, 1.0, (50,4) )
+        quats /= numpy.sqrt( numpy.sum( quats ** 2, axis = -1 ) )[ :, numpy.newaxis ]
+
+        backend.set_backend( 'numpy' )
+        expected = matrix33.create_from_quaternion( quats )
+
+        for name in backend.available_backends():
+            backend.set_backend( name )
+            result = matrix33.create_from_quaternion( quats )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Matrix33 from quaternion incorrect with backend %s" % name
+                )
+            self.assertTrue(
+                numpy.allclose( matrix33.create_from_quaternion( quats[ 0 ] ), expected[ 0 ] ),
+                "Matrix33 from single quaternion incorrect with backend %s" % name
+                )
+
+    def test_ray_aabb_slabs( self ):
+        origins = numpy.random.uniform( -3.0, 3.0, (200,3) )
+        directions = numpy.random.uniform( -1.0, 1.0, (200,3) )
+        # include rays parallel to an axis
+        directions[ ::4, 0 ] = 0.0
+        directions[ ::8, 1 ] = 0.0
+        aabb = numpy.array( [ [-1.0,-1.0,-1.0 ], [ 1.0, 1.0, 1.0 ] ] )
+
+        backend.set_backend( 'numpy' )
+        expected = gt._ray_aabb_slabs( origins, directions, aabb[ 0 ], aabb[ 1 ] )
+        expected_hits = (expected[ 1 ] >= 0.0) & (expected[ 0 ] <= expected[ 1 ])
+
+        for name in backend.available_backends():
+            backend.set_backend( name )
+            tmin, tmax = gt._ray_aabb_slabs( origins, directions, aabb[ 0 ], aabb[ 1 ] )
+            hits = (tmax >= 0.0) & (tmin <= tmax)
+
+            self.assertTrue(
+                numpy.array_equal( hits, expected_hits ),
+                "Ray vs AABB slabs incorrect with backend %s" % name
+                )
+            self.assertTrue(
+                numpy.allclose( tmin[ hits ], expected[ 0 ][ hits ] ),
+                "Ray vs AABB entry distance incorrect with backend %s" % name
+                )
+
+    def test_ray_aabb_slabs_parallel_boundary( self ):
+        # a ray parallel to an axis that starts on the boundary of a slab
+        ray = numpy.array( [ [ 0.0, 0.0, 0.0 ], [ 1.0, 0.0, 0.0 ] ] )
+        aabb = numpy.array( [ [ -1.0, 0.0, -1.0 ], [ 2.0, 1.0, 1.0 ] ] )
+        box = obb.create_from_aabb( aabb )
+
+        for name in backend.available_backends():
+            backend.set_backend( name )
+            tmin, tmax = gt._ray_aabb_slabs( ray[ 0 ], ray[ 1 ], aabb[ 0 ], aabb[ 1 ] )
+            self.assertEqual( numpy.ndim( tmin ), 0, "Single ray slabs not scalar with backend %s" % name )
+            self.assertEqual( (tmin, tmax), (-1.0, 2.0), "Ray vs AABB slabs incorrect with backend %s" % name )
+
+            self.assertIsNotNone( gt.ray_intersect_aabb( ray, aabb ), "Ray vs AABB incorrect with backend %s" % name )
+            self.assertIsNotNone( gt.ray_intersect_obb( ray, box ), "Ray vs OBB incorrect with backend %s" % name )
+
+            # the same ray, just outside the slab, misses
+            self.assertIsNone( gt.ray_intersect_aabb( ray - [ 0.0, 0.1, 0.0 ], aabb ) )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+import numpy
+
+from pyrr import cache
+from pyrr import matrix44
+from pyrr import trig
+
+
+class test_cache( unittest.TestCase ):
+
+    def setUp( self ):
+        cache.enable()
+        cache.clear()
+
+    def tearDown( self ):
+        cache.enable( cache.default_maxsize )
+        cache.disable()
+
+    def test_disabled( self ):
+        cache.disable()
+        self.assertFalse( cache.is_enabled() )
+
+        first = matrix44.create_perspective_projection_matrix( 90.0, 1.0, 1.0, 100.0 )
+        second = matrix44.create_perspective_projection_matrix( 90.0, 1.0, 1.0, 100.0 )
+
+        self.assertTrue( first is not second, "Disabled cache returned a cached result" )
+        self.assertTrue( first.flags.writeable, "Disabled cache returned a read-only array" )
+        self.assertEqual( matrix44.create_perspective_projection_matrix.cache_info().misses, 0 )
+
+    def test_enabled( self ):
+        fn = matrix44.create_perspective_projection_matrix
+        first = fn( 90.0, 1.0, 1.0, 100.0 )
+        second = fn( 90.0, 1.0, 1.0, 100.0 )
+        other = fn( 60.0, 1.0, 1.0, 100.0 )
+
+        self.assertTrue( first is second, "Cached result not returned" )
+        self.assertTrue( first is not other, "Cached result returned for different arguments" )
+        self.assertFalse( first.flags.writeable, "Cached array is writeable" )
+
+        info = fn.cache_info()
+        self.assertEqual( (info.hits, info.misses), (1, 2) )
+
+        statistics = cache.statistics()
+        self.assertEqual( statistics[ 'pyrr.matrix44.create_perspective_projection_matrix' ], info )
+        self.assertTrue( 'pyrr.trig.calculate_plane_size' in statistics )
+
+        # the result matches the uncached function
+        cache.disable()
+        self.assertTrue( numpy.array_equal( fn( 90.0, 1.0, 1.0, 100.0 ), first ), "Cached result incorrect" )
+
+    def test_maxsize( self ):
+        cache.enable( 2 )
+        fn = matrix44.create_orthogonal_projection_matrix
+        first = fn( -1.0, 1.0, 1.0, -1.0, 1.0, 100.0 )
+        fn( -2.0, 2.0, 2.0, -2.0, 1.0, 100.0 )
+        fn( -3.0, 3.0, 3.0, -3.0, 1.0, 100.0 )
+
+        self.assertEqual( fn.cache_info().currsize, 2 )
+        # the least recently used result was discarded
+        self.assertTrue( fn( -1.0, 1.0, 1.0, -1.0, 1.0, 100.0 ) is not first, "Cache not bounded" )
+
+        self.assertRaises( ValueError, cache.enable, -1 )
+        self.assertRaises( ValueError, cache.enable, 0 )
+
+    def test_trig( self ):
+        first = trig.calculate_plane_size( 1.5, 90.0, 10.0 )
+        second = trig.calculate_plane_size( 1.5, 90.0, 10.0 )
+
+        self.assertEqual( first, second )
+        self.assertEqual( trig.calculate_plane_size.cache_info().hits, 1 )
+
+    def test_unhashable( self ):
+        fn = matrix44.create_perspective_projection_matrix_from_bounds
+        result = fn( numpy.array( -1.0 ), 1.0, 1.0, -1.0, 1.0, 100.0 )
+        result = fn( -1.0, 1.0, 1.0, -1.0, near = 1.0, far = 100.0 )
+
+        self.assertEqual( result.shape, (4,4) )
+        self.assertEqual( fn.cache_info().misses, 0 )
+
+
+if __name__ == '__main__':
+    unittest.main()
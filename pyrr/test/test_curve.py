@@ -0,0 +1,135 @@
+import unittest
+
+import numpy
+
+from pyrr import curve
+
+
+class test_curve( unittest.TestCase ):
+
+    def setUp( self ):
+        self.points = numpy.array( [
+            [ 0.0, 0.0, 0.0 ],
+            [ 1.0, 2.0, 0.0 ],
+            [ 3.0, 2.0, 0.0 ],
+            [ 4.0, 0.0, 1.0 ],
+            ] )
+
+    def tearDown( self ):
+        pass
+
+    def test_bezier( self ):
+        coefficients = curve.create_coefficients( self.points, curve.kind.bezier )
+        self.assertEqual( coefficients.shape, (1, 4, 3) )
+
+        t = numpy.linspace( 0.0, 1.0, 11 )
+        p0, p1, p2, p3 = self.points
+        s = (1.0 - t)[ :, numpy.newaxis ]
+        u = t[ :, numpy.newaxis ]
+        expected = (s ** 3) * p0 + 3.0 * (s ** 2) * u * p1 + 3.0 * s * (u ** 2) * p2 + (u ** 3) * p3
+
+        result = curve.evaluate( coefficients, t )
+        self.assertTrue( numpy.allclose( result, expected ), "Bezier evaluation incorrect" )
+
+        self.assertRaises( ValueError, curve.create_coefficients, self.points[ :3 ], curve.kind.bezier )
+        self.assertRaises( ValueError, curve.create_coefficients, self.points, 'nurbs' )
+
+    def test_catmull_rom( self ):
+        coefficients = curve.create_coefficients( self.points, curve.kind.catmull_rom )
+        self.assertEqual( coefficients.shape, (3, 4, 3) )
+
+        # the curve passes through every point
+        result = curve.evaluate( coefficients, numpy.arange( 4.0 ) )
+        self.assertTrue( numpy.allclose( result, self.points ), "Catmull-Rom does not pass through points" )
+
+        # parameters outside the curve are clamped
+        result = curve.evaluate( coefficients, [ -1.0, 5.0 ] )
+        self.assertTrue( numpy.allclose( result, self.points[ [ 0, -1 ] ] ), "Catmull-Rom not clamped" )
+
+        # the interior tangents are half the distance between neighbours
+        result = curve.derivative( coefficients, 1.0 )
+        expected = (self.points[ 2 ] - self.points[ 0 ]) * 0.5
+        self.assertTrue( numpy.allclose( result, expected ), "Catmull-Rom derivative incorrect" )
+
+    def test_hermite( self ):
+        points = self.points[ :2 ]
+        tangents = numpy.array( [ [ 1.0, 0.0, 0.0 ], [ 0.0, 1.0, 0.0 ] ] )
+        coefficients = curve.create_coefficients( points, curve.kind.hermite, tangents )
+
+        result = curve.evaluate( coefficients, [ 0.0, 1.0 ] )
+        self.assertTrue( numpy.allclose( result, points ), "Hermite does not pass through points" )
+
+        result = curve.derivative( coefficients, [ 0.0, 1.0 ] )
+        self.assertTrue( numpy.allclose( result, tangents ), "Hermite tangents incorrect" )
+
+        self.assertRaises( ValueError, curve.create_coefficients, points, curve.kind.hermite )
+
+    def test_arc_length_table( self ):
+        # a straight line has an exact length
+        points = numpy.array( [ [ 0.0, 0.0, 0.0 ], [ 1.0, 0.0, 0.0 ], [ 2.0, 0.0, 0.0 ], [ 3.0, 0.0, 0.0 ] ] )
+        coefficients = curve.create_coefficients( points, curve.kind.catmull_rom )
+        parameters, distances = curve.create_arc_length_table( coefficients, 8 )
+
+        self.assertEqual( len( parameters ), 25 )
+        self.assertTrue( numpy.isclose( distances[ -1 ], 3.0 ), "Arc length incorrect" )
+
+        u = curve.parameter_at_distance( ( parameters, distances ), [ 0.0, 1.5, 3.0, 10.0 ] )
+        self.assertTrue( numpy.allclose( u, [ 0.0, 1.5, 3.0, 3.0 ] ), "Parameter at distance incorrect" )
+
+    def test_curve( self ):
+        rail = curve.Curve( self.points, curve.kind.catmull_rom, resolution = 64 )
+        self.assertEqual( rail.segments, 3 )
+
+        # the points are read only so the cache can not become stale
+        def modify():
+            rail.points[ 0 ] = 1.0
+        self.assertRaises( ValueError, modify )
+
+        def constant_speed():
+            samples = rail.sample_uniform( 50 )
+            self.assertEqual( samples.shape, (50, 3) )
+            self.assertTrue( numpy.allclose( samples[ [ 0, -1 ] ], self.points[ [ 0, -1 ] ] ), "Samples do not reach end points" )
+
+            spacing = numpy.sqrt( numpy.sum( numpy.diff( samples, axis = 0 ) ** 2, axis = -1 ) )
+            self.assertTrue( numpy.allclose( spacing, spacing.mean(), rtol = 1e-2 ), "Samples not evenly spaced" )
+        constant_speed()
+
+        def cached():
+            table = rail.arc_length_table()
+            self.assertTrue( rail.arc_length_table() is table, "Arc length table not cached" )
+            length = rail.length
+
+            rail.points = self.points * 2.0
+            self.assertTrue( rail.arc_length_table() is not table, "Arc length table not rebuilt" )
+            self.assertTrue( numpy.isclose( rail.length, length * 2.0 ), "Arc length not updated" )
+        cached()
+
+        def change_kind():
+            rail = curve.Curve( self.points, curve.kind.catmull_rom )
+            length = rail.length
+            rail.kind = curve.kind.bezier
+            self.assertEqual( rail.kind, curve.kind.bezier )
+            self.assertTrue(
+                numpy.allclose( rail.coefficients, curve.create_coefficients( self.points, curve.kind.bezier ) ),
+                "Coefficients not rebuilt for new kind"
+                )
+            self.assertFalse( numpy.isclose( rail.length, length ), "Arc length not rebuilt for new kind" )
+
+            # hermite curves require tangents, so the kind is unchanged
+            with self.assertRaises( ValueError ):
+                rail.kind = curve.kind.hermite
+            self.assertEqual( rail.kind, curve.kind.bezier )
+        change_kind()
+
+    def test_curve_hermite( self ):
+        tangents = numpy.ones( (4, 3) )
+        rail = curve.Curve( self.points, curve.kind.hermite, tangents )
+        self.assertTrue( numpy.allclose( rail.evaluate( 3.0 ), self.points[ -1 ] ), "Hermite curve incorrect" )
+
+        # replacing the points keeps the tangents
+        rail.points = self.points + 1.0
+        self.assertTrue( numpy.allclose( rail.derivative( 0.0 ), tangents[ 0 ] ), "Hermite tangents lost" )
+
+
+if __name__ == '__main__':
+    unittest.main()
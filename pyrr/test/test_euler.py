@@ -0,0 +1,133 @@
+import unittest
+import math
+
+import numpy
+
+from pyrr import euler
+from pyrr import matrix33
+from pyrr import quaternion
+
+
+class test_euler( unittest.TestCase ):
+
+    def setUp( self ):
+        self.orders = euler.order.tait_bryan + euler.order.proper
+        self.orders += tuple( order.upper() for order in self.orders )
+
+        random = numpy.random.RandomState( 0 )
+        self.eulers = random.uniform( -math.pi, math.pi, (200,3) )
+
+    def tearDown( self ):
+        pass
+
+    def test_create( self ):
+        result = euler.create( 1.0, 2.0, 3.0 )
+        self.assertTrue( numpy.array_equal( result, [ 1.0, 2.0, 3.0 ] ), "Euler create incorrect" )
+        self.assertEqual( euler.pitch( result ), 1.0 )
+        self.assertEqual( euler.roll( result ), 2.0 )
+        self.assertEqual( euler.yaw( result ), 3.0 )
+
+        result = euler.create( [ 1.0, 4.0 ], 2.0, 3.0 )
+        self.assertEqual( result.shape, (2,3) )
+        self.assertTrue( numpy.array_equal( euler.pitch( result ), [ 1.0, 4.0 ] ), "Euler batch create incorrect" )
+
+    def test_axes( self ):
+        self.assertEqual( euler.axes( 'xzy' ), ( ( 0, 2, 1 ), False ) )
+        # intrinsic orders are the reverse of extrinsic orders
+        self.assertEqual( euler.axes( 'XZY' ), ( ( 1, 2, 0 ), True ) )
+        self.assertEqual( euler.axes( 'zxz' ), ( ( 2, 0, 2 ), False ) )
+
+        self.assertRaises( ValueError, euler.axes, 'xxy' )
+        self.assertRaises( ValueError, euler.axes, 'xYz' )
+
+    def test_create_from_eulers( self ):
+        def order():
+            # extrinsic rotations are applied in the order of the eulers
+            pitch = quaternion.create_from_x_rotation( 0.3 )
+            roll = quaternion.create_from_z_rotation( 0.5 )
+            yaw = quaternion.create_from_y_rotation( 0.7 )
+            expected = quaternion.cross( quaternion.cross( pitch, roll ), yaw )
+
+            result = quaternion.create_from_eulers( euler.create( 0.3, 0.5, 0.7 ) )
+            self.assertTrue( numpy.allclose( result, expected ), "Quaternion from eulers incorrect" )
+
+            # the intrinsic order with reversed values is the same rotation
+            result = quaternion.create_from_eulers( [ 0.7, 0.5, 0.3 ], 'YZX' )
+            self.assertTrue( numpy.allclose( result, expected ), "Quaternion from intrinsic eulers incorrect" )
+        order()
+
+        def matrices():
+            quats = quaternion.create_from_eulers( self.eulers, 'zyx' )
+            mats = matrix33.create_from_eulers( self.eulers, 'zyx' )
+            self.assertTrue(
+                numpy.allclose( mats, matrix33.create_from_quaternion( quats ) ),
+                "Matrix from eulers does not match quaternion"
+                )
+
+            inverse = quaternion.create_from_inverse_of_eulers( self.eulers, 'zyx' )
+            self.assertTrue(
+                numpy.allclose( quaternion.cross( quats, inverse )[ :, 3 ] ** 2, 1.0 ),
+                "Quaternion from inverse of eulers incorrect"
+                )
+        matrices()
+
+    def test_create_from_quaternion( self ):
+        for order in self.orders:
+            quats = quaternion.create_from_eulers( self.eulers, order )
+            result = euler.create_from_quaternion( quats, order )
+
+            self.assertEqual( result.shape, (200,3) )
+            # q and -q are the same rotation
+            self.assertTrue(
+                numpy.allclose( numpy.abs( quaternion.dot( quaternion.create_from_eulers( result, order ), quats ) ), 1.0 ),
+                "Eulers from quaternion incorrect for order %s" % order
+                )
+
+        # unique angles are returned exactly
+        result = euler.create_from_quaternion( quaternion.create_from_eulers( [ 0.1, 0.2, 0.3 ] ) )
+        self.assertTrue( numpy.allclose( result, [ 0.1, 0.2, 0.3 ] ), "Eulers from quaternion incorrect" )
+
+    def test_create_from_matrix( self ):
+        for order in self.orders:
+            mats = matrix33.create_from_eulers( self.eulers, order )
+            result = euler.create_from_matrix( mats, order )
+
+            self.assertTrue(
+                numpy.allclose( matrix33.create_from_eulers( result, order ), mats ),
+                "Eulers from matrix incorrect for order %s" % order
+                )
+
+        result = euler.create_from_matrix( matrix33.create_from_eulers( [ 0.1, 0.2, 0.3 ] ) )
+        self.assertTrue( numpy.allclose( result, [ 0.1, 0.2, 0.3 ] ), "Eulers from matrix incorrect" )
+
+    def test_gimbal_lock( self ):
+        def locked_eulers( order ):
+            eulers = self.eulers.copy()
+            # the second rotation aligns the first and third axes
+            if order.lower() in euler.order.tait_bryan:
+                eulers[ :100, 1 ] = math.pi * 0.5
+                eulers[ 100:, 1 ] = -math.pi * 0.5
+            else:
+                eulers[ :100, 1 ] = 0.0
+                eulers[ 100:, 1 ] = math.pi
+            return eulers
+
+        for order in self.orders:
+            eulers = locked_eulers( order )
+            mats = matrix33.create_from_eulers( eulers, order )
+            third = 0 if order.isupper() else 2
+
+            for result in (
+                euler.create_from_quaternion( quaternion.create_from_eulers( eulers, order ), order ),
+                euler.create_from_matrix( mats, order ),
+                ):
+                self.assertTrue( numpy.all( numpy.isfinite( result ) ), "Gimbal lock eulers not finite" )
+                self.assertTrue( numpy.allclose( result[ :, third ], 0.0 ), "Gimbal lock third angle not 0" )
+                self.assertTrue(
+                    numpy.allclose( matrix33.create_from_eulers( result, order ), mats, atol = 1e-6 ),
+                    "Gimbal lock eulers incorrect for order %s" % order
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
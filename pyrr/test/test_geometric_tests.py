@@ -9,6 +9,8 @@ from pyrr import line
 from pyrr import plane
 from pyrr import ray
 from pyrr import aabb
+from pyrr import obb
+from pyrr import rectangle
 
 
 class test_geometric_tests( unittest.TestCase ):
@@ -176,10 +178,558 @@ class test_geometric_tests( unittest.TestCase ):
         valid_intersections()
 
         def invalid_intersections():
-            pass
+            aabb = numpy.array( [ [-1.0,-1.0,-1.0 ], [ 1.0, 1.0, 1.0 ] ] )
+            ray = numpy.array( [ [ 2.0, 2.0, 2.0 ], [ 1.0, 0.0, 0.0 ] ] )
+
+            result = gt.ray_intersect_aabb( ray, aabb )
+
+            self.assertTrue( result is None, "Ray vs AABB intersection should not occur" )
         invalid_intersections()
 
+        def inside():
+            # rays which start inside the AABB intersect where they exit
+            aabb = numpy.array( [ [-1.0,-1.0,-1.0 ], [ 1.0, 1.0, 1.0 ] ] )
+            rays = numpy.array( [
+                [ [ 0.5, 0.5, 0.5 ], [ 0.0, 0.0,-1.0 ] ],
+                [ [ 0.5, 0.5,-0.5 ], [ 0.0, 0.0,-1.0 ] ],
+                ] )
+            expected = numpy.array( [ [ 0.5, 0.5,-1.0 ], [ 0.5, 0.5,-1.0 ] ] )
+            self.assertTrue( numpy.array_equal( gt.ray_intersect_aabb( rays[ 0 ], aabb ), expected[ 0 ] ), "Ray vs AABB from inside incorrect" )
+            self.assertTrue( numpy.array_equal( gt.ray_intersect_aabb( rays, aabb ), expected ), "Ray vs AABB batch from inside incorrect" )
+        inside()
+
+        def multiple_rays():
+            aabb = numpy.array( [ [-1.0,-1.0,-1.0 ], [ 1.0, 1.0, 1.0 ] ] )
+            rays = numpy.array( [
+                [ [ 0.5, 0.5, 0.0 ], [ 0.0, 0.0,-1.0 ] ],
+                [ [ 2.0, 2.0, 2.0 ], [ 1.0, 0.0, 0.0 ] ],
+                [ [ 2.0, 2.0, 2.0 ], [-1.0,-1.0,-1.0 ] ],
+                ] )
+
+            result = gt.ray_intersect_aabb( rays, aabb )
+
+            expected = numpy.array( [
+                [ 0.5, 0.5,-1.0 ],
+                [ numpy.nan, numpy.nan, numpy.nan ],
+                [ 1.0, 1.0, 1.0 ],
+                ] )
+
+            self.assertTrue(
+                numpy.allclose( result, expected, equal_nan = True ),
+                "Ray vs AABB batch intersection incorrect"
+                )
+        multiple_rays()
+
+    def test_sphere_inside_planes( self ):
+        # a box from -1 to 1 on each axis, with normals facing inwards
+        planes = numpy.array( [
+            [ 1.0, 0.0, 0.0, 1.0 ],
+            [-1.0, 0.0, 0.0, 1.0 ],
+            [ 0.0, 1.0, 0.0, 1.0 ],
+            [ 0.0,-1.0, 0.0, 1.0 ],
+            [ 0.0, 0.0, 1.0, 1.0 ],
+            [ 0.0, 0.0,-1.0, 1.0 ],
+            ] )
+        spheres = numpy.array( [
+            [ 0.0, 0.0, 0.0, 0.5 ],
+            [ 1.5, 0.0, 0.0, 1.0 ],
+            [ 3.0, 0.0, 0.0, 1.0 ],
+            [ 0.0,-5.0, 0.0, 1.0 ],
+            ] )
+
+        result = gt.sphere_inside_planes( spheres, planes )
+
+        self.assertTrue(
+            numpy.array_equal( result, [ True, True, False, False ] ),
+            "Sphere inside planes incorrect"
+            )
+        self.assertTrue( gt.sphere_inside_planes( spheres[ 0 ], planes ) )
+
+    def test_point_inside_rectangle( self ):
+        rects = rectangle.create_from_position(
+            [ 0.0, 10.0, 5.0 ],
+            [ 0.0, 0.0, 5.0 ],
+            [ 2.0, -4.0, 1.0 ],
+            [ 3.0, 3.0, -2.0 ]
+            )
+
+        def one_point():
+            result = gt.point_inside_rectangle( [ 1.0, 1.0 ], rects )
+            self.assertTrue( numpy.array_equal( result, [ True, False, False ] ), "Point inside rectangles incorrect" )
+
+            # negative sizes and edges
+            result = gt.point_inside_rectangle( [ 6.0, 3.0 ], rects )
+            self.assertTrue( numpy.array_equal( result, [ False, True, True ] ), "Point inside rectangles incorrect" )
+        one_point()
+
+        def all_pairs():
+            points = numpy.array( [ [ 1.0, 1.0, 7.0 ], [ 8.0, 2.0, 0.0 ] ] )
+            result = gt.point_inside_rectangle( points[ :, numpy.newaxis ], rects )
+            self.assertEqual( result.shape, (2,3) )
+            self.assertTrue(
+                numpy.array_equal( result, [ [ True, False, False ], [ False, True, False ] ] ),
+                "Points inside rectangles incorrect"
+                )
+        all_pairs()
+
+        def intersect():
+            points = numpy.array( [ [ 1.0, 1.0 ], [ 1.0, 1.0 ], [ 1.0, 1.0 ] ] )
+            result = gt.point_intersect_rectangle( points, rects )
+            self.assertTrue( numpy.array_equal( result[ 0 ], [ 1.0, 1.0 ] ) )
+            self.assertTrue( numpy.all( numpy.isnan( result[ 1: ] ) ), "Point intersect rectangles incorrect" )
+        intersect()
+
+    def test_rectangle_intersect_rectangle( self ):
+        rects = rectangle.create_from_position(
+            [ 0.0, 10.0, 2.0 ],
+            [ 0.0, 0.0, 3.0 ],
+            [ 2.0, -4.0, 1.0 ],
+            [ 3.0, 3.0, -2.0 ]
+            )
+        result = gt.rectangle_intersect_rectangle( rects[ :, numpy.newaxis ], rects )
+        expected = numpy.array( [
+            [ True, False, True ],
+            [ False, True, False ],
+            [ True, False, True ],
+            ] )
+        self.assertTrue( numpy.array_equal( result, expected ), "Rectangle intersect rectangles incorrect" )
+
+        self.assertTrue( gt.rectangle_intersect_rectangle( rects[ 0 ], rects[ 2 ] ) )
+
+    def test_line_segment_closest_approach_line_segment( self ):
+        def crossing():
+            segment1 = numpy.array( [ [ -1.0, 0.0, 0.0 ], [ 1.0, 0.0, 0.0 ] ] )
+            segment2 = numpy.array( [ [ 0.0, -1.0, 1.0 ], [ 0.0, 1.0, 1.0 ] ] )
+            s, t, p1, p2, distance = gt.line_segment_closest_approach_line_segment( segment1, segment2 )
+            self.assertTrue( numpy.allclose( [ s, t ], [ 0.5, 0.5 ] ), "Segment parameters incorrect" )
+            self.assertTrue( numpy.allclose( p1, [ 0.0, 0.0, 0.0 ] ), "Segment point incorrect" )
+            self.assertTrue( numpy.allclose( p2, [ 0.0, 0.0, 1.0 ] ), "Segment point incorrect" )
+            self.assertTrue( numpy.isclose( distance, 1.0 ), "Segment distance incorrect" )
+        crossing()
+
+        def clamped():
+            # the second segment ends before the first
+            segment1 = numpy.array( [ [ 0.0, 0.0, 0.0 ], [ 1.0, 0.0, 0.0 ] ] )
+            segment2 = numpy.array( [ [ 3.0, 1.0, 0.0 ], [ 3.0, 2.0, 0.0 ] ] )
+            s, t, p1, p2, distance = gt.line_segment_closest_approach_line_segment( segment1, segment2 )
+            self.assertTrue( numpy.allclose( [ s, t ], [ 1.0, 0.0 ] ), "Segment parameters not clamped" )
+            self.assertTrue( numpy.isclose( distance, 5.0 ), "Segment distance incorrect" )
+        clamped()
+
+        def degenerate():
+            segments = numpy.array( [
+                # parallel, overlapping
+                [ [ 0.0, 0.0, 0.0 ], [ 2.0, 0.0, 0.0 ] ],
+                # parallel, separate
+                [ [ 3.0, 1.0, 0.0 ], [ 5.0, 1.0, 0.0 ] ],
+                # a point
+                [ [ 1.0, 2.0, 0.0 ], [ 1.0, 2.0, 0.0 ] ],
+                ] )
+            segment = numpy.array( [ [ 1.0, 1.0, 0.0 ], [ 4.0, 1.0, 0.0 ] ] )
+            s, t, p1, p2, distance = gt.line_segment_closest_approach_line_segment( segment, segments )
+            self.assertTrue( numpy.allclose( distance, [ 1.0, 0.0, 1.0 ] ), "Degenerate segment distance incorrect" )
+            self.assertTrue( numpy.all( numpy.isfinite( p1 ) & numpy.isfinite( p2 ) ), "Degenerate segment points not finite" )
+            self.assertTrue( numpy.allclose( p1[ 2 ], [ 1.0, 1.0, 0.0 ] ), "Closest point to a point incorrect" )
+        degenerate()
+
+        def all_pairs():
+            random = numpy.random.RandomState( 0 )
+            segments1 = random.normal( size = (20, 2, 3) )
+            segments2 = random.normal( size = (30, 2, 3) )
+            s, t, p1, p2, distance = gt.line_segment_closest_approach_line_segment(
+                segments1[ :, numpy.newaxis ],
+                segments2
+                )
+            self.assertEqual( distance.shape, (20, 30) )
+
+            # no sampled pair of points is closer
+            u = numpy.linspace( 0.0, 1.0, 51 )[ :, numpy.newaxis ]
+            for i in range( 0, 20, 5 ):
+                for j in range( 0, 30, 5 ):
+                    a = segments1[ i, 0 ] + (segments1[ i, 1 ] - segments1[ i, 0 ]) * u
+                    b = segments2[ j, 0 ] + (segments2[ j, 1 ] - segments2[ j, 0 ]) * u
+                    sampled = numpy.min( numpy.sum( (a[ :, numpy.newaxis ] - b) ** 2, axis = -1 ) )
+                    self.assertTrue( distance[ i, j ] <= sampled + 1e-12, "Segment distance not minimal" )
+        all_pairs()
+
+    def test_line_closest_approach_line( self ):
+        lines = numpy.array( [
+            [ [ 0.0, -1.0, 2.0 ], [ 0.0, 1.0, 2.0 ] ],
+            # parallel
+            [ [ 5.0, 3.0, 0.0 ], [ 6.0, 3.0, 0.0 ] ],
+            ] )
+        line = numpy.array( [ [ 1.0, 0.0, 0.0 ], [ 2.0, 0.0, 0.0 ] ] )
+        s, t, p1, p2, distance = gt.line_closest_approach_line( line, lines )
+        self.assertTrue( numpy.allclose( s, [ -1.0, 0.0 ] ), "Line parameters incorrect" )
+        self.assertTrue( numpy.allclose( t, [ 0.5, -4.0 ] ), "Line parameters incorrect" )
+        self.assertTrue( numpy.allclose( p1[ 0 ], [ 0.0, 0.0, 0.0 ] ), "Line point incorrect" )
+        self.assertTrue( numpy.allclose( distance, [ 4.0, 9.0 ] ), "Line distance incorrect" )
+
+    def test_obb_intersect_obb( self ):
+        rotation = numpy.array( [
+            [ math.sqrt( 0.5 ), math.sqrt( 0.5 ), 0.0 ],
+            [ -math.sqrt( 0.5 ), math.sqrt( 0.5 ), 0.0 ],
+            [ 0.0, 0.0, 1.0 ],
+            ] )
+        box = obb.create( [ 0.0, 0.0, 0.0 ], numpy.identity( 3 ), [ 1.0, 1.0, 1.0 ] )
+        boxes = obb.create(
+            [
+                [ 2.5, 0.0, 0.0 ],
+                [ 2.3, 0.0, 0.0 ],
+                [ 2.0, 0.0, 0.0 ],
+                [ 0.0, 0.0, 0.0 ],
+                ],
+            rotation,
+            [ 1.0, 1.0, 1.0 ]
+            )
+
+        # the rotated box reaches sqrt( 2 ) along x
+        result = gt.obb_intersect_obb( box, boxes )
+        self.assertTrue( numpy.array_equal( result, [ False, True, True, True ] ), "OBB intersect OBB incorrect" )
+        self.assertTrue( gt.obb_intersect_obb( box, boxes[ 1 ] ) )
+        self.assertFalse( gt.obb_intersect_obb( box, boxes[ 0 ] ) )
+
+        # crossed rods with diamond cross sections, which are only
+        # separated along the cross product of their long edges
+        c = math.sqrt( 0.5 )
+        rod1 = obb.create( [ 0.0, 0.0, 0.0 ], [ [ 1.0, 0.0, 0.0 ], [ 0.0, c, c ], [ 0.0, -c, c ] ], [ 1.0, 0.1, 0.1 ] )
+        rod2 = obb.create( [ 0.0, 0.0, 0.3 ], [ [ 0.0, 1.0, 0.0 ], [ c, 0.0, c ], [ -c, 0.0, c ] ], [ 1.0, 0.1, 0.1 ] )
+        self.assertFalse( gt.obb_intersect_obb( rod1, rod2 ) )
+        rod2[ obb.index.centre, 2 ] = 0.28
+        self.assertTrue( gt.obb_intersect_obb( rod1, rod2 ) )
+
+        pairs = gt.obb_intersect_obb( boxes[ :, numpy.newaxis ], boxes )
+        self.assertEqual( pairs.shape, (4, 4) )
+        self.assertTrue( numpy.all( numpy.diagonal( pairs ) ), "OBB does not intersect itself" )
+
+    def test_ray_intersect_obb( self ):
+        rotation = numpy.array( [
+            [ 0.0, 1.0, 0.0 ],
+            [ -1.0, 0.0, 0.0 ],
+            [ 0.0, 0.0, 1.0 ],
+            ] )
+        box = obb.create( [ 5.0, 0.0, 0.0 ], rotation, [ 2.0, 1.0, 1.0 ] )
+
+        def single():
+            r = numpy.array( [ [ 0.0, 0.0, 0.0 ], [ 1.0, 0.0, 0.0 ] ] )
+            result = gt.ray_intersect_obb( r, box )
+            self.assertTrue( numpy.allclose( result, [ 4.0, 0.0, 0.0 ] ), "Ray intersect OBB incorrect" )
+
+            r = numpy.array( [ [ 0.0, 1.5, 0.0 ], [ 1.0, 0.0, 0.0 ] ] )
+            self.assertTrue( numpy.allclose( gt.ray_intersect_obb( r, box ), [ 4.0, 1.5, 0.0 ] ), "Ray intersect OBB incorrect" )
+
+            r = numpy.array( [ [ 0.0, 2.5, 0.0 ], [ 1.0, 0.0, 0.0 ] ] )
+            self.assertEqual( gt.ray_intersect_obb( r, box ), None )
+        single()
+
+        def stack():
+            rays = numpy.array( [
+                [ [ 0.0, 0.0, 0.0 ], [ 1.0, 0.0, 0.0 ] ],
+                [ [ 0.0, 0.0, 0.0 ], [ -1.0, 0.0, 0.0 ] ],
+                # starts inside the box
+                [ [ 5.0, 0.0, 0.0 ], [ 0.0, 0.0, 1.0 ] ],
+                ] )
+            result = gt.ray_intersect_obb( rays, box )
+            self.assertTrue( numpy.allclose( result[ 0 ], [ 4.0, 0.0, 0.0 ] ), "Ray intersect OBB incorrect" )
+            self.assertTrue( numpy.all( numpy.isnan( result[ 1 ] ) ), "Ray intersect OBB incorrect" )
+            self.assertTrue( numpy.allclose( result[ 2 ], [ 5.0, 0.0, 1.0 ] ), "Ray intersect OBB incorrect" )
+
+            # the same as an AABB when the OBB is not rotated
+            aabb = numpy.array( [ [ -1.0, -1.0, -1.0 ], [ 1.0, 1.0, 1.0 ] ] )
+            rays = numpy.array( [
+                [ [ 0.5, 0.5, 0.5 ], [ 0.0, 0.0, -1.0 ] ],
+                [ [ 0.0, 0.0, 0.0 ], [ 1.0, 0.0, 0.0 ] ],
+                [ [ 2.0, 0.0, 0.0 ], [ -1.0, 0.0, 0.0 ] ],
+                ] )
+            self.assertTrue(
+                numpy.allclose( gt.ray_intersect_obb( rays, obb.create_from_aabb( aabb ) ), gt.ray_intersect_aabb( rays, aabb ) ),
+                "Ray intersect OBB and AABB differ"
+                )
+        stack()
+
+    def test_obb_intersect_plane( self ):
+        rotation = numpy.array( [
+            [ math.sqrt( 0.5 ), math.sqrt( 0.5 ), 0.0 ],
+            [ -math.sqrt( 0.5 ), math.sqrt( 0.5 ), 0.0 ],
+            [ 0.0, 0.0, 1.0 ],
+            ] )
+        boxes = obb.create( [ [ 0.0, 1.2, 0.0 ], [ 0.0, 1.6, 0.0 ], [ 0.0, -1.6, 0.0 ] ], rotation, [ 1.0, 1.0, 1.0 ] )
+        p = numpy.array( [ 0.0, 1.0, 0.0, 0.0 ] )
 
+        # the rotated boxes reach sqrt( 2 ) along y
+        result = gt.obb_intersect_plane( boxes, p )
+        self.assertTrue( numpy.array_equal( result, [ True, False, False ] ), "OBB intersect plane incorrect" )
+        self.assertTrue( gt.obb_intersect_plane( boxes[ 0 ], p ) )
+
+        # a box between two planes facing each other
+        planes = numpy.array( [ [ 0.0, 1.0, 0.0, 0.0 ], [ 0.0, -1.0, 0.0, 3.5 ] ] )
+        result = gt.obb_inside_planes( boxes, planes )
+        self.assertTrue( numpy.array_equal( result, [ True, True, False ] ), "OBB inside planes incorrect" )
+
+    def test_point_aabb_queries( self ):
+        obj = aabb.create_from_bounds( [ -1.0, -1.0, -1.0 ], [ 1.0, 1.0, 1.0 ] )
+        points = numpy.array( [
+            [ 0.0, 0.0, 0.5 ],
+            [ 1.0, 0.0, 0.0 ],
+            [ 3.0, 0.0, 0.0 ],
+            [ 4.0, 5.0, 0.0 ],
+            ] )
+
+        def inside():
+            result = gt.point_inside_aabb( points, obj )
+            self.assertTrue( numpy.array_equal( result, [ True, True, False, False ] ), "Point inside AABB incorrect" )
+            self.assertTrue( gt.point_inside_aabb( points[ 0 ], obj ) )
+
+            # every point against every AABB
+            stack = numpy.stack( [ obj, obj * 4.0 ] )
+            result = gt.point_inside_aabb( points[ :, numpy.newaxis ], stack )
+            self.assertTrue(
+                numpy.array_equal( result, [ [ True, True ], [ True, True ], [ False, True ], [ False, False ] ] ),
+                "Point inside AABBs incorrect"
+                )
+        inside()
+
+        def closest_point():
+            result = gt.point_closest_point_on_aabb( points, obj )
+            expected = [
+                [ 0.0, 0.0, 0.5 ],
+                [ 1.0, 0.0, 0.0 ],
+                [ 1.0, 0.0, 0.0 ],
+                [ 1.0, 1.0, 0.0 ],
+                ]
+            self.assertTrue( numpy.array_equal( result, expected ), "Closest point on AABB incorrect" )
+        closest_point()
+
+        def distance():
+            result = gt.point_distance_to_aabb( points, obj )
+            expected = [ -0.5, 0.0, 2.0, 5.0 ]
+            self.assertTrue( numpy.allclose( result, expected ), "Point distance to AABB incorrect" )
+
+            # outside the distance is to the closest point
+            random = numpy.random.RandomState( 0 )
+            samples = random.uniform( -5.0, 5.0, (100, 3) )
+            closest = gt.point_closest_point_on_aabb( samples, obj )
+            outside = ~gt.point_inside_aabb( samples, obj )
+            lengths = numpy.sqrt( numpy.sum( (samples - closest) ** 2, axis = -1 ) )
+            result = gt.point_distance_to_aabb( samples, obj )
+            self.assertTrue( numpy.allclose( result[ outside ], lengths[ outside ] ), "Point distance to AABB incorrect" )
+            self.assertTrue( numpy.all( result[ ~outside ] <= 0.0 ) )
+        distance()
+
+    def test_point_sphere_queries( self ):
+        spheres = numpy.array( [
+            [ 0.0, 0.0, 0.0, 1.0 ],
+            [ 5.0, 0.0, 0.0, 2.0 ],
+            ] )
+        points = numpy.array( [
+            [ 0.0, 0.5, 0.0 ],
+            [ 0.0, 3.0, 0.0 ],
+            [ 5.0, 0.0, 2.0 ],
+            ] )
+
+        def inside():
+            result = gt.point_inside_sphere( points, spheres[ 0 ] )
+            self.assertTrue( numpy.array_equal( result, [ True, False, False ] ), "Point inside sphere incorrect" )
+
+            result = gt.point_inside_sphere( points[ :, numpy.newaxis ], spheres )
+            self.assertTrue(
+                numpy.array_equal( result, [ [ True, False ], [ False, False ], [ False, True ] ] ),
+                "Point inside spheres incorrect"
+                )
+        inside()
+
+        def closest_point():
+            result = gt.point_closest_point_on_sphere( points, spheres[ 0 ] )
+            expected = [
+                [ 0.0, 0.5, 0.0 ],
+                [ 0.0, 1.0, 0.0 ],
+                [ 5.0, 0.0, 2.0 ] / numpy.sqrt( 29.0 ),
+                ]
+            self.assertTrue( numpy.allclose( result, expected ), "Closest point on sphere incorrect" )
+
+            # a point at the centre is inside
+            result = gt.point_closest_point_on_sphere( spheres[ :, 0:3 ], spheres )
+            self.assertTrue( numpy.array_equal( result, spheres[ :, 0:3 ] ), "Closest point on sphere incorrect" )
+        closest_point()
+
+        def distance():
+            result = gt.point_distance_to_sphere( points[ :, numpy.newaxis ], spheres )
+            expected = [
+                [ -0.5, numpy.sqrt( 25.25 ) - 2.0 ],
+                [ 2.0, numpy.sqrt( 34.0 ) - 2.0 ],
+                [ numpy.sqrt( 29.0 ) - 1.0, 0.0 ],
+                ]
+            self.assertTrue( numpy.allclose( result, expected ), "Point distance to sphere incorrect" )
+        distance()
+
+    def test_point_planes_queries( self ):
+        # a box from -1 to 1 on each axis, with normals facing inwards
+        planes = numpy.array( [
+            [ 1.0, 0.0, 0.0, 1.0 ],
+            [-1.0, 0.0, 0.0, 1.0 ],
+            [ 0.0, 1.0, 0.0, 1.0 ],
+            [ 0.0,-1.0, 0.0, 1.0 ],
+            [ 0.0, 0.0, 1.0, 1.0 ],
+            [ 0.0, 0.0,-1.0, 1.0 ],
+            ] )
+        points = numpy.array( [
+            [ 0.0, 0.0, 0.0 ],
+            [ 0.5, 0.0, 0.0 ],
+            [ 0.0,-1.0, 0.0 ],
+            [ 3.0, 0.0, 0.0 ],
+            ] )
+
+        def inside():
+            result = gt.point_inside_planes( points, planes )
+            self.assertTrue( numpy.array_equal( result, [ True, True, True, False ] ), "Point inside planes incorrect" )
+            self.assertTrue( gt.point_inside_planes( points[ 0 ], planes ) )
+
+            # every point against a stack of volumes
+            volumes = numpy.stack( [ planes, planes * [ 1.0, 1.0, 1.0, 4.0 ] ] )
+            result = gt.point_inside_planes( points[ :, numpy.newaxis ], volumes )
+            self.assertTrue(
+                numpy.array_equal( result, [ [ True, True ], [ True, True ], [ True, True ], [ False, True ] ] ),
+                "Point inside volumes incorrect"
+                )
+        inside()
+
+        def distance():
+            result = gt.point_distance_to_planes( points, planes )
+            self.assertTrue( numpy.allclose( result, [ -1.0, -0.5, 0.0, 2.0 ] ), "Point distance to planes incorrect" )
+
+            # the same as the distance to the equivalent AABB inside the volume
+            random = numpy.random.RandomState( 0 )
+            samples = random.uniform( -1.0, 1.0, (100, 3) )
+            obj = aabb.create_from_bounds( [ -1.0, -1.0, -1.0 ], [ 1.0, 1.0, 1.0 ] )
+            self.assertTrue(
+                numpy.allclose( gt.point_distance_to_planes( samples, planes ), gt.point_distance_to_aabb( samples, obj ) ),
+                "Point distance to planes incorrect"
+                )
+        distance()
+
+    def test_sphere_does_intersect_sphere( self ):
+        spheres = numpy.array( [
+            [ 0.0, 0.0, 0.0, 1.0 ],
+            [ 1.5, 0.0, 0.0, 1.0 ],
+            [ 2.0, 0.0, 0.0, 1.0 ],
+            [ 5.0, 0.0, 0.0, 1.0 ],
+            ] )
+        self.assertTrue( gt.sphere_does_intersect_sphere( spheres[ 0 ], spheres[ 1 ] ) )
+        self.assertTrue(
+            numpy.array_equal( gt.sphere_does_intersect_sphere( spheres[ 0 ], spheres ), [ True, True, True, False ] ),
+            "Sphere intersect sphere incorrect"
+            )
+        self.assertTrue(
+            numpy.allclose( gt.sphere_penetration_sphere( spheres[ 0 ], spheres ), [ 2.0, 0.5, 0.0, 0.0 ] ),
+            "Sphere penetration sphere incorrect"
+            )
+
+    def test_aabb_intersect_aabb( self ):
+        obj = aabb.create_from_bounds( [ 0.0, 0.0, 0.0 ], [ 1.0, 1.0, 1.0 ] )
+        others = numpy.array( [
+            [ [ 0.8, 0.2, 0.2 ], [ 3.0, 3.0, 3.0 ] ],
+            [ [ 0.1, 0.1, -2.0 ], [ 0.9, 0.9, 0.3 ] ],
+            [ [ 1.0, 0.0, 0.0 ], [ 2.0, 1.0, 1.0 ] ],
+            [ [ 1.5, 0.0, 0.0 ], [ 2.0, 1.0, 1.0 ] ],
+            ] )
+
+        def intersect():
+            result = gt.aabb_intersect_aabb( obj, others )
+            self.assertTrue( numpy.array_equal( result, [ True, True, True, False ] ), "AABB intersect AABB incorrect" )
+            self.assertTrue( gt.aabb_intersect_aabb( obj, others[ 0 ] ) )
+
+            # every AABB against every AABB
+            result = gt.aabb_intersect_aabb( others[ :, numpy.newaxis ], others )
+            self.assertEqual( result.shape, (4, 4) )
+            self.assertTrue( numpy.array_equal( result, result.T ), "AABB intersect AABB not symmetric" )
+        intersect()
+
+        def penetration():
+            depth, normal = gt.aabb_penetration_aabb( obj, others )
+            self.assertTrue( numpy.allclose( depth, [ 0.2, 0.3, 0.0, 0.0 ] ), "AABB penetration depth incorrect" )
+            expected = [
+                [ -1.0, 0.0, 0.0 ],
+                [ 0.0, 0.0, 1.0 ],
+                [ 0.0, 0.0, 0.0 ],
+                [ 0.0, 0.0, 0.0 ],
+                ]
+            self.assertTrue( numpy.allclose( normal, expected ), "AABB penetration normal incorrect" )
+
+            # moving the AABBs apart by the penetration leaves them touching
+            random = numpy.random.RandomState( 0 )
+            lower = random.uniform( -1.0, 1.0, (2, 100, 3) )
+            boxes = numpy.stack( [ lower, lower + random.uniform( 0.1, 1.0, (2, 100, 3) ) ], axis = -2 )
+            depth, normal = gt.aabb_penetration_aabb( boxes[ 0 ], boxes[ 1 ] )
+            moved = boxes[ 0 ] + (normal * depth[ :, numpy.newaxis ])[ :, numpy.newaxis ]
+            self.assertTrue( numpy.allclose( gt.aabb_penetration_aabb( moved, boxes[ 1 ] )[ 0 ], 0.0 ), "AABB penetration incorrect" )
+        penetration()
+
+    def test_aabb_intersect_plane( self ):
+        obj = aabb.create_from_bounds( [ -1.0, -1.0, -1.0 ], [ 1.0, 1.0, 1.0 ] )
+        normal = numpy.array( [ 1.0, 1.0, 0.0 ] ) / numpy.sqrt( 2.0 )
+        planes = numpy.array( [
+            [ 0.0, 1.0, 0.0, 0.5 ],
+            [ 0.0, 1.0, 0.0, -1.0 ],
+            [ 0.0, 1.0, 0.0, -3.0 ],
+            [ 0.0, 1.0, 0.0, 3.0 ],
+            numpy.append( normal, -1.0 ),
+            ] )
+
+        result = gt.aabb_intersect_plane( obj, planes )
+        self.assertTrue( numpy.array_equal( result, [ True, True, False, False, True ] ), "AABB intersect plane incorrect" )
+
+        depth, normals = gt.aabb_penetration_plane( obj, planes )
+        self.assertTrue( numpy.allclose( depth, [ 0.5, 2.0, 4.0, 0.0, 1.0 + numpy.sqrt( 2.0 ) ] ), "AABB penetration plane depth incorrect" )
+        self.assertTrue( numpy.allclose( normals[ 0:3 ], planes[ 0:3, 0:3 ] ), "AABB penetration plane normal incorrect" )
+        self.assertTrue( numpy.array_equal( normals[ 3 ], [ 0.0, 0.0, 0.0 ] ), "AABB penetration plane normal incorrect" )
+
+    def test_sphere_intersect_aabb( self ):
+        obj = aabb.create_from_bounds( [ -1.0, -1.0, -1.0 ], [ 1.0, 1.0, 1.0 ] )
+        spheres = numpy.array( [
+            [ 0.0, 0.5, 0.0, 0.25 ],
+            [ 1.5, 0.0, 0.0, 1.0 ],
+            [ 2.0, 2.0, 0.0, 1.0 ],
+            [ 2.0, 0.0, 0.0, 1.0 ],
+            ] )
+
+        result = gt.sphere_intersect_aabb( spheres, obj )
+        self.assertTrue( numpy.array_equal( result, [ True, True, False, True ] ), "Sphere intersect AABB incorrect" )
+
+        depth, normal = gt.sphere_penetration_aabb( spheres, obj )
+        self.assertTrue( numpy.allclose( depth, [ 0.75, 0.5, 0.0, 0.0 ] ), "Sphere penetration AABB depth incorrect" )
+        expected = [
+            [ 0.0, 1.0, 0.0 ],
+            [ 1.0, 0.0, 0.0 ],
+            [ 0.0, 0.0, 0.0 ],
+            [ 0.0, 0.0, 0.0 ],
+            ]
+        self.assertTrue( numpy.allclose( normal, expected ), "Sphere penetration AABB normal incorrect" )
+
+        # moving the spheres apart by the penetration leaves them touching
+        random = numpy.random.RandomState( 0 )
+        spheres = numpy.concatenate( [ random.uniform( -2.0, 2.0, (100, 3) ), random.uniform( 0.1, 1.0, (100, 1) ) ], axis = -1 )
+        depth, normal = gt.sphere_penetration_aabb( spheres, obj )
+        spheres[ :, 0:3 ] += normal * depth[ :, numpy.newaxis ]
+        self.assertTrue( numpy.allclose( gt.sphere_penetration_aabb( spheres, obj )[ 0 ], 0.0 ), "Sphere penetration AABB incorrect" )
+
+    def test_sphere_intersect_plane( self ):
+        plane = numpy.array( [ 0.0, 1.0, 0.0, 0.0 ] )
+        spheres = numpy.array( [
+            [ 0.0, 0.5, 0.0, 1.0 ],
+            [ 0.0, -0.5, 0.0, 1.0 ],
+            [ 0.0, -3.0, 0.0, 1.0 ],
+            [ 0.0, 3.0, 0.0, 1.0 ],
+            ] )
+
+        result = gt.sphere_intersect_plane( spheres, plane )
+        self.assertTrue( numpy.array_equal( result, [ True, True, False, False ] ), "Sphere intersect plane incorrect" )
+
+        depth, normal = gt.sphere_penetration_plane( spheres, plane )
+        self.assertTrue( numpy.allclose( depth, [ 0.5, 1.5, 4.0, 0.0 ] ), "Sphere penetration plane depth incorrect" )
+        self.assertTrue(
+            numpy.array_equal( normal, [ plane[ 0:3 ], plane[ 0:3 ], plane[ 0:3 ], [ 0.0, 0.0, 0.0 ] ] ),
+            "Sphere penetration plane normal incorrect"
+            )
 
 if __name__ == '__main__':
     unittest.main()
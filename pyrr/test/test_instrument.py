@@ -0,0 +1,138 @@
+import importlib
+import unittest
+
+import numpy
+
+from pyrr import instrument
+from pyrr import packing
+from pyrr import quaternion
+from pyrr import stream
+from pyrr import utils
+from pyrr import vector
+
+
+class test_instrument( unittest.TestCase ):
+
+    def setUp( self ):
+        instrument.reset()
+
+    def tearDown( self ):
+        instrument.disable()
+        instrument.reset()
+
+    def test_disabled( self ):
+        original = vector.normalise
+        self.assertFalse( instrument.is_enabled() )
+
+        instrument.enable()
+        self.assertTrue( instrument.is_enabled() )
+        self.assertTrue( vector.normalise is not original, "Function not instrumented" )
+        self.assertTrue( vector.normalise.__wrapped__ is original, "Instrumented function does not wrap original" )
+        self.assertEqual( vector.normalise.__name__, 'normalise' )
+
+        # the original function is restored
+        instrument.disable()
+        self.assertTrue( vector.normalise is original, "Function not restored" )
+
+        vector.normalise( numpy.array( [ 1.0, 0.0, 0.0 ] ) )
+        self.assertEqual( instrument.statistics(), {} )
+
+    def test_statistics( self ):
+        instrument.enable()
+        vec = numpy.array( [ 1.0, 2.0, 3.0 ] )
+        vecs = numpy.ones( (10,3), dtype = 'float32' )
+
+        vector.normalise( vec )
+        vector.normalise( vec )
+        vector.normalise( vecs )
+        quaternion.create_from_x_rotation( 0.5 )
+
+        statistics = instrument.statistics()
+        self.assertEqual( set( statistics ), set( [ 'pyrr.vector.normalise', 'pyrr.quaternion.create_from_x_rotation' ] ) )
+
+        normalise = statistics[ 'pyrr.vector.normalise' ]
+        self.assertEqual( normalise.calls, 3 )
+        self.assertTrue( normalise.time > 0.0 )
+        self.assertEqual( normalise.signatures[ ( ( 'float64', (3,) ), ) ], 2 )
+        self.assertEqual( normalise.signatures[ ( ( 'float32', (10,3) ), ) ], 1 )
+
+        self.assertEqual(
+            instrument.format_signature( ( ( 'float32', (10,3) ), ( 'float', None ), ( 'out', 'NoneType', None ) ) ),
+            '(float32[10,3], float, out = NoneType)'
+            )
+
+        instrument.reset()
+        self.assertEqual( instrument.statistics(), {} )
+
+    def test_exceptions( self ):
+        instrument.enable()
+        self.assertRaises( ValueError, quaternion.apply_to_vector, quaternion.create_identity(), numpy.zeros( 2 ) )
+        self.assertEqual( instrument.statistics()[ 'pyrr.quaternion.apply_to_vector' ].calls, 1 )
+
+    def test_report( self ):
+        instrument.enable()
+        vector.normalise( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+        vector.normalise( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+        quaternion.create_from_x_rotation( 0.5 )
+
+        report = instrument.report( sort = 'calls', limit = 1 )
+        lines = report.split( '\n' )
+        self.assertEqual( len( lines ), 3 )
+        self.assertTrue( 'function' in lines[ 0 ] )
+        self.assertTrue( lines[ 1 ].endswith( 'pyrr.vector.normalise' ) )
+        self.assertTrue( lines[ 2 ].endswith( '(float64[3])' ) )
+
+        self.assertRaises( ValueError, instrument.report, 'name' )
+
+    def test_batchability( self ):
+        instrument.enable( callsites = True )
+        quat = quaternion.create_from_x_rotation( 0.5 )
+        vecs = numpy.ones( (10,3) )
+
+        # single items in a loop
+        for vec in vecs:
+            quaternion.apply_to_vector( quat, vec )
+        # a batched call
+        quaternion.apply_to_vector( quat, vecs )
+
+        value = instrument.statistics()[ 'pyrr.quaternion.apply_to_vector' ]
+        self.assertEqual( value.calls, 11 )
+        self.assertEqual( len( value.callsites ), 2 )
+        self.assertEqual( sum( value.single_calls.values() ), 10 )
+        # internal calls from pyrr are not call sites
+        self.assertEqual( len( instrument.statistics()[ 'pyrr.quaternion.cross' ].callsites ), 0 )
+
+        findings = instrument.batchability( threshold = 5 )
+        self.assertEqual( len( findings ), 1 )
+        name, callsite, count, calls, suggestion = findings[ 0 ]
+        self.assertEqual( name, 'pyrr.quaternion.apply_to_vector' )
+        self.assertEqual( callsite[ 0 ], __file__.replace( '.pyc', '.py' ) )
+        self.assertEqual( callsite[ 2 ], 'test_batchability' )
+        self.assertEqual( (count, calls), (10, 10) )
+
+        self.assertEqual( instrument.batchability( threshold = 11 ), [] )
+        self.assertEqual( len( instrument.batchability_report( threshold = 5 ).split( '\n' ) ), 3 )
+
+    def test_batched( self ):
+        # every batched function exists
+        for name in instrument.batched:
+            module, function = name.rsplit( '.', 1 )
+            self.assertTrue( callable( getattr( importlib.import_module( module ), function ) ), name )
+
+        # functions are registered where they are defined
+        @utils.batchable( (1,), 'pass (N,3) vectors' )
+        def length( vec ):
+            return vector.length( vec )
+        self.assertEqual( instrument.batched.pop( '%s.length' % __name__ ), ( (1,), 'pass (N,3) vectors' ) )
+
+    def test_modules( self ):
+        instrument.enable()
+        packing.pack( numpy.ones( (4,2) ), 8.0 )
+        stream.consume( numpy.ones( (10,3) ), 4 )
+
+        result = instrument.statistics()
+        for name in ( 'pyrr.packing.pack', 'pyrr.stream.consume' ):
+            self.assertEqual( result[ name ].calls, 1, "%s not instrumented" % name )
+
+if __name__ == '__main__':
+    unittest.main()
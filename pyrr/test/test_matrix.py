@@ -82,6 +82,104 @@ class test_matrix( unittest.TestCase ):
         batch_apply()
 
     
+
+    def test_multiply( self ):
+        def single():
+            m1 = numpy.arange( 16.0 ).reshape( (4,4) )
+            m2 = numpy.arange( 16.0, 32.0 ).reshape( (4,4) )
+            result = matrix.multiply( m1, m2 )
+
+            self.assertTrue(
+                numpy.array_equal( result, numpy.dot( m1, m2 ) ),
+                "Matrix multiply incorrect"
+                )
+        single()
+
+        def batch():
+            m1 = numpy.arange( 48.0 ).reshape( (3,4,4) )
+            m2 = numpy.arange( 48.0, 96.0 ).reshape( (3,4,4) )
+            result = matrix.multiply( m1, m2 )
+
+            expected = numpy.array( [ numpy.dot( a, b ) for a, b in zip( m1, m2 ) ] )
+
+            self.assertTrue(
+                numpy.array_equal( result, expected ),
+                "Matrix batch multiply incorrect"
+                )
+        batch()
+
+        def broadcast():
+            m1 = numpy.arange( 16.0 ).reshape( (4,4) )
+            m2 = numpy.arange( 48.0 ).reshape( (3,4,4) )
+            result = matrix.multiply( m1, m2 )
+
+            expected = numpy.array( [ numpy.dot( m1, b ) for b in m2 ] )
+
+            self.assertTrue(
+                numpy.array_equal( result, expected ),
+                "Matrix broadcast multiply incorrect"
+                )
+        broadcast()
+
+        def out():
+            m1 = numpy.arange( 48.0 ).reshape( (3,4,4) )
+            m2 = numpy.arange( 48.0, 96.0 ).reshape( (3,4,4) )
+            buffer = numpy.empty( (3,4,4) )
+            result = matrix.multiply( m1, m2, out = buffer )
+
+            self.assertTrue( result is buffer, "Matrix multiply out not used" )
+            self.assertTrue(
+                numpy.array_equal( buffer, numpy.matmul( m1, m2 ) ),
+                "Matrix multiply out incorrect"
+                )
+            self.assertRaises( ValueError, matrix.multiply, m1, m2, m1 )
+        out()
+
+    def test_multiply_chain( self ):
+        def list_of_matrices():
+            mats = [ numpy.arange( 16.0 ).reshape( (4,4) ) + i for i in range( 4 ) ]
+            result = matrix.multiply_chain( mats )
+
+            expected = numpy.dot( numpy.dot( numpy.dot( mats[ 0 ], mats[ 1 ] ), mats[ 2 ] ), mats[ 3 ] )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Matrix multiply_chain incorrect"
+                )
+        list_of_matrices()
+
+        def stacked():
+            for count in range( 1, 8 ):
+                mats = numpy.random.uniform( -1.0, 1.0, (count,3,3) )
+                result = matrix.multiply_chain( mats )
+
+                expected = mats[ 0 ]
+                for m in mats[ 1: ]:
+                    expected = numpy.dot( expected, m )
+
+                self.assertTrue(
+                    numpy.allclose( result, expected ),
+                    "Matrix multiply_chain of stack incorrect"
+                    )
+        stacked()
+
+        def broadcast():
+            mat = numpy.arange( 16.0 ).reshape( (4,4) )
+            stack = numpy.arange( 32.0 ).reshape( (2,4,4) )
+            buffer = numpy.empty( (2,4,4) )
+            result = matrix.multiply_chain( [ stack, mat, stack ], out = buffer )
+
+            expected = numpy.array( [ numpy.dot( numpy.dot( s, mat ), s ) for s in stack ] )
+
+            self.assertTrue( result is buffer, "Matrix multiply_chain out not used" )
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Matrix multiply_chain broadcast incorrect"
+                )
+        broadcast()
+
+        self.assertRaises( ValueError, matrix.multiply_chain, [] )
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -174,5 +174,102 @@ class test_matrix33( unittest.TestCase ):
                 )
         rotated_z()
 
+    def test_inverse_orthonormal( self ):
+        mat = numpy.dot(
+            matrix33.create_from_x_rotation( 0.5 ),
+            matrix33.create_from_y_rotation( 1.2 )
+            )
+        result = matrix33.inverse_orthonormal( mat )
+
+        assert_array_almost_equal( result, numpy.linalg.inv( mat ) )
+
+    def test_inverse_orthogonal( self ):
+        def single():
+            mat = numpy.dot(
+                matrix33.create_from_scale( [ 2.0, 3.0, 0.5 ] ),
+                matrix33.create_from_z_rotation( 0.7 )
+                )
+            result = matrix33.inverse_orthogonal( mat )
+
+            assert_array_almost_equal( result, numpy.linalg.inv( mat ) )
+        single()
+
+        def batch():
+            mats = numpy.array( [
+                numpy.dot(
+                    matrix33.create_from_scale( [ 1.0 + i, 2.0, 0.25 ] ),
+                    matrix33.create_from_y_rotation( 0.3 * i )
+                    )
+                for i in range( 5 )
+                ] )
+            result = matrix33.inverse_orthogonal( mats )
+
+            assert_array_almost_equal( result, numpy.linalg.inv( mats ) )
+        batch()
+
+    def test_is_orthogonal( self ):
+        mats = numpy.array( [
+            matrix33.create_from_x_rotation( 0.5 ),
+            matrix33.create_from_scale( [ 1.0, 2.0, 3.0 ] ),
+            [ [ 1.0, 1.0, 0.0 ], [ 0.0, 1.0, 0.0 ], [ 0.0, 0.0, 1.0 ] ],
+            numpy.zeros( (3,3) ),
+            ] )
+        result = matrix33.is_orthogonal( mats )
+
+        self.assertTrue(
+            numpy.array_equal( result, [ True, True, False, False ] ),
+            "Matrix33 is_orthogonal incorrect"
+            )
+
+    def test_inverse_auto( self ):
+        mats = numpy.array( [
+            matrix33.create_from_x_rotation( 0.5 ),
+            numpy.dot(
+                matrix33.create_from_scale( [ 1.0, 2.0, 3.0 ] ),
+                matrix33.create_from_z_rotation( 0.1 )
+                ),
+            [ [ 1.0, 1.0, 0.0 ], [ 0.0, 1.0, 0.0 ], [ 0.0, 2.0, 1.0 ] ],
+            ] )
+        result = matrix33.inverse_auto( mats )
+
+        assert_array_almost_equal( result, numpy.linalg.inv( mats ) )
+        assert_array_almost_equal(
+            matrix33.inverse_auto( mats[ 2 ] ),
+            numpy.linalg.inv( mats[ 2 ] )
+            )
+
+    def test_multiply( self ):
+        m1 = numpy.array( [
+            matrix33.create_from_x_rotation( 0.3 * i )
+            for i in range( 4 )
+            ] )
+        m2 = numpy.array( [
+            matrix33.create_from_z_rotation( 0.2 * i )
+            for i in range( 4 )
+            ] )
+        result = matrix33.multiply( m1, m2 )
+
+        expected = numpy.array( [ numpy.dot( a, b ) for a, b in zip( m1, m2 ) ] )
+
+        self.assertTrue(
+            numpy.allclose( result, expected ),
+            "Matrix33 batch multiply incorrect"
+            )
+
+    def test_multiply_chain( self ):
+        mats = numpy.array( [
+            matrix33.create_from_x_rotation( 0.3 ),
+            matrix33.create_from_scale( [ 1.0, 2.0, 3.0 ] ),
+            matrix33.create_from_z_rotation( 0.2 ),
+            ] )
+        result = matrix33.multiply_chain( mats )
+
+        expected = numpy.dot( numpy.dot( mats[ 0 ], mats[ 1 ] ), mats[ 2 ] )
+
+        self.assertTrue(
+            numpy.allclose( result, expected ),
+            "Matrix33 multiply_chain incorrect"
+            )
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import math
 
 import numpy
+from numpy.testing import assert_array_almost_equal
 
 from pyrr import matrix33
 from pyrr import matrix44
@@ -106,6 +107,20 @@ class test_matrix44( unittest.TestCase ):
             "Matrix44 create_from_matrix33 incorrect"
             )
 
+    def test_create_from_eulers( self ):
+        eulers = numpy.array( [ [ 0.1, 0.2, 0.3 ], [ -0.4, 0.5, 1.6 ] ] )
+        result = matrix44.create_from_eulers( eulers, 'zyx' )
+
+        self.assertEqual( result.shape, (2,4,4) )
+        self.assertTrue(
+            numpy.allclose( result[ :, 0:3, 0:3 ], matrix33.create_from_eulers( eulers, 'zyx' ) ),
+            "Matrix44 from eulers incorrect"
+            )
+        self.assertTrue(
+            numpy.array_equal( result[ :, 3 ], [ [ 0.0, 0.0, 0.0, 1.0 ] ] * 2 ),
+            "Matrix44 from eulers translation incorrect"
+            )
+
     def test_create_from_quaternion( self ):
         def identity():
             quat = quaternion.create_identity()
@@ -227,5 +242,130 @@ class test_matrix44( unittest.TestCase ):
                 )
         translation()
     
+
+    def test_inverse_orthonormal( self ):
+        mat = numpy.dot(
+            matrix44.create_from_x_rotation( 0.5 ),
+            matrix44.create_from_z_rotation( 1.2 )
+            )
+        result = matrix44.inverse_orthonormal( mat )
+
+        assert_array_almost_equal( result, numpy.linalg.inv( mat ) )
+
+    def test_inverse_rigid( self ):
+        def single():
+            mat = numpy.dot(
+                matrix44.create_from_y_rotation( 0.9 ),
+                matrix44.create_from_translation( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+                )
+            result = matrix44.inverse_rigid( mat )
+
+            assert_array_almost_equal( result, numpy.linalg.inv( mat ) )
+        single()
+
+        def batch():
+            mats = numpy.array( [
+                numpy.dot(
+                    matrix44.create_from_x_rotation( 0.2 * i ),
+                    matrix44.create_from_translation( numpy.array( [ i, -1.0, 2.0 * i ] ) )
+                    )
+                for i in range( 5 )
+                ] )
+            result = matrix44.inverse_rigid( mats )
+
+            assert_array_almost_equal( result, numpy.linalg.inv( mats ) )
+        batch()
+
+    def test_inverse_trs( self ):
+        mats = numpy.array( [
+            numpy.dot(
+                numpy.dot(
+                    matrix44.create_from_scale( [ 1.0 + i, 0.5, 3.0 ] ),
+                    matrix44.create_from_z_rotation( 0.4 * i )
+                    ),
+                matrix44.create_from_translation( numpy.array( [ 3.0, i, -2.0 ] ) )
+                )
+            for i in range( 4 )
+            ] )
+        result = matrix44.inverse_trs( mats )
+
+        assert_array_almost_equal( result, numpy.linalg.inv( mats ) )
+
+    def test_is_trs( self ):
+        projection = matrix44.create_perspective_projection_matrix( 90, 1.0, 1.0, 100.0 )
+        skew = matrix44.create_identity()
+        skew[ 1, 0 ] = 0.5
+        mats = numpy.array( [
+            matrix44.create_identity(),
+            matrix44.create_from_translation( numpy.array( [ 1.0, 2.0, 3.0 ] ) ),
+            projection,
+            skew,
+            ] )
+        result = matrix44.is_trs( mats )
+
+        self.assertTrue(
+            numpy.array_equal( result, [ True, True, False, False ] ),
+            "Matrix44 is_trs incorrect"
+            )
+
+    def test_inverse_auto( self ):
+        skew = matrix44.create_identity()
+        skew[ 1, 0 ] = 0.5
+        mats = numpy.array( [
+            numpy.dot(
+                matrix44.create_from_scale( [ 2.0, 2.0, 2.0 ] ),
+                matrix44.create_from_translation( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+                ),
+            matrix44.create_perspective_projection_matrix( 90, 1.0, 1.0, 100.0 ),
+            skew,
+            ] )
+        result = matrix44.inverse_auto( mats )
+
+        assert_array_almost_equal( result, numpy.linalg.inv( mats ) )
+
+    def test_multiply( self ):
+        m1 = numpy.array( [
+            matrix44.create_from_x_rotation( 0.3 * i )
+            for i in range( 4 )
+            ] )
+        m2 = matrix44.create_from_translation( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+        result = matrix44.multiply( m1, m2 )
+
+        expected = numpy.array( [ numpy.dot( m, m2 ) for m in m1 ] )
+
+        self.assertTrue(
+            numpy.allclose( result, expected ),
+            "Matrix44 batch multiply incorrect"
+            )
+
+    def test_multiply_chain( self ):
+        scale = matrix44.create_from_scale( [ 2.0, 2.0, 2.0 ] )
+        rotation = matrix44.create_from_y_rotation( 0.5 )
+        translation = matrix44.create_from_translation( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+        result = matrix44.multiply_chain( [ scale, rotation, translation ] )
+
+        expected = numpy.dot( numpy.dot( scale, rotation ), translation )
+
+        self.assertTrue(
+            numpy.allclose( result, expected ),
+            "Matrix44 multiply_chain incorrect"
+            )
+
+    def test_apply_to_vector_batch( self ):
+        mat = matrix44.multiply(
+            matrix44.create_from_x_rotation( 0.5 ),
+            matrix44.create_from_translation( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+            )
+        vecs = numpy.array( [ [ 1.0, 0.0, 0.0 ], [ 0.0, 2.0, 0.0 ], [ 1.0, 2.0, 3.0 ] ] )
+
+        result = matrix44.apply_to_vector( mat, vecs )
+
+        expected = numpy.array( [ matrix44.apply_to_vector( mat, vec ) for vec in vecs ] )
+
+        self.assertTrue(
+            numpy.allclose( result, expected ),
+            "Matrix44 apply_to_vector incorrect with multiple vectors"
+            )
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+import numpy
+
+from pyrr import obb
+from pyrr import matrix33
+from pyrr import matrix44
+from pyrr import quaternion
+
+
+class test_obb( unittest.TestCase ):
+
+    def setUp( self ):
+        self.rotation = matrix33.create_from_quaternion(
+            quaternion.normalise( numpy.array( [ 0.2, 0.3, 0.1, 0.9 ] ) )
+            )
+
+    def tearDown( self ):
+        pass
+
+    def test_create( self ):
+        box = obb.create( [ 1.0, 2.0, 3.0 ], numpy.identity( 3 ), [ 0.5, 1.0, 1.5 ] )
+        self.assertEqual( box.shape, (5, 3) )
+        self.assertTrue( numpy.array_equal( obb.centre( box ), [ 1.0, 2.0, 3.0 ] ) )
+        self.assertTrue( numpy.array_equal( obb.axes( box ), numpy.identity( 3 ) ) )
+        self.assertTrue( numpy.array_equal( obb.extents( box ), [ 0.5, 1.0, 1.5 ] ) )
+
+        boxes = obb.create( numpy.zeros( (4, 3) ), numpy.identity( 3 ), [ 1.0, 1.0, 1.0 ] )
+        self.assertEqual( boxes.shape, (4, 5, 3) )
+
+    def test_create_from_points( self ):
+        random = numpy.random.RandomState( 0 )
+        points = random.normal( size = (200, 3) ) * [ 5.0, 2.0, 0.5 ]
+        points = numpy.dot( points, self.rotation ) + [ 1.0, 2.0, 3.0 ]
+
+        box = obb.create_from_points( points )
+        axes = obb.axes( box )
+        self.assertTrue( numpy.allclose( numpy.dot( axes, axes.T ), numpy.identity( 3 ) ), "OBB axes not orthonormal" )
+        self.assertTrue( numpy.isclose( numpy.linalg.det( axes ), 1.0 ), "OBB axes not right handed" )
+
+        # the principal axis is the first row of the rotation
+        self.assertTrue( numpy.isclose( numpy.absolute( numpy.dot( axes[ 0 ], self.rotation[ 0 ] ) ), 1.0, atol = 1e-2 ), "OBB axes incorrect" )
+
+        local = numpy.dot( points - obb.centre( box ), axes.T )
+        self.assertTrue( numpy.all( numpy.absolute( local ) <= obb.extents( box ) + 1e-9 ), "Points outside OBB" )
+        self.assertTrue( numpy.allclose( numpy.amax( numpy.absolute( local ), axis = 0 ), obb.extents( box ) ), "OBB not tight" )
+
+        # stacks of point sets
+        boxes = obb.create_from_points( numpy.stack( [ points, points * 2.0 ] ) )
+        self.assertEqual( boxes.shape, (2, 5, 3) )
+        self.assertTrue( numpy.allclose( obb.extents( boxes[ 1 ] ), obb.extents( box ) * 2.0 ), "OBB stack incorrect" )
+
+    def test_create_from_aabb( self ):
+        aabb = numpy.array( [ [ -1.0, -1.0, -1.0 ], [ 1.0, 2.0, 3.0 ] ] )
+        box = obb.create_from_aabb( aabb )
+        self.assertTrue( numpy.array_equal( obb.create_aabb( box ), aabb ), "OBB from AABB incorrect" )
+
+        matrix = numpy.dot( matrix44.create_from_scale( [ 2.0, 3.0, 4.0 ] ), matrix44.create_from_matrix33( self.rotation ) )
+        matrix[ 3, 0:3 ] = [ 1.0, 2.0, 3.0 ]
+        box = obb.create_from_aabb( aabb, matrix )
+
+        # the corners of the OBB are the transformed corners of the AABB
+        corners = numpy.array( [ [ x, y, z, 1.0 ] for x in aabb[ :, 0 ] for y in aabb[ :, 1 ] for z in aabb[ :, 2 ] ] )
+        expected = numpy.dot( corners, matrix )[ :, 0:3 ]
+        self.assertTrue( numpy.allclose( obb.corners( box ), expected ), "OBB from transformed AABB incorrect" )
+
+        boxes = obb.create_from_aabb( aabb, numpy.stack( [ matrix, numpy.identity( 4 ) ] ) )
+        self.assertEqual( boxes.shape, (2, 5, 3) )
+        self.assertTrue( numpy.allclose( boxes[ 0 ], box ), "OBB stack incorrect" )
+
+    def test_create_aabb( self ):
+        box = obb.create( [ 0.0, 0.0, 0.0 ], self.rotation, [ 1.0, 2.0, 3.0 ] )
+        corners = obb.corners( box )
+        expected = numpy.array( [ numpy.amin( corners, axis = 0 ), numpy.amax( corners, axis = 0 ) ] )
+        self.assertTrue( numpy.allclose( obb.create_aabb( box ), expected ), "AABB of OBB incorrect" )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+
+import numpy
+
+from pyrr import matrix44
+from pyrr import objects
+from pyrr import quaternion
+from pyrr import vector
+
+
+class test_objects( unittest.TestCase ):
+
+    def setUp( self ):
+        random = numpy.random.RandomState( 0 )
+        self.vec3 = random.uniform( -1.0, 1.0, 3 )
+        self.vec4 = random.uniform( -1.0, 1.0, 4 )
+        self.quat1 = quaternion.normalise( random.uniform( -1.0, 1.0, 4 ) )
+        self.quat2 = quaternion.normalise( random.uniform( -1.0, 1.0, 4 ) )
+        self.mat = matrix44.multiply(
+            matrix44.create_from_quaternion( self.quat1 ),
+            matrix44.create_from_translation( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+            )
+
+    def tearDown( self ):
+        pass
+
+    def test_conversion( self ):
+        vec = objects.Vector3.from_array( self.vec3 )
+        self.assertEqual( vec.x, self.vec3[ 0 ] )
+        self.assertTrue( numpy.array_equal( numpy.asarray( vec ), self.vec3 ), "Vector3 array conversion incorrect" )
+        self.assertEqual( len( vec ), 3 )
+        self.assertEqual( vec[ 2 ], self.vec3[ 2 ] )
+
+        mat = objects.Matrix44.from_array( self.mat )
+        self.assertEqual( mat[ 3, 1 ], self.mat[ 3, 1 ] )
+        self.assertTrue( numpy.array_equal( mat.to_array(), self.mat ), "Matrix44 array conversion incorrect" )
+
+        vecs = objects.Vector4.list_from_array( numpy.arange( 8.0 ).reshape( 2, 4 ) )
+        self.assertEqual( vecs[ 1 ], objects.Vector4( 4.0, 5.0, 6.0, 7.0 ) )
+        self.assertTrue(
+            numpy.array_equal( objects.to_array( vecs ), numpy.arange( 8.0 ).reshape( 2, 4 ) ),
+            "Batch array conversion incorrect"
+            )
+
+        # objects may be passed to the functional api
+        self.assertTrue( numpy.allclose( vector.length( vec ), numpy.linalg.norm( self.vec3 ) ), "Vector3 not array-like" )
+
+        self.assertRaises( ValueError, objects.Matrix44, 1.0, 2.0 )
+
+    def test_vector3( self ):
+        v1 = objects.Vector3( 1.0, 2.0, 3.0 )
+        v2 = objects.Vector3( -3.0, 0.5, 2.0 )
+        a1 = numpy.array( [ 1.0, 2.0, 3.0 ] )
+        a2 = numpy.array( [ -3.0, 0.5, 2.0 ] )
+
+        self.assertTrue( numpy.allclose( v1 + v2, a1 + a2 ) )
+        self.assertTrue( numpy.allclose( v1 - v2, a1 - a2 ) )
+        self.assertTrue( numpy.allclose( v1 * v2, a1 * a2 ) )
+        self.assertTrue( numpy.allclose( 2.0 * v1, a1 * 2.0 ) )
+        self.assertTrue( numpy.allclose( v1 / 2.0, a1 / 2.0 ) )
+        self.assertTrue( numpy.allclose( -v1, -a1 ) )
+        self.assertTrue( numpy.allclose( v1 ^ v2, vector.cross( a1, a2 ) ), "Vector3 cross incorrect" )
+        self.assertTrue( numpy.isclose( v1 | v2, vector.dot( a1, a2 ) ), "Vector3 dot incorrect" )
+        self.assertTrue( numpy.isclose( v1.length(), vector.length( a1 ) ), "Vector3 length incorrect" )
+        self.assertTrue( numpy.allclose( v1.normalise(), vector.normalise( a1 ) ), "Vector3 normalise incorrect" )
+        self.assertTrue( numpy.allclose( v1.interpolate( v2, 0.25 ), vector.interpolate( a1, a2, 0.25 ) ) )
+
+        self.assertEqual( v1, objects.Vector3( 1.0, 2.0, 3.0 ) )
+        self.assertNotEqual( v1, v2 )
+        self.assertRaises( TypeError, lambda: v1 + 'a' )
+
+        # reflected operators
+        self.assertTrue( numpy.allclose( 2.0 - v1, 2.0 - a1 ), "Vector3 reflected subtract incorrect" )
+        self.assertTrue( numpy.allclose( 1.0 / v1, 1.0 / a1 ), "Vector3 reflected divide incorrect" )
+
+        # unsupported operands raise TypeError
+        for operand in ( 'a', 2.0, objects.Vector4() ):
+            self.assertRaises( TypeError, lambda: v1 ^ operand )
+            self.assertRaises( TypeError, lambda: v1 | operand )
+        self.assertRaises( TypeError, lambda: v1 - 'a' )
+        self.assertRaises( TypeError, lambda: 'a' / v1 )
+
+    def test_vector4( self ):
+        v1 = objects.Vector4.from_array( self.vec4 )
+        self.assertTrue( numpy.allclose( v1 + v1, self.vec4 * 2.0 ) )
+        self.assertTrue( numpy.isclose( v1 | v1, vector.dot( self.vec4, self.vec4 ) ) )
+        self.assertTrue( numpy.allclose( v1.normalise(), vector.normalise( self.vec4 ) ) )
+        self.assertTrue( numpy.allclose( 2.0 - v1, 2.0 - self.vec4 ) )
+        self.assertTrue( numpy.allclose( 1.0 / v1, 1.0 / self.vec4 ) )
+        self.assertRaises( TypeError, lambda: v1 | 2.0 )
+
+    def test_quaternion( self ):
+        q1 = objects.Quaternion.from_array( self.quat1 )
+        q2 = objects.Quaternion.from_array( self.quat2 )
+
+        self.assertTrue( numpy.allclose( q1 * q2, quaternion.cross( self.quat1, self.quat2 ) ), "Quaternion cross incorrect" )
+        self.assertTrue( numpy.allclose( ~q1, quaternion.conjugate( self.quat1 ) ), "Quaternion conjugate incorrect" )
+        self.assertTrue( numpy.allclose( q1.inverse(), quaternion.inverse( self.quat1 ) ), "Quaternion inverse incorrect" )
+        self.assertTrue( numpy.isclose( q1.length(), 1.0 ) )
+        self.assertRaises( TypeError, lambda: q1 | 2.0 )
+
+        vec3 = objects.Vector3.from_array( self.vec3 )
+        vec4 = objects.Vector4.from_array( self.vec4 )
+        self.assertTrue(
+            numpy.allclose( q1 * vec3, quaternion.apply_to_vector( self.quat1, self.vec3 ) ),
+            "Quaternion apply to Vector3 incorrect"
+            )
+        self.assertTrue(
+            numpy.allclose( q1 * vec4, quaternion.apply_to_vector( self.quat1, self.vec4 ) ),
+            "Quaternion apply to Vector4 incorrect"
+            )
+
+        result = objects.Quaternion.create_from_axis_rotation( [ 0.0, 1.0, 0.0 ], 0.5 )
+        self.assertTrue( numpy.allclose( result, quaternion.create_from_y_rotation( 0.5 ) ) )
+        self.assertTrue( numpy.allclose( objects.Quaternion.create_from_y_rotation( 0.5 ), result ) )
+
+    def test_matrix44( self ):
+        mat = objects.Matrix44.from_array( self.mat )
+        other = objects.Matrix44.create_from_scale( [ 1.0, 2.0, 3.0 ] )
+
+        self.assertTrue(
+            numpy.allclose( (mat * other).to_array(), matrix44.multiply( self.mat, matrix44.create_from_scale( [ 1.0, 2.0, 3.0 ] ) ) ),
+            "Matrix44 multiply incorrect"
+            )
+        self.assertTrue( numpy.allclose( mat.inverse().to_array(), matrix44.inverse( self.mat ) ), "Matrix44 inverse incorrect" )
+        self.assertTrue( numpy.allclose( (2.0 * mat).to_array(), self.mat * 2.0 ), "Matrix44 reflected multiply incorrect" )
+        self.assertRaises( TypeError, lambda: mat * 'a' )
+        self.assertTrue( numpy.allclose( mat.transpose().to_array(), self.mat.T ), "Matrix44 transpose incorrect" )
+        self.assertEqual( objects.Matrix44() * objects.Matrix44(), objects.Matrix44() )
+
+        self.assertTrue(
+            numpy.allclose( objects.Matrix44.create_from_quaternion( objects.Quaternion.from_array( self.quat1 ) ).to_array(), matrix44.create_from_quaternion( self.quat1 ) ),
+            "Matrix44 from quaternion incorrect"
+            )
+        for axis in ( 'x', 'y', 'z' ):
+            name = 'create_from_%s_rotation' % axis
+            self.assertTrue(
+                numpy.allclose( getattr( objects.Matrix44, name )( 0.3 ).to_array(), getattr( matrix44, name )( 0.3 ) ),
+                "Matrix44 %s incorrect" % name
+                )
+
+        vec3 = objects.Vector3.from_array( self.vec3 )
+        vec4 = objects.Vector4.from_array( self.vec4 )
+        self.assertTrue( numpy.allclose( vec3 * mat, matrix44.apply_to_vector( self.mat, self.vec3 ) ), "Vector3 * Matrix44 incorrect" )
+        self.assertTrue( numpy.allclose( vec4 * mat, matrix44.apply_to_vector( self.mat, self.vec4 ) ), "Vector4 * Matrix44 incorrect" )
+
+
+if __name__ == '__main__':
+    unittest.main()
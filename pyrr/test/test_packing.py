@@ -0,0 +1,78 @@
+import unittest
+
+import numpy
+
+from pyrr import packing
+from pyrr import rectangle
+
+
+class test_packing( unittest.TestCase ):
+
+    def setUp( self ):
+        random = numpy.random.RandomState( 0 )
+        self.sizes = random.randint( 4, 40, (300, 2) )
+
+    def tearDown( self ):
+        pass
+
+    def assertPacked( self, rects, width, height = None ):
+        placed = rects[ ~numpy.isnan( rects[ :, 0, 0 ] ) ]
+        xmin, xmax, ymin, ymax = rectangle.bounds( placed )
+        self.assertTrue( numpy.all( xmin >= 0.0 ) and numpy.all( xmax <= width ), "Rectangles outside atlas" )
+        self.assertTrue( numpy.all( ymin >= 0.0 ), "Rectangles outside atlas" )
+        if height is not None:
+            self.assertTrue( numpy.all( ymax <= height ), "Rectangles outside atlas" )
+
+        # no two rectangles overlap
+        overlap = (
+            (xmin[ :, numpy.newaxis ] < xmax) & (xmin < xmax[ :, numpy.newaxis ]) &
+            (ymin[ :, numpy.newaxis ] < ymax) & (ymin < ymax[ :, numpy.newaxis ])
+            )
+        numpy.fill_diagonal( overlap, False )
+        self.assertFalse( numpy.any( overlap ), "Rectangles overlap" )
+        return len( placed )
+
+    def test_pack( self ):
+        for packing_kind in ( packing.kind.skyline, packing.kind.maxrects ):
+            rects = packing.pack( self.sizes, 256, packing_kind = packing_kind )
+            self.assertEqual( rects.shape, (300, 2, 2) )
+            self.assertTrue( numpy.array_equal( rectangle.size( rects ), self.sizes ), "Sizes not preserved" )
+            self.assertEqual( self.assertPacked( rects, 256 ), 300 )
+
+        self.assertRaises( ValueError, packing.pack, self.sizes, 256, None, 'guillotine' )
+        self.assertRaises( ValueError, packing.pack, -self.sizes, 256 )
+
+    def test_exact_fit( self ):
+        # 16 squares fill the atlas exactly
+        sizes = numpy.full( (16, 2), 16.0 )
+        for packing_kind in ( packing.kind.skyline, packing.kind.maxrects ):
+            atlas = packing.Atlas( 64, 64, packing_kind )
+            rects = atlas.insert( sizes )
+            self.assertEqual( self.assertPacked( rects, 64, 64 ), 16 )
+            self.assertEqual( atlas.occupancy, 1.0 )
+
+            # the atlas is full
+            rects = atlas.insert( [ 1.0, 1.0 ] )
+            self.assertTrue( numpy.all( numpy.isnan( rects ) ), "Rectangle placed in full atlas" )
+            self.assertEqual( atlas.count, 16 )
+
+    def test_atlas( self ):
+        for packing_kind in ( packing.kind.skyline, packing.kind.maxrects ):
+            atlas = packing.Atlas( 256, 256, packing_kind )
+            first = atlas.insert( self.sizes[ :100 ] )
+            second = atlas.insert( self.sizes[ 100: ] )
+            rects = numpy.concatenate( [ first, second ] )
+
+            count = self.assertPacked( rects, 256, 256 )
+            self.assertEqual( atlas.count, count )
+            self.assertTrue( count < 300, "Rectangles placed outside atlas" )
+
+            placed = ~numpy.isnan( rects[ :, 0, 0 ] )
+            area = numpy.sum( numpy.prod( self.sizes[ placed ], axis = -1 ) )
+            self.assertEqual( atlas.area, area )
+            self.assertTrue( 0.8 < atlas.occupancy <= 1.0, "Occupancy incorrect" )
+            self.assertTrue( atlas.used_height <= 256 )
+
+
+if __name__ == '__main__':
+    unittest.main()
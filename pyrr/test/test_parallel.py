@@ -0,0 +1,115 @@
+import unittest
+
+import numpy
+
+from pyrr import geometric_tests as gt
+from pyrr import matrix44
+from pyrr import parallel
+from pyrr import vector
+
+
+class test_parallel( unittest.TestCase ):
+
+    def setUp( self ):
+        parallel.set_workers( 4 )
+
+    def tearDown( self ):
+        parallel.set_workers( None )
+
+    def test_set_workers( self ):
+        parallel.set_workers( 3 )
+        self.assertEqual( parallel.get_workers(), 3 )
+
+        parallel.set_workers( None )
+        self.assertTrue( parallel.get_workers() >= 1 )
+
+        self.assertRaises( ValueError, parallel.set_workers, 0 )
+
+    def test_apply( self ):
+        def allocated():
+            a = numpy.arange( 1000.0 )
+            b = numpy.arange( 1000.0, 2000.0 )
+            result = parallel.apply( numpy.add, [ a, b ], size = 64 )
+
+            self.assertTrue(
+                numpy.array_equal( result, a + b ),
+                "Parallel apply incorrect"
+                )
+        allocated()
+
+        def out():
+            a = numpy.arange( 1000.0 )
+            buffer = numpy.empty( 1000 )
+            result = parallel.apply( numpy.multiply, [ a ], ( 2.0, ), out = buffer, size = 64 )
+
+            self.assertTrue( result is buffer, "Parallel apply out not used" )
+            self.assertTrue(
+                numpy.array_equal( buffer, a * 2.0 ),
+                "Parallel apply out incorrect"
+                )
+        out()
+
+        def single_thread():
+            parallel.set_workers( 1 )
+            a = numpy.arange( 1000.0 )
+            result = parallel.apply( numpy.negative, [ a ], size = 64 )
+
+            self.assertTrue(
+                numpy.array_equal( result, -a ),
+                "Parallel apply with a single thread incorrect"
+                )
+        single_thread()
+
+        self.assertRaises( ValueError, parallel.apply, numpy.add, [ numpy.zeros( 3 ), numpy.zeros( 4 ) ] )
+
+    def test_apply_matrix44( self ):
+        mat = matrix44.multiply(
+            matrix44.create_from_z_rotation( 0.5 ),
+            matrix44.create_from_translation( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+            )
+        vecs = numpy.random.uniform( -1.0, 1.0, (1000,3) )
+        result = parallel.apply_matrix44( mat, vecs, size = 100 )
+
+        self.assertTrue(
+            numpy.allclose( result, matrix44.apply_to_vector( mat, vecs ) ),
+            "Parallel apply_matrix44 incorrect"
+            )
+
+    def test_normalise( self ):
+        vecs = numpy.random.uniform( -1.0, 1.0, (1000,3) )
+        result = parallel.normalise( vecs, size = 100 )
+
+        self.assertTrue(
+            numpy.allclose( result, vector.normalise( vecs ) ),
+            "Parallel normalise incorrect"
+            )
+
+    def test_ray_intersect_aabb( self ):
+        aabb = numpy.array( [ [-1.0,-1.0,-1.0 ], [ 1.0, 1.0, 1.0 ] ] )
+        rays = numpy.empty( (500,2,3) )
+        rays[ :, 0 ] = numpy.random.uniform( -3.0, 3.0, (500,3) )
+        rays[ :, 1 ] = -rays[ :, 0 ] + numpy.random.uniform( -2.0, 2.0, (500,3) )
+        result = parallel.ray_intersect_aabb( rays, aabb, size = 64 )
+
+        self.assertTrue(
+            numpy.allclose( result, gt.ray_intersect_aabb( rays, aabb ), equal_nan = True ),
+            "Parallel ray_intersect_aabb incorrect"
+            )
+
+    def test_sphere_inside_planes( self ):
+        planes = numpy.array( [
+            [ 1.0, 0.0, 0.0, 1.0 ],
+            [-1.0, 0.0, 0.0, 1.0 ],
+            ] )
+        spheres = numpy.random.uniform( -3.0, 3.0, (500,4) )
+        spheres[ :, 3 ] = numpy.absolute( spheres[ :, 3 ] )
+        result = parallel.sphere_inside_planes( spheres, planes, size = 64 )
+
+        self.assertTrue(
+            numpy.array_equal( result, gt.sphere_inside_planes( spheres, planes ) ),
+            "Parallel sphere_inside_planes incorrect"
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,8 @@ import math
 
 import numpy
 
+from pyrr import matrix33
+from pyrr import matrix44
 from pyrr import quaternion
 from pyrr import vector3
 
@@ -71,6 +73,17 @@ class test_quaternion( unittest.TestCase ):
                 )
         non_identity_batch()
 
+        def out():
+            quats = numpy.random.uniform( -1.0, 1.0, (10,4) )
+            result = quaternion.normalise( quats, out = quats )
+
+            self.assertTrue( result is quats, "Quaternion normalise out not used" )
+            self.assertTrue(
+                numpy.allclose( quaternion.length( quats ), numpy.ones( 10 ) ),
+                "Quaternion normalise in place incorrect"
+                )
+        out()
+
     def test_length( self ):
         def identity():
             quat = quaternion.create_identity()
@@ -230,6 +243,329 @@ class test_quaternion( unittest.TestCase ):
                 )
         rotated_z()
 
+    def test_cross( self ):
+        def single():
+            quat1 = quaternion.create_from_x_rotation( math.pi / 2.0 )
+            quat2 = quaternion.create_from_x_rotation( math.pi / 2.0 )
+            result = quaternion.cross( quat1, quat2 )
+
+            expected = quaternion.create_from_x_rotation( math.pi )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion cross incorrect"
+                )
+        single()
+
+        def batch():
+            quats1 = numpy.random.uniform( -1.0, 1.0, (10,4) )
+            quats2 = numpy.random.uniform( -1.0, 1.0, (10,4) )
+            result = quaternion.cross( quats1, quats2 )
+
+            expected = numpy.array( [
+                quaternion.cross( q1, q2 ) for q1, q2 in zip( quats1, quats2 )
+                ] )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion batch cross incorrect"
+                )
+        batch()
+
+        def broadcast():
+            quat = quaternion.create_from_y_rotation( 0.5 )
+            quats = numpy.random.uniform( -1.0, 1.0, (10,4) )
+            result = quaternion.cross( quat, quats )
+
+            expected = numpy.array( [ quaternion.cross( quat, q ) for q in quats ] )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion broadcast cross incorrect"
+                )
+        broadcast()
+
+        def out():
+            quats1 = numpy.random.uniform( -1.0, 1.0, (10,4) )
+            quats2 = numpy.random.uniform( -1.0, 1.0, (10,4) )
+            expected = quaternion.cross( quats1, quats2 )
+
+            result = quaternion.cross( quats1, quats2, out = quats1 )
+
+            self.assertTrue( result is quats1, "Quaternion cross out not used" )
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion cross in place incorrect"
+                )
+        out()
+
+    def test_conjugate( self ):
+        quats = numpy.array( [ [ 1.0, 2.0, 3.0, 4.0 ], [-1.0,-2.0,-3.0,-4.0 ] ] )
+        result = quaternion.conjugate( quats )
+
+        expected = numpy.array( [ [-1.0,-2.0,-3.0, 4.0 ], [ 1.0, 2.0, 3.0,-4.0 ] ] )
+
+        self.assertTrue(
+            numpy.array_equal( result, expected ),
+            "Quaternion batch conjugate incorrect"
+            )
+
+    def test_inverse( self ):
+        quats = numpy.random.uniform( -1.0, 1.0, (10,4) )
+        result = quaternion.inverse( quats )
+
+        identity = quaternion.cross( quats, result )
+        expected = numpy.tile( quaternion.create_identity(), (10,1) )
+
+        self.assertTrue(
+            numpy.allclose( identity, expected ),
+            "Quaternion batch inverse incorrect"
+            )
+
+    def test_is_zero_length( self ):
+        quats = numpy.array( [ [ 0.0, 0.0, 0.0, 0.0 ], [ 0.0, 0.0, 0.0, 1.0 ] ] )
+
+        self.assertTrue( quaternion.is_zero_length( quats[ 0 ] ) )
+        self.assertTrue( quaternion.is_non_zero_length( quats[ 1 ] ) )
+        self.assertTrue(
+            numpy.array_equal( quaternion.is_zero_length( quats ), [ True, False ] ),
+            "Quaternion batch is_zero_length incorrect"
+            )
+
+    def test_apply_to_vector_batch( self ):
+        quats = numpy.array( [
+            quaternion.create_from_x_rotation( math.pi ),
+            quaternion.create_from_y_rotation( math.pi ),
+            ] )
+        vecs = numpy.array( [ vector3.unit.y, vector3.unit.x ] )
+
+        result = quaternion.apply_to_vector( quats, vecs )
+
+        self.assertTrue(
+            numpy.allclose( result, -vecs ),
+            "Quaternion batch apply_to_vector incorrect"
+            )
+
+    def test_create_from_matrix( self ):
+        def single():
+            quat = quaternion.create_from_y_rotation( 0.5 )
+            mat = matrix33.create_from_quaternion( quat )
+            result = quaternion.create_from_matrix( mat )
+
+            self.assertTrue(
+                numpy.allclose( result, quat ),
+                "Quaternion from matrix33 incorrect"
+                )
+
+            result = quaternion.create_from_matrix( matrix44.create_from_quaternion( quat ) )
+
+            self.assertTrue(
+                numpy.allclose( result, quat ),
+                "Quaternion from matrix44 incorrect"
+                )
+        single()
+
+        def batch():
+            quats = numpy.random.uniform( -1.0, 1.0, (100,4) )
+            # include rotations of PI about each axis, where W is 0.0
+            quats[ :4 ] = numpy.eye( 4 )
+            quats = quaternion.normalise( quats )
+            mats = matrix33.create_from_quaternion( quats )
+
+            result = quaternion.create_from_matrix( mats )
+
+            # q and -q are the same rotation, the result has a positive W
+            expected = quats * numpy.where( quats[ :, 3:4 ] < 0.0, -1.0, 1.0 )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion batch from matrix incorrect"
+                )
+            self.assertTrue(
+                numpy.allclose( matrix33.create_from_quaternion( result ), mats ),
+                "Quaternion batch from matrix does not match rotation"
+                )
+        batch()
+
+    def test_create_from_axis_rotation( self ):
+        def single():
+            result = quaternion.create_from_axis_rotation( [ 1.0, 0.0, 0.0 ], math.pi )
+
+            expected = quaternion.create_from_x_rotation( math.pi )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion from axis rotation incorrect"
+                )
+        single()
+
+        def batch():
+            axes = numpy.array( [ vector3.unit.x, vector3.unit.y, vector3.unit.z ] )
+            angles = numpy.array( [ 0.5, 1.0, 1.5 ] )
+            result = quaternion.create_from_axis_rotation( axes, angles )
+
+            expected = numpy.array( [
+                quaternion.create_from_x_rotation( 0.5 ),
+                quaternion.create_from_y_rotation( 1.0 ),
+                quaternion.create_from_z_rotation( 1.5 ),
+                ] )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion batch from axis rotation incorrect"
+                )
+        batch()
+
+    def test_get_rotation_axis_and_angle( self ):
+        axes = quaternion.normalise( numpy.random.uniform( -1.0, 1.0, (10,3) ) )
+        angles = numpy.random.uniform( 0.1, math.pi, 10 )
+        quats = quaternion.create_from_axis_rotation( axes, angles )
+
+        self.assertTrue(
+            numpy.allclose( quaternion.get_rotation_axis( quats ), axes ),
+            "Quaternion batch rotation axis incorrect"
+            )
+        self.assertTrue(
+            numpy.allclose( quaternion.get_rotation_angle( quats ), angles ),
+            "Quaternion batch rotation angle incorrect"
+            )
+
+        # identity has no axis, -Z is returned
+        result = quaternion.get_rotation_axis( quaternion.create_identity() )
+        self.assertTrue(
+            numpy.array_equal( result, [ 0.0, 0.0,-1.0 ] ),
+            "Quaternion identity rotation axis incorrect"
+            )
+        self.assertEqual( quaternion.get_rotation_angle( quaternion.create_identity() ), 0.0 )
+
+    def test_exp_log( self ):
+        def exp_of_pure_quaternion():
+            axis = numpy.array( [ 0.0, 1.0, 0.0 ] )
+            result = quaternion.exp( [ 0.0, 0.25, 0.0, 0.0 ] )
+
+            expected = quaternion.create_from_axis_rotation( axis, 0.5 )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion exp incorrect"
+                )
+        exp_of_pure_quaternion()
+
+        def round_trip():
+            quats = numpy.random.uniform( -1.0, 1.0, (20,4) )
+            quats[ 0 ] = quaternion.create_identity()
+            quats[ 1 ] = [ 0.0, 0.0, 0.0, 2.0 ]
+            result = quaternion.exp( quaternion.log( quats ) )
+
+            self.assertTrue(
+                numpy.allclose( result, quats ),
+                "Quaternion exp of log incorrect"
+                )
+        round_trip()
+
+        def zero_vector():
+            result = quaternion.log( numpy.tile( quaternion.create_identity(), (3,1) ) )
+
+            self.assertTrue(
+                numpy.array_equal( result, numpy.zeros( (3,4) ) ),
+                "Quaternion log of identity incorrect"
+                )
+        zero_vector()
+
+    def test_power( self ):
+        def single():
+            quat = quaternion.create_from_x_rotation( 0.5 )
+            result = quaternion.power( quat, 3.0 )
+
+            expected = quaternion.create_from_x_rotation( 1.5 )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion power incorrect"
+                )
+        single()
+
+        def batch():
+            quats = numpy.array( [
+                quaternion.create_identity(),
+                quaternion.create_from_y_rotation( 0.5 ),
+                quaternion.create_from_z_rotation( 1.0 ),
+                ] )
+            exponents = numpy.array( [ 2.0, 0.5, -1.0 ] )
+            result = quaternion.power( quats, exponents )
+
+            expected = numpy.array( [
+                quaternion.create_identity(),
+                quaternion.create_from_y_rotation( 0.25 ),
+                quaternion.create_from_z_rotation( -1.0 ),
+                ] )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion batch power incorrect"
+                )
+        batch()
+
+        def full_rotation():
+            # a rotation of 2 pi, which has no vector
+            quat = numpy.array( [ 0.0, 0.0, 0.0, -1.0 ] )
+            self.assertTrue(
+                numpy.allclose( quaternion.power( quat, 1.0 ), quat ),
+                "Quaternion power of full rotation incorrect"
+                )
+            self.assertTrue(
+                numpy.allclose( quaternion.power( quat, 0.5 ), quaternion.create_from_x_rotation( math.pi ) ),
+                "Quaternion half power of full rotation incorrect"
+                )
+
+            # close to a rotation of 2 pi
+            quat = quaternion.create_from_y_rotation( 2.0 * math.pi - 1.0e-13 )
+            self.assertTrue(
+                numpy.allclose( quaternion.power( quat, 1.0 ), quat ),
+                "Quaternion power near full rotation incorrect"
+                )
+        full_rotation()
+
+    def test_slerp( self ):
+        def single():
+            quat1 = quaternion.create_from_x_rotation( 0.0 )
+            quat2 = quaternion.create_from_x_rotation( 1.0 )
+            result = quaternion.slerp( quat1, quat2, 0.25 )
+
+            expected = quaternion.create_from_x_rotation( 0.25 )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion slerp incorrect"
+                )
+        single()
+
+        def batch():
+            quats1 = numpy.array( [
+                quaternion.create_from_y_rotation( 0.0 ),
+                quaternion.create_from_z_rotation( 0.5 ),
+                quaternion.create_from_x_rotation( 1.0 ),
+                ] )
+            quats2 = numpy.array( [
+                quaternion.create_from_y_rotation( 2.0 ),
+                # the same rotation, but in the opposite hemisphere
+                -quaternion.create_from_z_rotation( 1.5 ),
+                quaternion.create_from_x_rotation( 1.0 ),
+                ] )
+            deltas = numpy.array( [ 0.5, 0.5, 0.3 ] )
+            result = quaternion.slerp( quats1, quats2, deltas )
+
+            expected = numpy.array( [
+                quaternion.create_from_y_rotation( 1.0 ),
+                quaternion.create_from_z_rotation( 1.0 ),
+                quaternion.create_from_x_rotation( 1.0 ),
+                ] )
+
+            self.assertTrue(
+                numpy.allclose( result, expected ),
+                "Quaternion batch slerp incorrect"
+                )
+        batch()
 
 if __name__ == '__main__':
     unittest.main()
@@ -182,6 +182,46 @@ class test_rectangle( unittest.TestCase ):
 
             
     
+
+    def test_stacks( self ):
+        rects = rectangle.create_from_position(
+            [ 0.0, 10.0, 5.0 ],
+            [ 0.0, 0.0, 5.0 ],
+            [ 2.0, -4.0, 1.0 ],
+            [ 3.0, 3.0, -2.0 ]
+            )
+        self.assertEqual( rects.shape, (3,2,2) )
+
+        def bounds():
+            xmin, xmax, ymin, ymax = rectangle.bounds( rects )
+            self.assertTrue( numpy.array_equal( xmin, [ 0.0, 6.0, 5.0 ] ), "Rectangle stack bounds incorrect" )
+            self.assertTrue( numpy.array_equal( xmax, [ 2.0, 10.0, 6.0 ] ), "Rectangle stack bounds incorrect" )
+            self.assertTrue( numpy.array_equal( ymin, [ 0.0, 0.0, 3.0 ] ), "Rectangle stack bounds incorrect" )
+            self.assertTrue( numpy.array_equal( ymax, [ 3.0, 3.0, 5.0 ] ), "Rectangle stack bounds incorrect" )
+
+            self.assertTrue( numpy.array_equal( rectangle.left( rects ), xmin ) )
+            self.assertTrue( numpy.array_equal( rectangle.top( rects ), ymax ) )
+            self.assertTrue( numpy.array_equal( rectangle.abs_width( rects ), [ 2.0, 4.0, 1.0 ] ) )
+        bounds()
+
+        def normalise():
+            result = rectangle.normalise( rects )
+            expected = rectangle.create_from_bounds( *rectangle.bounds( rects ) )
+            self.assertTrue( numpy.array_equal( result, expected ), "Rectangle normalise incorrect" )
+            self.assertTrue( numpy.all( rectangle.size( result ) >= 0.0 ) )
+        normalise()
+
+        def scale():
+            result = rectangle.scale_by_vector( rects, [ 2.0, 3.0 ] )
+            self.assertTrue( numpy.array_equal( result, rects * [ 2.0, 3.0 ] ), "Rectangle stack scale incorrect" )
+
+            scales = numpy.array( [ [ 1.0, 1.0 ], [ 2.0, 2.0 ], [ 3.0, 3.0 ] ] )
+            result = rectangle.scale_by_vector( rects, scales )
+            self.assertTrue( numpy.array_equal( result[ 2 ], rects[ 2 ] * 3.0 ), "Rectangle stack scale incorrect" )
+
+            self.assertRaises( ValueError, rectangle.scale_by_vector, rects, [ 1.0, 2.0, 3.0 ] )
+        scale()
+
 if __name__ == '__main__':
     unittest.main()
 
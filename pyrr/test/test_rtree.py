@@ -0,0 +1,112 @@
+import unittest
+
+import numpy
+
+from pyrr import rtree
+from pyrr import rectangle
+from pyrr import geometric_tests as gt
+
+
+class test_rtree( unittest.TestCase ):
+
+    def setUp( self ):
+        random = numpy.random.RandomState( 0 )
+        count = 2000
+        self.rects = rectangle.create_from_position(
+            random.uniform( 0.0, 100.0, count ),
+            random.uniform( 0.0, 100.0, count ),
+            random.uniform( -3.0, 3.0, count ),
+            random.uniform( -3.0, 3.0, count )
+            )
+        self.points = random.uniform( 0.0, 100.0, (50, 2) )
+
+    def tearDown( self ):
+        pass
+
+    def brute_force( self, rects, query, test ):
+        # the ids found by testing every rectangle
+        return [ numpy.flatnonzero( test( q, rects ) ) for q in query ]
+
+    def assertResults( self, results, expected, msg ):
+        query, ids = results
+        for index, found in enumerate( expected ):
+            self.assertTrue( numpy.array_equal( ids[ query == index ], found ), msg )
+
+    def test_create( self ):
+        tree = rtree.RTree( self.rects )
+        self.assertEqual( len( tree ), len( self.rects ) )
+        self.assertEqual( tree.depth, 3 )
+
+        empty = rtree.RTree()
+        self.assertEqual( len( empty ), 0 )
+        self.assertEqual( len( empty.query_point( [ 0.0, 0.0 ] ) ), 0 )
+
+        self.assertRaises( ValueError, rtree.RTree, self.rects, 1 )
+
+    def test_query_point( self ):
+        tree = rtree.RTree( self.rects )
+        expected = self.brute_force( self.rects, self.points, gt.point_inside_rectangle )
+
+        self.assertResults( tree.query_point( self.points ), expected, "Point query incorrect" )
+        self.assertTrue( numpy.array_equal( tree.query_point( self.points[ 0 ] ), expected[ 0 ] ), "Point query incorrect" )
+
+    def test_query_rectangle( self ):
+        tree = rtree.RTree( self.rects )
+        query = self.rects[ :50 ]
+        expected = self.brute_force( self.rects, query, gt.rectangle_intersect_rectangle )
+
+        self.assertResults( tree.query_rectangle( query ), expected, "Rectangle query incorrect" )
+        self.assertTrue( numpy.array_equal( tree.query_rectangle( query[ 0 ] ), expected[ 0 ] ), "Rectangle query incorrect" )
+
+    def test_query_radius( self ):
+        tree = rtree.RTree( self.rects )
+        xmin, xmax, ymin, ymax = rectangle.bounds( self.rects )
+
+        def within( point, rects ):
+            dx = numpy.maximum( numpy.maximum( xmin - point[ 0 ], point[ 0 ] - xmax ), 0.0 )
+            dy = numpy.maximum( numpy.maximum( ymin - point[ 1 ], point[ 1 ] - ymax ), 0.0 )
+            return dx * dx + dy * dy <= 4.0
+        expected = self.brute_force( self.rects, self.points, within )
+
+        self.assertResults( tree.query_radius( self.points, 2.0 ), expected, "Radius query incorrect" )
+
+        # a radius of zero finds the rectangles containing the point
+        result = tree.query_radius( self.points[ 0 ], 0.0 )
+        self.assertTrue( numpy.array_equal( result, tree.query_point( self.points[ 0 ] ) ), "Radius query incorrect" )
+
+    def test_update( self ):
+        tree = rtree.RTree( self.rects )
+        rects = self.rects.copy()
+
+        def move():
+            rects[ :500, 0 ] += 20.0
+            tree.update( numpy.arange( 500 ), rects[ :500 ] )
+            expected = self.brute_force( rects, self.points, gt.point_inside_rectangle )
+            self.assertResults( tree.query_point( self.points ), expected, "Update incorrect" )
+        move()
+
+        def insert():
+            ids = tree.insert( self.rects[ :10 ] )
+            self.assertTrue( numpy.array_equal( ids, numpy.arange( 2000, 2010 ) ), "Inserted ids incorrect" )
+            self.assertEqual( len( tree ), 2010 )
+
+            combined = numpy.concatenate( [ rects, self.rects[ :10 ] ] )
+            expected = self.brute_force( combined, self.points, gt.point_inside_rectangle )
+            self.assertResults( tree.query_point( self.points ), expected, "Insert incorrect" )
+
+            tree.rebuild()
+            self.assertResults( tree.query_point( self.points ), expected, "Rebuild incorrect" )
+        insert()
+
+        def remove():
+            tree.remove( numpy.arange( 0, 2010, 2 ) )
+            self.assertEqual( len( tree ), 1005 )
+
+            query, ids = tree.query_point( self.points )
+            self.assertTrue( numpy.all( ids % 2 == 1 ), "Removed rectangles found" )
+            self.assertRaises( ValueError, tree.update, 0, self.rects[ 0 ] )
+        remove()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -39,6 +39,103 @@ class test_sphere( unittest.TestCase ):
             "Sphere not calculated correctly"
             )
 
+    def test_create_bounding( self ):
+        # the corners of a cube away from the origin
+        corners = numpy.array( [ [ x, y, z ] for x in ( 4.0, 6.0 ) for y in ( 4.0, 6.0 ) for z in ( 4.0, 6.0 ) ] )
+        expected = numpy.array( [ 5.0, 5.0, 5.0, math.sqrt( 3.0 ) ] )
+        for exact in ( False, True ):
+            result = sphere.create_bounding( corners, exact )
+            self.assertTrue( numpy.allclose( result, expected ), "Bounding sphere incorrect" )
+
+        # points on an equilateral triangle, the smallest sphere is its circumcircle
+        triangle = numpy.array( [ [ 1.0, 0.0, 0.0 ], [ -0.5, math.sqrt( 0.75 ), 0.0 ], [ -0.5, -math.sqrt( 0.75 ), 0.0 ] ] )
+        result = sphere.create_bounding( triangle, exact = True )
+        self.assertTrue( numpy.allclose( result, [ 0.0, 0.0, 0.0, 1.0 ] ), "Exact bounding sphere incorrect" )
+
+        random = numpy.random.RandomState( 0 )
+        points = random.normal( size = (300, 3) ) * [ 1.0, 2.0, 3.0 ] + 10.0
+        ritter = sphere.create_bounding( points )
+        exact = sphere.create_bounding( points, exact = True )
+        for result in ( ritter, exact ):
+            distances = vector.length( points - result[ :3 ] )
+            self.assertTrue( numpy.all( distances <= result[ 3 ] * (1.0 + 1e-9) ), "Points outside bounding sphere" )
+        self.assertTrue( exact[ 3 ] <= ritter[ 3 ], "Exact bounding sphere is not the smallest" )
+
+        # the exact sphere touches at least 2 points
+        distances = vector.length( points - exact[ :3 ] )
+        self.assertTrue( numpy.count_nonzero( numpy.isclose( distances, exact[ 3 ] ) ) >= 2, "Exact bounding sphere not tight" )
+
+    def test_create_bounding_from_segments( self ):
+        random = numpy.random.RandomState( 1 )
+        points = random.normal( size = (100, 3) )
+        offsets = numpy.array( [ 0, 10, 11, 60 ] )
+        for exact in ( False, True ):
+            result = sphere.create_bounding_from_segments( points, offsets, exact )
+            self.assertEqual( result.shape, (4, 4) )
+            for index, segment in enumerate( numpy.split( points, offsets[ 1: ] ) ):
+                expected = sphere.create_bounding( segment, exact )
+                self.assertTrue( numpy.allclose( result[ index ], expected ), "Segmented bounding sphere incorrect" )
+
+            # a single point
+            self.assertTrue( numpy.allclose( result[ 1 ], numpy.append( points[ 10 ], 0.0 ) ) )
+
+        self.assertRaises( ValueError, sphere.create_bounding_from_segments, points, [ 0, 10, 10 ] )
+        self.assertRaises( ValueError, sphere.create_bounding_from_segments, points, [ 5 ] )
+
+    def test_merge( self ):
+        s = numpy.array( [ 0.0, 0.0, 0.0, 1.0 ] )
+        spheres = numpy.array( [
+            [ 3.0, 0.0, 0.0, 1.0 ],
+            # inside the first sphere
+            [ 0.5, 0.0, 0.0, 0.2 ],
+            # contains the first sphere
+            [ 0.0, 1.0, 0.0, 5.0 ],
+            ] )
+        result = sphere.merge( s, spheres )
+        expected = numpy.array( [
+            [ 1.5, 0.0, 0.0, 2.5 ],
+            [ 0.0, 0.0, 0.0, 1.0 ],
+            [ 0.0, 1.0, 0.0, 5.0 ],
+            ] )
+        self.assertTrue( numpy.allclose( result, expected ), "Sphere merge incorrect" )
+        self.assertTrue( numpy.allclose( sphere.merge( s, s ), s ), "Sphere merge with itself incorrect" )
+
+    def test_create_from_segments( self ):
+        random = numpy.random.RandomState( 0 )
+        points = random.normal( size = (50, 3) )
+        offsets = numpy.array( [ 0, 20, 21, 35 ] )
+
+        result = sphere.create_from_segments( points, offsets )
+        self.assertEqual( result.shape, (4, 4) )
+        for index, segment in enumerate( numpy.split( points, offsets[ 1: ] ) ):
+            self.assertTrue(
+                numpy.allclose( result[ index ], sphere.create_from_points( segment ) ),
+                "Create from segments failed"
+                )
+
+        ids = numpy.repeat( numpy.arange( 4 ), numpy.diff( numpy.append( offsets, 50 ) ) )
+        order = random.permutation( 50 )
+        shuffled = sphere.create_from_segment_ids( points[ order ], ids[ order ] )
+        self.assertTrue( numpy.allclose( shuffled, result ), "Create from segment ids failed" )
+
+        # the exact spheres do not depend on the order of the points
+        bounding = sphere.create_bounding_from_segment_ids( points[ order ], ids[ order ], count = 5, exact = True )
+        self.assertTrue(
+            numpy.allclose( bounding[ :4 ], sphere.create_bounding_from_segments( points, offsets, exact = True ) ),
+            "Create bounding from segment ids failed"
+            )
+        self.assertTrue( numpy.all( numpy.isnan( bounding[ 4 ] ) ), "Empty segments not NaN" )
+
+        # no points at all
+        empty = numpy.zeros( (0, 3) )
+        for result in (
+            sphere.create_from_segment_ids( empty, [], count = 2 ),
+            sphere.create_bounding_from_segment_ids( empty, [], count = 2 ),
+            sphere.create_bounding_from_segment_ids( empty, [], count = 2, exact = True ),
+            ):
+            self.assertEqual( result.shape, (2, 4) )
+            self.assertTrue( numpy.all( numpy.isnan( result ) ), "Empty segments not NaN" )
+        self.assertEqual( sphere.create_from_segment_ids( empty, [] ).shape, (0, 4) )
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+import numpy
+
+from pyrr import aabb
+from pyrr import matrix44
+from pyrr import sphere
+from pyrr import stream
+
+
+class test_stream( unittest.TestCase ):
+
+    def setUp( self ):
+        self.directory = tempfile.mkdtemp()
+        self.points = numpy.random.uniform( -10.0, 10.0, (1000,3) )
+
+    def tearDown( self ):
+        shutil.rmtree( self.directory )
+
+    def test_chunks( self ):
+        def array():
+            result = list( stream.chunks( self.points, 300 ) )
+
+            self.assertEqual( [ len( chunk ) for chunk in result ], [ 300, 300, 300, 100 ] )
+            self.assertTrue(
+                numpy.array_equal( numpy.concatenate( result ), self.points ),
+                "Chunks of array incorrect"
+                )
+        array()
+
+        def iterable():
+            source = [ self.points[ :10 ].tolist(), self.points[ 10: ] ]
+            result = list( stream.chunks( source ) )
+
+            self.assertEqual( len( result ), 2 )
+            self.assertTrue(
+                numpy.array_equal( numpy.concatenate( result ), self.points ),
+                "Chunks of iterable incorrect"
+                )
+        iterable()
+
+    def test_apply_matrix44( self ):
+        mat = matrix44.multiply(
+            matrix44.create_from_y_rotation( 0.5 ),
+            matrix44.create_from_translation( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+            )
+        result = numpy.concatenate( list( stream.apply_matrix44( self.points, mat, 128 ) ) )
+
+        expected = numpy.array( [ matrix44.apply_to_vector( mat, point ) for point in self.points ] )
+
+        self.assertTrue(
+            numpy.allclose( result, expected ),
+            "Stream apply_matrix44 incorrect"
+            )
+
+    def test_write( self ):
+        path = os.path.join( self.directory, 'points.npy' )
+        numpy.save( path, self.points )
+        source = numpy.load( path, mmap_mode = 'r' )
+        out = numpy.lib.format.open_memmap(
+            os.path.join( self.directory, 'out.npy' ),
+            mode = 'w+',
+            dtype = source.dtype,
+            shape = source.shape
+            )
+        mat = matrix44.create_from_translation( numpy.array( [ 1.0, 2.0, 3.0 ] ) )
+
+        bb = stream.create_aabb_from_points(
+            stream.write( stream.apply_matrix44( source, mat, 100 ), out )
+            )
+
+        expected = self.points + [ 1.0, 2.0, 3.0 ]
+
+        self.assertTrue(
+            numpy.allclose( numpy.load( os.path.join( self.directory, 'out.npy' ) ), expected ),
+            "Stream write incorrect"
+            )
+        self.assertTrue(
+            numpy.allclose( bb, aabb.create_from_points( expected ) ),
+            "Stream AABB of written points incorrect"
+            )
+
+        too_small = numpy.empty( (10,3) )
+        self.assertRaises( ValueError, stream.consume, stream.write( self.points, too_small ) )
+
+    def test_consume( self ):
+        self.assertEqual( stream.consume( self.points, 300 ), len( self.points ) )
+
+    def test_create_aabb_from_points( self ):
+        result = stream.create_aabb_from_points( self.points, 64 )
+
+        self.assertTrue(
+            numpy.array_equal( result, aabb.create_from_points( self.points ) ),
+            "Stream AABB incorrect"
+            )
+        self.assertRaises( ValueError, stream.create_aabb_from_points, [] )
+
+    def test_create_sphere_from_points( self ):
+        result = stream.create_sphere_from_points( self.points, 64 )
+
+        expected = numpy.array( [ 0.0, 0.0, 0.0, numpy.sqrt( numpy.amax( numpy.sum( self.points ** 2, axis = -1 ) ) ) ] )
+
+        self.assertTrue(
+            numpy.allclose( result, expected ),
+            "Stream sphere incorrect"
+            )
+        self.assertRaises( ValueError, stream.create_sphere_from_points, [] )
+
+
+if __name__ == '__main__':
+    unittest.main()
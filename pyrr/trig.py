@@ -2,7 +2,10 @@
 """
 import math
 
+from pyrr import cache
 
+
+@cache.cacheable
 def calculate_fov( zoom, height = 1.0 ):
     """Calculates the required FOV to set the
     view frustrum to have a view with the specified height
@@ -18,6 +21,7 @@ def calculate_fov( zoom, height = 1.0 ):
     rad_theta = 2.0 * math.atan2( height / 2.0, zoom )
     return math.degrees( rad_theta )
 
+@cache.cacheable
 def calculate_zoom( fov, height = 1.0 ):
     """Calculates the zoom (distance) from the camera
     with the specified FOV and height of image.
@@ -32,6 +36,7 @@ def calculate_zoom( fov, height = 1.0 ):
     """
     return height / math.tan( fov / 2.0 )
 
+@cache.cacheable
 def calculate_height( fov, zoom ):
     """Performs the opposite of calculate_fov.
     Used to find the current height at a specific distance.
@@ -45,6 +50,7 @@ def calculate_height( fov, zoom ):
     height = zoom * ( math.tan( fov / 2.0 ) )
     return height
 
+@cache.cacheable
 def calculate_plane_size( aspect_ratio, fov, distance ):
     """Calculates the width and height of a plane at the
     specified distance using the FOV of the frustrum
@@ -7,6 +7,27 @@ from functools import wraps
 import numpy
 
 
+#: Functions which accept stacks of items, registered by batchable.
+#: Each value is the number of dimensions of a single item for each
+#: positional argument, and a description of how to batch the calls.
+batchable_functions = {}
+
+
+def batchable( dimensions, suggestion ):
+    """Registers a function which accepts stacks of items.
+
+    Instrumentation uses this to find code which calls the function
+    many times with a single item. The function is not changed.
+
+    :param tuple dimensions: The number of dimensions of a single item
+        for each positional argument.
+    :param str suggestion: A description of how to batch the calls.
+    """
+    def decorator( fn ):
+        batchable_functions[ '%s.%s' % (fn.__module__, fn.__name__) ] = ( dimensions, suggestion )
+        return fn
+    return decorator
+
 def all_parameters_as_numpy_arrays( fn ):
     """Converts all of a function's arguments to numpy arrays.
 
@@ -67,3 +88,67 @@ def parameters_as_numpy_arrays( *args_to_convert ):
             return fn( *np_args, **np_kwargs )
         return wrapper
     return decorator
+
+def segment_ids_from_offsets( offsets, count ):
+    """Converts the offsets of segments into the segment of each item.
+
+    Segments are consecutive groups of items in an array, such as the
+    points of each object in a concatenated vertex array.
+    The offsets are the index of the first item of each segment,
+    as used by numpy.add.reduceat.
+
+    :param numpy.array offsets: The index of the first item of each segment.
+    :param int count: The total number of items.
+    :raise ValueError: raised if the offsets do not start at 0 and
+        increase, as every segment must contain at least one item.
+    :rtype: tuple
+    :return: The offsets as an array and the segment of each item.
+    """
+    offsets = numpy.asarray( offsets, dtype = 'intp' )
+    sizes = numpy.diff( numpy.append( offsets, count ) )
+    if len( offsets ) == 0 or offsets[ 0 ] != 0 or numpy.any( sizes <= 0 ):
+        raise ValueError( "Offsets must start at 0 and every segment must contain an item" )
+    return offsets, numpy.repeat( numpy.arange( len( offsets ) ), sizes )
+
+def reduce_segment_ids( fn, items, segment_ids, count = None ):
+    """Applies a segmented reduction to items labelled by segment ids.
+
+    The items are sorted by segment and passed to fn with the offset
+    of each segment which contains an item. Segments which contain no
+    items are NaN in the result.
+
+    :param function fn: A function accepting items and offsets, such as
+        aabb.create_from_segments.
+    :param numpy.array items: The items to reduce.
+    :param numpy.array segment_ids: The segment of each item.
+    :param int count: The number of segments. Defaults to the largest
+        segment id plus 1.
+    :rtype: numpy.array
+    :return: The result of fn for each segment.
+    """
+    items = numpy.asarray( items )
+    segment_ids = numpy.asarray( segment_ids, dtype = 'intp' )
+    if count is None:
+        count = int( segment_ids.max() ) + 1 if len( segment_ids ) else 0
+
+    order = numpy.argsort( segment_ids, kind = 'stable' )
+    ids = segment_ids[ order ]
+    present, offsets = numpy.unique( ids, return_index = True )
+    if len( present ) and (present[ 0 ] < 0 or present[ -1 ] >= count):
+        raise ValueError( "Segment ids must be between 0 and the number of segments" )
+
+    if len( present ) == 0:
+        # fn requires at least one segment, so find the shape of
+        # its result from a single segment of a single item
+        items = numpy.zeros( (1,) + items.shape[ 1: ], dtype = items.dtype )
+        reduced = numpy.asarray( fn( items, numpy.zeros( 1, dtype = 'intp' ) ) )
+        dtype = numpy.result_type( reduced, numpy.float32 )
+        return numpy.full( (count,) + reduced.shape[ 1: ], numpy.nan, dtype = dtype )
+
+    # keep the floating dtype of the reduced items, promoting integers
+    # to floats so that empty segments can be NaN
+    reduced = numpy.asarray( fn( items[ order ], offsets ) )
+    dtype = numpy.result_type( reduced, numpy.float32 )
+    result = numpy.full( (count,) + reduced.shape[ 1: ], numpy.nan, dtype = dtype )
+    result[ present ] = reduced
+    return result
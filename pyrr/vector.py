@@ -4,9 +4,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import numpy
-from pyrr.utils import all_parameters_as_numpy_arrays, parameters_as_numpy_arrays
+from pyrr.utils import all_parameters_as_numpy_arrays, batchable, parameters_as_numpy_arrays
 
 
+@batchable( (1,), 'pass (N,D) vectors or use parallel.normalise' )
 @all_parameters_as_numpy_arrays
 def normalise( vec ):
     """Normalises an Nd list of vectors or a single vector
@@ -32,17 +33,12 @@ def normalise( vec ):
     # calculate the length
     # this is a duplicate of length(vec) because we
     # always want an array, even a 0-d array.
-    lengths = numpy.apply_along_axis(
-        numpy.linalg.norm,
-        vec.ndim - 1,
-        vec
-        )
+    lengths = numpy.sqrt( numpy.sum( vec ** 2, axis = -1 ) )
 
-    # repeat the value for each value of the vector
-    lengths = lengths.repeat( vec.shape[-1] ).reshape( vec.shape )
-
-    return vec / lengths
+    # broadcast the length across each value of the vector
+    return vec / lengths[ ..., numpy.newaxis ]
 
+@batchable( (1,), 'pass (N,D) vectors' )
 def squared_length( vec ):
     """Calculates the squared length of a vector.
 
@@ -58,6 +54,7 @@ def squared_length( vec ):
 
     return lengths
 
+@batchable( (1,), 'pass (N,D) vectors' )
 @all_parameters_as_numpy_arrays
 def length( vec ):
     """Returns the length of an Nd list of vectors
@@ -81,11 +78,7 @@ def length( vec ):
         Otherwise the result will be an array of scalars with shape
         vec.ndim with the last dimension being size 1.
     """
-    lengths = numpy.apply_along_axis(
-        numpy.linalg.norm,
-        vec.ndim - 1,
-        vec
-        )
+    lengths = numpy.sqrt( numpy.sum( vec ** 2, axis = -1 ) )
 
     # a single vector will return a 0-d array
     # which doesn't act like a normal np array
@@ -127,6 +120,7 @@ def set_length( vec, len ):
 
     return vec / (lengths * (1.0 / len) )
 
+@batchable( (1, 1), 'pass (N,D) vectors' )
 def dot( v1, v2 ):
     """Calculates the dot product of two vectors.
 
@@ -140,6 +134,7 @@ def dot( v1, v2 ):
     """
     return numpy.sum( v1 * v2, axis = -1 )
 
+@batchable( (1, 1), 'pass (N,3) vectors' )
 def cross( v1, v2 ):
     """Calculates the cross-product of two vectors.
 
@@ -151,6 +146,7 @@ def cross( v1, v2 ):
     """
     return numpy.cross( v1, v2 )
 
+@batchable( (1, 1, 0), 'pass (N,D) vectors' )
 def interpolate( v1, v2, delta ):
     """Interpolates between 2 arrays of vectors (shape = N,3)
     by the specified delta (0.0 <= delta <= 1.0).